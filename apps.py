@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class AccountConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'account'
+    
+    def ready(self):
+        # signal receiver 등록
+        from account import signals  # noqa: F401
+        
+        # 참조 테이블(AccountTypes, SocialSignUpType) 프로세스 캐시는 첫 DB 커넥션에서 로드 (ready() 에서는 DB 에 접근하지 않음)
+        # UserConst / enum 불일치만 기동 시 체크
+        from account.reference_data import reference_data
+        reference_data.validate_const()
@@ -0,0 +1,120 @@
+import logging
+import time
+
+from datetime               import timedelta
+from typing                 import List
+
+from django.conf            import settings
+from django.db              import connection, transaction, OperationalError
+from django.utils           import timezone
+
+from account.const          import UserArchiveConst
+from account.models         import User, UserArchive
+
+logger = logging.getLogger(__name__)
+
+
+class UserArchiver:
+    """ 탈퇴 후 보관 기간이 지난 유저를 users -> users_archive 로 이동
+        - 배치 1개 = 트랜잭션 1개: SELECT ... FOR UPDATE SKIP LOCKED -> archive bulk INSERT -> users DELETE
+          (로그인 등 다른 요청이 잡은 row 는 건너뛰고 다음 실행에서 처리)
+        - batch_size / batch_sleep 으로 트랜잭션 길이와 부하를 조절
+        - PostgreSQL 은 lock_timeout 을 걸어 lock 대기가 길어지면 해당 배치를 포기
+        - 이동 후 같은 이메일로 재가입 가능
+    """
+    
+    ARCHIVE_FIELDS = (
+        'id',
+        'email',
+        'password',
+        'login_count',
+        'last_login_date',
+        'email_verified_at',
+        'account_type_id',
+        'social_signup_type_id',
+        'created_at',
+        'updated_at',
+        'deleted_at',
+    )
+    
+    def __init__(self, retention_days: int=None, batch_size: int=None, batch_sleep: float=None):
+        self.retention_days = retention_days if retention_days is not None else getattr(settings, 'ACCOUNT_ARCHIVE_RETENTION_DAYS', UserArchiveConst.RETENTION_DAYS)
+        self.batch_size     = batch_size or getattr(settings, 'ACCOUNT_ARCHIVE_BATCH_SIZE', UserArchiveConst.BATCH_SIZE)
+        self.batch_sleep    = batch_sleep if batch_sleep is not None else getattr(settings, 'ACCOUNT_ARCHIVE_BATCH_SLEEP', UserArchiveConst.BATCH_SLEEP)
+        self.lock_timeout   = getattr(settings, 'ACCOUNT_ARCHIVE_LOCK_TIMEOUT_MS', UserArchiveConst.LOCK_TIMEOUT_MS)
+        
+        # metrics
+        self.batch_count        = 0
+        self.archived_count     = 0
+        self.lock_timeout_count = 0
+        self.max_batch_latency  = 0.0
+    
+    def metrics(self) -> dict:
+        return {
+            'batch_count'       : self.batch_count,
+            'archived_count'    : self.archived_count,
+            'lock_timeout_count': self.lock_timeout_count,
+            'max_batch_latency' : round(self.max_batch_latency, 3),
+        }
+    
+    @property
+    def cutoff(self):
+        return timezone.now() - timedelta(days=self.retention_days)
+    
+    def count_candidates(self) -> int:
+        return User.all_objects.filter(is_deleted=True, deleted_at__lt=self.cutoff).count()
+    
+    def archive_batch(self) -> int:
+        """ 배치 1개 이동. 이동한 유저 수 리턴 (lock_timeout 시 0) """
+        start = time.perf_counter()
+        
+        try:
+            with transaction.atomic():
+                if connection.vendor == 'postgresql':
+                    with connection.cursor() as cursor:
+                        cursor.execute(f'SET LOCAL lock_timeout = {int(self.lock_timeout)}')
+                
+                rows = list(
+                    User.all_objects.select_for_update(skip_locked=True)
+                                    .filter(is_deleted=True, deleted_at__lt=self.cutoff)
+                                    .order_by('deleted_at')
+                                    .values(*self.ARCHIVE_FIELDS)[:self.batch_size]
+                )
+                if not rows:
+                    return 0
+                
+                self.move(rows)
+                
+        except OperationalError:
+            # lock_timeout. 다음 배치 / 다음 실행에서 재시도
+            logger.warning('user archive batch lock timeout. batch_size=%s', self.batch_size)
+            self.lock_timeout_count += 1
+            return 0
+        
+        latency = time.perf_counter() - start
+        
+        self.batch_count       += 1
+        self.archived_count    += len(rows)
+        self.max_batch_latency  = max(self.max_batch_latency, latency)
+        
+        return len(rows)
+    
+    def move(self, rows: List[dict]) -> None:
+        """ archive bulk INSERT 후 users DELETE (인증 토큰은 cascade 로 함께 삭제) """
+        archived_at = timezone.now()
+        
+        # 재실행 시 이미 옮겨진 id 는 무시
+        UserArchive.objects.bulk_create([UserArchive(archived_at=archived_at, **row) for row in rows], ignore_conflicts=True)
+        User.all_objects.filter(pk__in=[row['id'] for row in rows]).delete()
+    
+    def run(self, max_batches: int=None) -> None:
+        """ 대상이 없거나 (lock_timeout 포함) max_batches 에 도달할 때까지 배치 반복 """
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            moved    = self.archive_batch()
+            batches += 1
+            
+            if moved < self.batch_size:
+                return
+            if self.batch_sleep:
+                time.sleep(self.batch_sleep)
@@ -0,0 +1,40 @@
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions     import AuthenticationFailed
+
+from account.exceptions            import TokenInvalidException
+from account.tokens                import token_manager
+
+
+class TokenUser:
+    """ JWT claim 기반 인증 유저. 인증 과정에서 DB 를 조회하지 않음 (필요 시 id 로 직접 조회) """
+    
+    is_authenticated = True
+    is_anonymous     = False
+    
+    def __init__(self, claims: dict):
+        self.id     = int(claims['sub'])
+        self.pk     = self.id
+        self.claims = claims
+
+
+class JWTAuthentication(BaseAuthentication):
+    """ Authorization: Bearer <access_token>
+        - settings.REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'] 또는 뷰의 authentication_classes 에 추가하여 사용
+    """
+    keyword = 'Bearer'
+    
+    def authenticate(self, request):
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        
+        if not header.startswith(f'{self.keyword} '):
+            return None
+        
+        try:
+            claims = token_manager.verify(header[len(self.keyword) + 1:].strip())
+        except TokenInvalidException as e:
+            raise AuthenticationFailed(str(e))
+        
+        return TokenUser(claims), claims
+    
+    def authenticate_header(self, request):
+        return self.keyword
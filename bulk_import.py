@@ -0,0 +1,223 @@
+import csv
+import itertools
+import json
+import time
+
+from typing                           import Iterable, Iterator, List, Tuple
+
+from django.core.exceptions           import ValidationError
+from django.core.validators           import validate_email
+from django.db                        import transaction, IntegrityError
+
+from account.cache.email_bloom_filter import email_bloom_filter
+from account.const                    import UserImportConst
+from account.enums                    import AccountTypeEnum, SocialSignUpTypeEnum
+from account.exceptions               import UserImportTooLargeException
+from account.models                   import User
+from account.passwords                import password_manager
+from account.utils                    import normalize_email
+
+
+class UserImportResult:
+    """ 대량 가입 결과 """
+    
+    def __init__(self):
+        self.total       = 0
+        self.created     = 0
+        self.error_count = 0
+        self.errors      = list()  # [{'line': int, 'email': str, 'error': str}, ...] (MAX_ERROR_REPORTS 까지)
+        self.elapsed     = 0.0
+    
+    @property
+    def rows_per_sec(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+    
+    def add_error(self, line: int, email: str, error: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < UserImportConst.MAX_ERROR_REPORTS:
+            self.errors.append({'line': line, 'email': email, 'error': error})
+    
+    def to_dict(self) -> dict:
+        return {
+            'total'       : self.total,
+            'created'     : self.created,
+            'error_count' : self.error_count,
+            'errors'      : self.errors,
+            'elapsed'     : round(self.elapsed, 3),
+            'rows_per_sec': round(self.rows_per_sec, 1),
+        }
+
+
+class UserBulkImporter:
+    """ 파트너 플랫폼 유저 대량 가입 (컨슈머)
+        - 입력: NDJSON 또는 CSV (header: email, password, social_signup_type)
+        - chunk 단위로 email__in 1회 조회로 중복 체크 후 bulk_create (chunk 별 트랜잭션)
+        - 잘못된 row 는 에러로 기록하고 나머지 row 는 계속 처리
+        - 비밀번호는 password_manager 설정대로 해시하여 저장 (처리량은 해시 cost 에 비례해 감소)
+          - 중복 체크를 통과한 row 만 chunk 단위로 password_manager.hash_many (스레드 풀 병렬)
+        - max_rows: row 수가 넘으면 저장 전에 UserImportTooLargeException (HTTP 엔드포인트용)
+    """
+    
+    SOCIAL_SIGNUP_TYPES = {signup_type.value for signup_type in SocialSignUpTypeEnum}
+    EMAIL_MAX_LENGTH    = User._meta.get_field('email').max_length
+    
+    def __init__(self, chunk_size: int=None, max_rows: int=None):
+        self.chunk_size = chunk_size or UserImportConst.CHUNK_SIZE
+        self.max_rows   = max_rows
+    
+    def parse(self, lines: Iterable, data_format: str) -> Iterator[Tuple[int, dict]]:
+        """ (line 번호, row dict) 생성. 파싱 불가 row 는 row 대신 에러 문자열 """
+        lines = (line.decode('utf-8') if isinstance(line, bytes) else line for line in lines)
+        
+        if data_format == UserImportConst.FORMAT_CSV:
+            for line_no, row in enumerate(csv.DictReader(lines), start=2):
+                yield line_no, row
+            return
+        
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                yield line_no, 'invalid json'
+                continue
+            yield line_no, row if isinstance(row, dict) else 'invalid json'
+    
+    def clean(self, row: dict) -> dict:
+        """ create 와 같은 입력 값 편집 및 상관관계 유효성 체크. 실패 시 ValueError """
+        # NDJSON 은 문자열이 아닌 값 (숫자 / 객체 등) 이 올 수 있음
+        if not isinstance(row.get('email') or '', str):
+            raise ValueError('invalid email')
+        if not isinstance(row.get('password') or '', str):
+            raise ValueError('invalid password')
+        
+        email = normalize_email(row.get('email') or '')
+        if not email:
+            raise ValueError('email is required')
+        if len(email) > self.EMAIL_MAX_LENGTH:
+            raise ValueError('email is too long')
+        try:
+            validate_email(email)
+        except ValidationError:
+            raise ValueError('invalid email')
+        
+        try:
+            social_signup_type = int(row.get('social_signup_type'))
+        except (TypeError, ValueError):
+            raise ValueError('invalid social_signup_type')
+        if social_signup_type not in self.SOCIAL_SIGNUP_TYPES:
+            raise ValueError('invalid social_signup_type')
+        
+        password = (row.get('password') or '').strip() or None
+        if social_signup_type == SocialSignUpTypeEnum.NO_SOCIAL.value and not password:
+            raise ValueError('password is required')
+        
+        return {
+            'email'                : email,
+            'password'             : password,  # import_chunk 에서 해시
+            'social_signup_type_id': social_signup_type,
+            'account_type_id'      : AccountTypeEnum.CONSUMER.value,
+        }
+    
+    def run(self, lines: Iterable, data_format: str) -> UserImportResult:
+        result = UserImportResult()
+        start  = time.perf_counter()
+        
+        rows = self.parse(lines, data_format)
+        if self.max_rows is not None:
+            # 일부 chunk 만 저장된 채 거절하지 않도록 한도 + 1 row 까지 먼저 읽어 확인 (메모리는 max_rows 로 제한)
+            rows = list(itertools.islice(rows, self.max_rows + 1))
+            if len(rows) > self.max_rows:
+                raise UserImportTooLargeException(self.max_rows)
+        
+        chunk = list()
+        for line_no, row in rows:
+            result.total += 1
+            
+            if isinstance(row, str):
+                result.add_error(line_no, None, row)
+                continue
+            
+            try:
+                chunk.append((line_no, self.clean(row)))
+            except ValueError as e:
+                result.add_error(line_no, row.get('email'), str(e))
+                continue
+            
+            if len(chunk) >= self.chunk_size:
+                self.import_chunk(chunk, result)
+                chunk = list()
+        
+        if chunk:
+            self.import_chunk(chunk, result)
+        
+        result.elapsed = time.perf_counter() - start
+        return result
+    
+    def import_chunk(self, chunk: List[Tuple[int, dict]], result: UserImportResult) -> None:
+        """ chunk 1개 처리: 중복 체크 SELECT 1회 + bulk INSERT 1회 (한 트랜잭션) """
+        emails   = [data['email'] for _, data in chunk]
+        existing = set(User.all_objects.filter(email__in=emails).values_list('email', flat=True))
+        
+        users, seen = list(), set()
+        for line_no, data in chunk:
+            email = data['email']
+            if email in existing or email in seen:
+                result.add_error(line_no, email, 'user already exists')
+                continue
+            seen.add(email)
+            users.append(User(**data))
+        
+        self.hash_passwords(users)
+        
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=self.chunk_size)
+            result.created += len(users)
+            self.add_to_bloom_filter(users)
+            
+        except IntegrityError:
+            # 조회 이후 다른 요청이 같은 이메일로 가입한 경우. 다시 조회하여 충돌 row 만 에러 처리
+            existing = set(User.all_objects.filter(email__in=list(seen)).values_list('email', flat=True))
+            lines    = {data['email']: line_no for line_no, data in chunk}
+            
+            retry = list()
+            for user in users:
+                if user.email in existing:
+                    result.add_error(lines[user.email], user.email, 'user already exists')
+                else:
+                    retry.append(user)
+            
+            try:
+                with transaction.atomic():
+                    User.objects.bulk_create(retry, batch_size=self.chunk_size)
+                result.created += len(retry)
+                self.add_to_bloom_filter(retry)
+                
+            except IntegrityError:
+                # 재시도 중에도 충돌한 경우 row 단위로 INSERT 하여 충돌 row 만 에러 처리 (드문 경우)
+                self.import_rows(retry, lines, result)
+    
+    def hash_passwords(self, users: List[User]) -> None:
+        users = [user for user in users if user.password]
+        for user, encoded in zip(users, password_manager.hash_many([user.password for user in users])):
+            user.password = encoded
+    
+    def import_rows(self, users: List[User], lines: dict, result: UserImportResult) -> None:
+        created = list()
+        for user in users:
+            try:
+                with transaction.atomic():
+                    user.save(force_insert=True)
+                created.append(user)
+            except IntegrityError:
+                result.add_error(lines[user.email], user.email, 'user already exists')
+        
+        result.created += len(created)
+        self.add_to_bloom_filter(created)
+    
+    def add_to_bloom_filter(self, users: List[User]) -> None:
+        # bulk_create 는 post_save 를 보내지 않으므로 직접 추가
+        for user in users:
+            email_bloom_filter.add(user.email)
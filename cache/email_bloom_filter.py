@@ -0,0 +1,197 @@
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+
+from django.conf    import settings
+from django.db      import connections, DatabaseError
+
+from account.const  import UserCacheConst
+from account.models import User
+from account.utils  import normalize_email
+
+logger = logging.getLogger(__name__)
+
+
+class BloomBits:
+    """ bloom filter 비트 배열 (double hashing 으로 k 개 위치 계산) """
+    
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity   = max(capacity, 1)
+        self.size       = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits       = bytearray((self.size + 7) // 8)
+        self.count      = 0
+    
+    def positions(self, email: str):
+        digest = hashlib.blake2b(email.encode('utf-8'), digest_size=16).digest()
+        h1     = int.from_bytes(digest[:8], 'little')
+        h2     = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, email: str) -> None:
+        for position in self.positions(email):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, email: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(email))
+
+
+class EmailBloomFilter:
+    """ 가입된 이메일 negative 캐시 (bloom filter, 프로세스 메모리)
+        - settings.ACCOUNT_EMAIL_BLOOM_ENABLED 가 True 일 때만 동작 (기본 비활성)
+        - might_exist(email) 가 False 면 DB 에 없는 이메일 (조회 생략), True 면 DB 조회 필요 (오탐률 EMAIL_BLOOM_ERROR_RATE)
+        - 첫 사용 시 백그라운드 스레드가 전체 이메일을 읽어 구성하고, 구성 전에는 항상 True (DB 조회)
+        - EMAIL_BLOOM_SYNC_INTERVAL 마다 id 증분으로 다른 프로세스의 가입을 반영, EMAIL_BLOOM_RELOAD_INTERVAL 마다 전체 재구성
+        - 동기화 사이의 다른 프로세스 가입은 음성으로 나올 수 있으므로 가입 INSERT 는 DB 유니크 제약
+          (IntegrityError) 이 최종 판단. 로그인 등 음성 결과를 그대로 믿으면 안 되는 조회에는 사용하지 않음
+        - 삭제 (아카이브) 는 반영하지 않음 (오탐으로 남아 DB 조회로 처리)
+    """
+    
+    def __init__(self):
+        self._lock       = threading.Lock()
+        self._bits       = None  # type: BloomBits
+        self._last_id    = 0
+        self._loaded_at  = 0.0
+        self._thread     = None
+        self._stop_event = threading.Event()
+        
+        # metrics
+        self.check_count      = 0
+        self.negative_count   = 0  # DB 조회를 생략한 횟수
+        self.load_count       = 0
+        self.load_latency     = 0.0
+        self.sync_error_count = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'ACCOUNT_EMAIL_BLOOM_ENABLED', False)
+    
+    @property
+    def ready(self) -> bool:
+        return self._bits is not None
+    
+    def metrics(self) -> dict:
+        bits = self._bits
+        return {
+            'ready'           : int(bits is not None),
+            'items'           : bits.count if bits is not None else 0,
+            'capacity'        : bits.capacity if bits is not None else 0,
+            'check_count'     : self.check_count,
+            'negative_count'  : self.negative_count,
+            'load_count'      : self.load_count,
+            'load_latency'    : round(self.load_latency, 3),
+            'sync_error_count': self.sync_error_count,
+        }
+    
+    def might_exist(self, email: str) -> bool:
+        """ False 면 가입되지 않은 이메일 (정규화된 이메일로 호출) """
+        if not self.enabled or not email:
+            return True
+        
+        self._ensure_started()
+        bits = self._bits
+        if bits is None:
+            return True
+        
+        self.check_count += 1
+        if email in bits:
+            return True
+        
+        self.negative_count += 1
+        return False
+    
+    def add(self, email: str) -> None:
+        """ 이 프로세스에서 가입한 이메일 즉시 반영 (동기화 주기를 기다리지 않음) """
+        bits = self._bits
+        if bits is not None and email:
+            with self._lock:
+                bits.add(normalize_email(email))
+    
+    def load(self) -> None:
+        """ 전체 이메일로 새 비트 배열을 만든 뒤 교체 (교체 전까지는 기존 배열로 응답) """
+        start    = time.perf_counter()
+        capacity = max(getattr(settings, 'ACCOUNT_EMAIL_BLOOM_CAPACITY', UserCacheConst.EMAIL_BLOOM_CAPACITY),
+                       User.all_objects.count() * UserCacheConst.EMAIL_BLOOM_GROWTH)
+        
+        bits    = BloomBits(capacity, getattr(settings, 'ACCOUNT_EMAIL_BLOOM_ERROR_RATE', UserCacheConst.EMAIL_BLOOM_ERROR_RATE))
+        last_id = self._add_since(bits, 0)
+        
+        with self._lock:
+            self._bits, self._last_id, self._loaded_at = bits, last_id, time.monotonic()
+        
+        self.load_count   += 1
+        self.load_latency  = time.perf_counter() - start
+    
+    def sync(self) -> None:
+        """ 마지막 동기화 이후 가입한 유저 반영. 용량 초과 / 재구성 주기 도달 시 전체 재구성 """
+        bits            = self._bits
+        reload_interval = getattr(settings, 'ACCOUNT_EMAIL_BLOOM_RELOAD_INTERVAL', UserCacheConst.EMAIL_BLOOM_RELOAD_INTERVAL)
+        
+        if bits is None or bits.count >= bits.capacity or time.monotonic() - self._loaded_at >= reload_interval:
+            self.load()
+            return
+        
+        self._last_id = self._add_since(bits, self._last_id)
+    
+    def _add_since(self, bits: BloomBits, last_id: int) -> int:
+        """ id > last_id 유저 이메일을 배치 단위 keyset 조회로 추가. 마지막 id 리턴 """
+        batch_size = UserCacheConst.EMAIL_BLOOM_BATCH_SIZE
+        while True:
+            rows = list(
+                User.all_objects.filter(id__gt=last_id)
+                                .order_by('id')
+                                .values_list('id', 'email')[:batch_size]
+            )
+            with self._lock:
+                for _, email in rows:
+                    bits.add(normalize_email(email))
+            if rows:
+                last_id = rows[-1][0]
+            if len(rows) < batch_size:
+                return last_id
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+    
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        
+        with self._lock:
+            if self._thread is not None:
+                return
+            
+            self._thread = threading.Thread(target=self._run, name='email-bloom-filter', daemon=True)
+            self._thread.start()
+    
+    def _reset_after_fork(self) -> None:
+        # fork 된 워커는 부모의 비트 배열을 그대로 쓰고 동기화 스레드만 새로 시작
+        self._lock       = threading.Lock()
+        self._thread     = None
+        self._stop_event = threading.Event()
+    
+    def _run(self) -> None:
+        interval = getattr(settings, 'ACCOUNT_EMAIL_BLOOM_SYNC_INTERVAL', UserCacheConst.EMAIL_BLOOM_SYNC_INTERVAL)
+        while True:
+            try:
+                self.sync()
+            except DatabaseError:
+                # 구성 / 동기화 실패 시 기존 배열 (또는 항상 DB 조회) 로 계속 동작, 다음 주기에 재시도
+                logger.exception('email bloom filter sync failed')
+                self.sync_error_count += 1
+            finally:
+                # 백그라운드 스레드 전용 커넥션 정리
+                connections.close_all()
+            
+            if self._stop_event.wait(interval):
+                return
+
+
+email_bloom_filter = EmailBloomFilter()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=email_bloom_filter._reset_after_fork)
@@ -0,0 +1,68 @@
+import hashlib
+
+from typing            import Optional
+
+from django.conf       import settings
+from django.core.cache import caches
+
+from account.const     import UserCacheConst
+
+
+class SignInUserCache:
+    """ 로그인용 email -> 유저 projection 캐시
+        - settings.ACCOUNT_SIGN_IN_CACHE_ENABLED 가 True 일 때만 동작 (기본 비활성)
+        - settings.ACCOUNT_SIGN_IN_CACHE_ALIAS   : 사용할 캐시 alias (LocMem: 프로세스 내, Redis/Memcached: 공유)
+        - settings.ACCOUNT_SIGN_IN_CACHE_TIMEOUT : TTL (초)
+        - 유저 생성/삭제/저장 시 signals 에서 invalidate
+        
+        projection 에 비밀번호 컬럼이 포함되므로 외부에 노출되지 않는 캐시 서버를 사용해야 한다.
+    """
+    
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'ACCOUNT_SIGN_IN_CACHE_ENABLED', False)
+    
+    @property
+    def timeout(self) -> int:
+        return getattr(settings, 'ACCOUNT_SIGN_IN_CACHE_TIMEOUT', UserCacheConst.SIGN_IN_CACHE_TIMEOUT)
+    
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'ACCOUNT_SIGN_IN_CACHE_ALIAS', UserCacheConst.SIGN_IN_CACHE_ALIAS)]
+    
+    def make_key(self, email: str) -> str:
+        # 이메일에 memcached 키로 쓸 수 없는 문자가 있을 수 있어 해시 값 사용
+        return UserCacheConst.SIGN_IN_CACHE_PREFIX + hashlib.sha256(email.encode('utf-8')).hexdigest()
+    
+    def get(self, email: str) -> Optional[dict]:
+        if not self.enabled or not email:
+            return None
+        return self.cache.get(self.make_key(email))
+    
+    def set(self, email: str, projection: dict) -> None:
+        if not self.enabled or not email:
+            return
+        self.cache.set(self.make_key(email), projection, timeout=self.timeout)
+    
+    def delete(self, email: str) -> None:
+        if not self.enabled or not email:
+            return
+        self.cache.delete(self.make_key(email))
+    
+    async def aget(self, email: str) -> Optional[dict]:
+        if not self.enabled or not email:
+            return None
+        return await self.cache.aget(self.make_key(email))
+    
+    async def aset(self, email: str, projection: dict) -> None:
+        if not self.enabled or not email:
+            return
+        await self.cache.aset(self.make_key(email), projection, timeout=self.timeout)
+    
+    async def adelete(self, email: str) -> None:
+        if not self.enabled or not email:
+            return
+        await self.cache.adelete(self.make_key(email))
+
+
+sign_in_cache = SignInUserCache()
@@ -0,0 +1,79 @@
+import hashlib
+import threading
+
+from typing            import Optional
+
+from django.conf       import settings
+from django.core.cache import caches
+
+from account.const     import UserCacheConst
+
+
+class SocialProfileCache:
+    """ 소셜 access_token -> email 캐시
+        - 같은 토큰으로 반복되는 프로필 조회 시 provider API 호출 생략
+        - 키는 provider + access_token 의 sha256 (토큰 원문을 캐시에 저장하지 않음)
+        - settings.ACCOUNT_SOCIAL_PROFILE_CACHE_TIMEOUT 가 0 이면 비활성
+        - hit / miss 카운터는 프로세스 단위
+    """
+    
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self.hits   = 0
+        self.misses = 0
+    
+    @property
+    def timeout(self) -> int:
+        return getattr(settings, 'ACCOUNT_SOCIAL_PROFILE_CACHE_TIMEOUT', UserCacheConst.SOCIAL_PROFILE_CACHE_TIMEOUT)
+    
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'ACCOUNT_SOCIAL_PROFILE_CACHE_ALIAS', UserCacheConst.SOCIAL_PROFILE_CACHE_ALIAS)]
+    
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def metrics(self) -> dict:
+        return {
+            'hits'    : self.hits,
+            'misses'  : self.misses,
+            'hit_rate': self.hit_rate,
+        }
+    
+    def make_key(self, provider: str, access_token: str) -> str:
+        digest = hashlib.sha256(access_token.encode('utf-8')).hexdigest()
+        return f'{UserCacheConst.SOCIAL_PROFILE_CACHE_PREFIX}{provider}:{digest}'
+    
+    def get(self, provider: str, access_token: str) -> Optional[str]:
+        if not self.timeout or not access_token:
+            return None
+        return self._count(self.cache.get(self.make_key(provider, access_token)))
+    
+    def set(self, provider: str, access_token: str, email: str) -> None:
+        if not self.timeout or not access_token:
+            return
+        self.cache.set(self.make_key(provider, access_token), email, timeout=self.timeout)
+    
+    # async 뷰용. 캐시 I/O 가 이벤트 루프를 막지 않도록 Django 캐시 async API 사용
+    async def aget(self, provider: str, access_token: str) -> Optional[str]:
+        if not self.timeout or not access_token:
+            return None
+        return self._count(await self.cache.aget(self.make_key(provider, access_token)))
+    
+    async def aset(self, provider: str, access_token: str, email: str) -> None:
+        if not self.timeout or not access_token:
+            return
+        await self.cache.aset(self.make_key(provider, access_token), email, timeout=self.timeout)
+    
+    def _count(self, email: Optional[str]) -> Optional[str]:
+        with self._lock:
+            if email is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return email
+
+
+social_profile_cache = SocialProfileCache()
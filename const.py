@@ -14,3 +14,294 @@ class UserConst:
         (4, 'GOOGLE'),
         (5, 'APPLE'),
     ]
+
+
+class UserCacheConst:
+    
+    # 로그인용 email -> 유저 projection 캐시
+    SIGN_IN_CACHE_ALIAS   = 'default'
+    SIGN_IN_CACHE_PREFIX  = 'account:sign-in:'
+    SIGN_IN_CACHE_TIMEOUT = 60 * 5
+    
+    # 소셜 access_token -> email 캐시 (키는 토큰 해시)
+    SOCIAL_PROFILE_CACHE_ALIAS   = 'default'
+    SOCIAL_PROFILE_CACHE_PREFIX  = 'account:social-profile:'
+    SOCIAL_PROFILE_CACHE_TIMEOUT = 60 * 5
+    
+    # 가입 이메일 negative 캐시 (bloom filter)
+    EMAIL_BLOOM_CAPACITY        = 1000000  # 최소 용량. 실제 용량은 로드 시점 유저 수 x EMAIL_BLOOM_GROWTH 와 비교하여 큰 값
+    EMAIL_BLOOM_GROWTH          = 2
+    EMAIL_BLOOM_ERROR_RATE      = 0.01
+    EMAIL_BLOOM_SYNC_INTERVAL   = 5.0      # 초. 다른 프로세스 가입 반영 (id 증분) 주기
+    EMAIL_BLOOM_RELOAD_INTERVAL = 60 * 60  # 초. 전체 재구성 주기 (증분 동기화가 놓친 가입 / 용량 초과 보정)
+    EMAIL_BLOOM_BATCH_SIZE      = 10000
+
+
+class LoginStatBufferConst:
+    
+    # 로그인 카운트/마지막 로그인 시간 write-behind 버퍼
+    MAX_SIZE       = 500   # 버퍼에 쌓인 유저 수가 이 값 이상이면 즉시 flush
+    FLUSH_INTERVAL = 1.0   # 초. 백그라운드 스레드 flush 주기
+
+
+class SocialHttpConst:
+    
+    # 소셜 provider HTTP 클라이언트
+    CONNECT_TIMEOUT = 3.05  # 초
+    READ_TIMEOUT    = 5     # 초
+    MAX_RETRIES     = 2
+    BACKOFF_FACTOR  = 0.3   # 0.3, 0.6, 1.2 ... 초
+    RETRY_STATUS    = (502, 503, 504)
+    POOL_SIZE       = 20    # 호스트당 keep-alive 커넥션 수
+    
+    # 서킷 브레이커
+    CIRCUIT_FAILURE_THRESHOLD = 5   # 연속 실패 횟수
+    CIRCUIT_RESET_TIMEOUT     = 30  # 초. open 이후 half-open 전환까지 대기
+
+
+class SocialProviderConst:
+    
+    # provider 기본 엔드포인트. settings.SOCIAL_PROVIDERS[<provider>] 에서 키 별로 덮어쓸 수 있음
+    # - TOKEN_INFO_URL: access token 이 우리 앱에 발급되었는지 확인하는 API (apple 은 id_token aud 로 확인)
+    ENDPOINTS = {
+        'kakao': {
+            'AUTHORIZE_URL' : 'https://kauth.kakao.com/oauth/authorize',
+            'TOKEN_URL'     : 'https://kauth.kakao.com/oauth/token',
+            'PROFILE_URL'   : 'https://kapi.kakao.com/v2/user/me',
+            'TOKEN_INFO_URL': 'https://kapi.kakao.com/v1/user/access_token_info',
+        },
+        'naver': {
+            'AUTHORIZE_URL' : 'https://nid.naver.com/oauth2.0/authorize',
+            'TOKEN_URL'     : 'https://nid.naver.com/oauth2.0/token',
+            'PROFILE_URL'   : 'https://openapi.naver.com/v1/nid/me',
+        },
+        'facebook': {
+            'AUTHORIZE_URL' : 'https://www.facebook.com/v12.0/dialog/oauth',
+            'TOKEN_URL'     : 'https://graph.facebook.com/v12.0/oauth/access_token',
+            'PROFILE_URL'   : 'https://graph.facebook.com/v12.0/me',
+            'TOKEN_INFO_URL': 'https://graph.facebook.com/debug_token',
+        },
+        'google': {
+            'AUTHORIZE_URL' : 'https://accounts.google.com/o/oauth2/v2/auth',
+            'TOKEN_URL'     : 'https://oauth2.googleapis.com/token',
+            'PROFILE_URL'   : 'https://openidconnect.googleapis.com/v1/userinfo',
+            'TOKEN_INFO_URL': 'https://oauth2.googleapis.com/tokeninfo',
+        },
+        'apple': {
+            'AUTHORIZE_URL' : 'https://appleid.apple.com/auth/authorize',
+            'TOKEN_URL'     : 'https://appleid.apple.com/auth/token',
+            'PROFILE_URL'   : 'https://appleid.apple.com/auth/keys',  # id_token 서명 검증용 JWKS
+        },
+    }
+    
+    # 애플 id_token 검증
+    APPLE_ISSUER           = 'https://appleid.apple.com'
+    APPLE_JWKS_TTL         = 3600  # 초. JWKS 캐시 유지 시간
+    APPLE_JWKS_MIN_REFRESH = 60    # 초. 모르는 kid 로 인한 JWKS 재조회 최소 간격
+
+
+class UserListConst:
+    
+    # 유저 목록 keyset(cursor) 페이지네이션
+    PAGE_SIZE     = 100
+    MAX_PAGE_SIZE = 1000
+    
+    # NDJSON 스트리밍 export
+    EXPORT_CHUNK_SIZE = 2000
+
+
+class UserImportConst:
+    
+    # 대량 회원가입 / 파트너 유저 이관
+    CHUNK_SIZE        = 1000  # 트랜잭션 / email__in 조회 / bulk_create 단위
+    MAX_ERROR_REPORTS = 1000  # 응답에 포함할 최대 에러 row 수
+    MAX_HTTP_ROWS     = 10000  # HTTP bulk 엔드포인트 1회 최대 row 수 (초과 시 import_users 커맨드 사용)
+    
+    FORMAT_CSV    = 'csv'
+    FORMAT_NDJSON = 'ndjson'
+
+
+class PasswordConst:
+    
+    # settings.ACCOUNT_PASSWORD_HASHER / ACCOUNT_PASSWORD_COST 미설정 시 기본 값
+    ALGORITHM_PBKDF2 = 'pbkdf2_sha256'
+    ALGORITHM_ARGON2 = 'argon2'
+    ALGORITHM_BCRYPT = 'bcrypt_sha256'
+    
+    DEFAULT_ALGORITHM = ALGORITHM_PBKDF2
+    
+    # 비동기 뷰용 검증 스레드 풀 크기 (None 이면 CPU 수)
+    VERIFY_POOL_SIZE = None
+    
+    # 해싱 도입 이전 평문 비밀번호 검증 허용 마지막 날 (settings.ACCOUNT_PLAINTEXT_PASSWORD_UNTIL, ISO 날짜)
+    # 이전에 hash_plaintext_passwords 커맨드로 남은 평문 row 를 모두 해시해야 함
+    PLAINTEXT_PASSWORD_UNTIL = '2027-01-31'
+    PLAINTEXT_BATCH_SIZE     = 1000
+
+
+class JWTConst:
+    
+    # settings.ACCOUNT_JWT_* 미설정 시 기본 값
+    ALGORITHM   = 'HS256'
+    ISSUER      = 'class101-account'
+    ACCESS_TTL  = 60 * 15            # 초
+    REFRESH_TTL = 60 * 60 * 24 * 14  # 초
+    
+    TOKEN_TYPE_ACCESS  = 'access'
+    TOKEN_TYPE_REFRESH = 'refresh'
+    
+    # 폐기 토큰 목록 동기화 주기 (초). 요청마다 DB 를 조회하지 않고 주기적으로 증분 동기화
+    REVOCATION_SYNC_INTERVAL = 30
+    
+    # prune_revoked_tokens 1회 DELETE row 수
+    REVOCATION_PRUNE_BATCH_SIZE = 1000
+
+
+class RateLimitConst:
+    
+    # (허용 횟수, 윈도우 초). settings.ACCOUNT_RATE_LIMITS 로 덮어쓸 수 있음
+    RATES = {
+        'sign_in_ip'   : (30, 60),
+        'sign_in_email': (10, 60),
+        'create_ip'    : (10, 60),
+    }
+    
+    # 로그인 연속 실패 잠금 (FAILURE_THRESHOLD 회 이후 LOCKOUT_BASE * 2^n 초, 최대 LOCKOUT_MAX 초)
+    FAILURE_THRESHOLD = 5
+    FAILURE_TTL       = 60 * 60
+    LOCKOUT_BASE      = 30
+    LOCKOUT_MAX       = 60 * 60
+    
+    BACKEND_LOCAL = 'local'
+    BACKEND_CACHE = 'cache'
+    KEY_PREFIX    = 'account:rl:'
+    
+    # X-Forwarded-For 를 추가하는 신뢰 프록시 수 (settings.ACCOUNT_RATE_LIMIT_TRUSTED_PROXY_COUNT)
+    TRUSTED_PROXY_COUNT = 1
+    
+    # 요청당 limiter 오버헤드 예산 (마이크로초, bench_rate_limiter 기준)
+    OVERHEAD_BUDGET_US = 100
+
+
+class RequestLogConst:
+    
+    # 구조화 요청 로그 (account.request_log)
+    LOGGER_NAME = 'account.request'
+    
+    # 액션별 샘플링 비율 (0.0 ~ 1.0). settings.ACCOUNT_REQUEST_LOG_SAMPLE_RATES 로 덮어쓸 수 있음
+    DEFAULT_SAMPLE_RATE  = 1.0
+    HOT_PATH_SAMPLE_RATE = 0.01  # sign_in / list 등 호출 빈도가 높은 액션
+    
+    # 값을 가리는 필드 (소문자, 부분 일치)
+    REDACT_FIELDS = ('password', 'token', 'secret', 'code', 'authorization')
+    REDACTED      = '***'
+    
+    # 요청 스레드 -> 백그라운드 writer 큐. 가득 차면 요청을 막지 않고 버림
+    QUEUE_SIZE = 10000
+
+
+class RequestMetricsConst:
+    
+    # 액션별 요청 계측 (account.metrics). histogram 버킷
+    DURATION_BUCKETS    = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # 초
+    QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50)
+    
+    # 이 시간(초) 이상 걸린 요청은 쿼리 / HTTP 호출 목록을 로그로 남김 (settings.ACCOUNT_METRICS_SLOW_REQUEST_SECONDS)
+    SLOW_REQUEST_SECONDS = 1.0
+    SLOW_TRACE_MAX_ITEMS = 50
+    
+    # 액션별 허용 쿼리 수 (check_endpoint_query_counts 기준, sign-in 캐시 / 로그인 버퍼 비활성 상태)
+    QUERY_BUDGETS = {
+        'sign_in'           : 2,  # SELECT + UPDATE
+        'create'            : 6,  # 중복 체크 1회 (bloom filter 음성 시 생략) + INSERT + 인증 토큰 / outbox INSERT + SAVEPOINT / RELEASE
+        'retrieve'          : 1,
+        'list'              : 1,
+        'social_login:kakao': 5,  # 최초 로그인 (회원가입): SELECT + INSERT + 환영 메일 outbox INSERT + SAVEPOINT / RELEASE
+    }
+
+
+class EmailOutboxConst:
+    
+    STATUS_PENDING = 0
+    STATUS_SENT    = 1
+    STATUS_FAILED  = 2
+    STATUS = [
+        (0, 'PENDING'),
+        (1, 'SENT'),
+        (2, 'FAILED'),
+    ]
+    
+    KIND_VERIFICATION = 'verification'
+    KIND_WELCOME      = 'welcome'
+    
+    SUBJECTS = {
+        'verification': '[CLASS101] 이메일 인증을 완료해 주세요',
+        'welcome'     : '[CLASS101] 가입을 환영합니다',
+    }
+    
+    # 워커
+    BATCH_SIZE    = 100
+    POLL_INTERVAL = 1.0       # 초. 발송 대기 row 가 없을 때 대기 시간
+    LEASE_SECONDS = 60 * 5    # 꺼낸 row 를 다른 워커가 다시 꺼내지 않는 시간 (발송 중 워커 종료 시 이후 재발송)
+    MAX_ATTEMPTS  = 5
+    RETRY_BASE    = 30        # 초. 실패 시 RETRY_BASE * 2^(attempts-1) 후 재시도
+    
+    # 인증 토큰 유효 시간 (초)
+    VERIFICATION_TTL = 60 * 60 * 24
+    
+    # 발송 transport (settings.ACCOUNT_EMAIL_TRANSPORT)
+    TRANSPORT_FILE     = 'file'      # 로컬 파일 (개발 / 테스트)
+    TRANSPORT_SMTP     = 'smtp'      # django.core.mail (EMAIL_BACKEND 설정)
+    TRANSPORT_SENDGRID = 'sendgrid'
+    DEFAULT_TRANSPORT  = 'file'
+    FILE_DIR           = 'email-outbox'
+    SENDGRID_URL       = 'https://api.sendgrid.com/v3/mail/send'
+
+
+class BenchConst:
+    
+    # bench_account_endpoints (벤치 전용 DB 에서 실행)
+    ENDPOINTS       = ('sign_in', 'create', 'retrieve', 'list', 'kakao_login')
+    EMAIL_DOMAIN    = 'bench.local'
+    PASSWORD        = 'bench-password'
+    SEED_BATCH_SIZE = 10000
+    SAMPLE_IDS      = 10000  # retrieve 대상으로 뽑아 둘 유저 id 수
+    
+    # --baseline 비교 시 허용 악화 비율 (p95 / 처리량)
+    REGRESSION_THRESHOLD = 0.15
+
+
+class UserArchiveConst:
+    
+    # 탈퇴 유저 아카이브 (archive_deleted_users). settings.ACCOUNT_ARCHIVE_* 로 덮어쓸 수 있음
+    RETENTION_DAYS  = 30    # 탈퇴 후 users 에 남겨 두는 기간
+    BATCH_SIZE      = 500   # 트랜잭션 1개에서 옮기는 유저 수 (작을수록 lock 시간이 짧음)
+    BATCH_SLEEP     = 0.5   # 초. 배치 사이 대기 (복제 지연 / 부하 완화)
+    LOCK_TIMEOUT_MS = 2000  # PostgreSQL lock_timeout. 초과 시 해당 배치는 건너뛰고 다음 실행에서 재시도
+
+
+class DBReplicaConst:
+    
+    # 읽기 replica 라우팅 (account.db_router). settings.ACCOUNT_DB_* 로 덮어쓸 수 있음
+    PRIMARY = 'default'
+    
+    # 쓰기 후 이 시간(초) 동안은 같은 클라이언트의 읽기도 primary 로 (replica 복제 지연 허용 범위)
+    LAG_TOLERANCE = 2.0
+    PIN_COOKIE    = 'account_db_pin'
+
+
+class StartupConst:
+    
+    # 콜드 스타트 예산 (check_startup_time). django.setup() 이후 첫 sign-in 응답까지 (URLconf / 뷰 import 포함)
+    FIRST_SIGN_IN_BUDGET = 1.0  # 초
+    
+    # sign-in 까지의 경로에서 import 되지 않아야 하는 모듈 (첫 사용 시 import)
+    LAZY_MODULES = (
+        'requests',
+        'urllib3',
+        'httpx',
+        'account.serializers.user_serializers',
+        'account.views.async_views',
+    )
+    
+    TOP_IMPORTS = 20
@@ -0,0 +1,203 @@
+import contextvars
+import math
+import threading
+import time
+
+from contextlib             import contextmanager
+from typing                 import Dict, Optional
+
+from asgiref.sync           import iscoroutinefunction, markcoroutinefunction
+
+from django.conf            import settings
+from django.db              import connections
+
+from account.const          import DBReplicaConst
+
+
+class PinState:
+    """ 요청 1개의 primary 고정 상태
+        - sync_to_async 로 복사된 context 에서도 같은 객체를 공유하도록 mutable 객체로 둠
+    """
+    
+    __slots__ = ('pinned', 'written')
+    
+    def __init__(self, pinned: bool=False):
+        self.pinned  = pinned
+        self.written = False
+
+
+_pin_state = contextvars.ContextVar('account_db_pin_state', default=None)
+
+
+class ReplicaSelector:
+    """ 읽기 전용 조회를 replica 로 분산 (weighted round-robin) + 쓰기 후 primary 고정
+        - settings.ACCOUNT_DB_PRIMARY  : primary alias (기본 'default')
+        - settings.ACCOUNT_DB_REPLICAS : {alias: weight} (비어 있으면 모든 조회가 primary)
+        - settings.ACCOUNT_DB_LAG_TOLERANCE : 쓰기 후 primary 고정 시간 (초, 쿠키로 다음 요청에 전달)
+        - replica 는 read_alias() 를 명시적으로 쓰는 조회만 사용 (UserDatabaseQuery.on_replica)
+        - 요청 scope (ReplicaPinningMiddleware) 밖에서는 쓰기 여부를 알 수 없으므로 항상 primary
+        - 요청 내 쓰기 이후 / 트랜잭션 안 / 쿠키 고정 시간 안이면 primary
+    """
+    
+    def __init__(self):
+        self._lock    = threading.Lock()
+        self._config  = None
+        self._current = dict()  # alias -> smooth weighted round-robin 현재 값
+        
+        # metrics
+        self.reads        = dict()  # alias -> replica 조회 수
+        self.pinned_reads = 0       # replica 설정이 있으나 primary 로 고정된 조회 수
+    
+    @property
+    def primary(self) -> str:
+        return getattr(settings, 'ACCOUNT_DB_PRIMARY', DBReplicaConst.PRIMARY)
+    
+    @property
+    def replicas(self) -> Dict[str, int]:
+        return {alias: weight for alias, weight in getattr(settings, 'ACCOUNT_DB_REPLICAS', {}).items() if weight > 0}
+    
+    @property
+    def lag_tolerance(self) -> float:
+        return getattr(settings, 'ACCOUNT_DB_LAG_TOLERANCE', DBReplicaConst.LAG_TOLERANCE)
+    
+    def metrics(self) -> dict:
+        result = {f'reads_{alias}': count for alias, count in self.reads.items()}
+        result['pinned_reads'] = self.pinned_reads
+        return result
+    
+    def next_replica(self, replicas: Dict[str, int]) -> str:
+        """ nginx smooth weighted round-robin (가중치 비율을 유지하면서 같은 replica 가 몰리지 않음) """
+        with self._lock:
+            config = tuple(sorted(replicas.items()))
+            if config != self._config:
+                self._config  = config
+                self._current = {alias: 0 for alias in replicas}
+            
+            total = 0
+            for alias, weight in replicas.items():
+                self._current[alias] += weight
+                total                += weight
+            
+            alias = max(self._current, key=self._current.get)
+            self._current[alias] -= total
+            
+            self.reads[alias] = self.reads.get(alias, 0) + 1
+        return alias
+    
+    def read_alias(self) -> str:
+        """ 읽기 전용 조회에 쓸 DB alias """
+        primary  = self.primary
+        replicas = self.replicas
+        if not replicas:
+            return primary
+        
+        if self.is_pinned(primary):
+            self.pinned_reads += 1
+            return primary
+        
+        return self.next_replica(replicas)
+    
+    def is_pinned(self, primary: str) -> bool:
+        state = _pin_state.get()
+        if state is None or state.pinned:
+            return True
+        return connections[primary].in_atomic_block
+    
+    def mark_written(self) -> None:
+        """ 요청 내 쓰기 발생. 이후 조회는 primary + 응답에 고정 쿠키 """
+        state = _pin_state.get()
+        if state is not None:
+            state.pinned  = True
+            state.written = True
+    
+    def pin(self) -> None:
+        """ 요청의 나머지 조회를 primary 로 (로그인 / 회원가입 등) """
+        state = _pin_state.get()
+        if state is not None:
+            state.pinned = True
+    
+    @contextmanager
+    def scope(self, pinned: bool=False):
+        """ 요청 1개의 고정 상태 범위 (미들웨어 / 관리 명령에서 사용) """
+        state = PinState(pinned=pinned)
+        token = _pin_state.set(state)
+        try:
+            yield state
+        finally:
+            _pin_state.reset(token)
+
+
+class AccountReplicaRouter:
+    """ settings.DATABASE_ROUTERS 에 'account.db_router.AccountReplicaRouter' 추가
+        - account 앱 모델만 판단하고 나머지 앱은 다음 router / 기본 동작에 맡김
+        - 기본 조회는 primary (replica 는 UserDatabaseQuery.on_replica 로 명시한 조회만)
+        - 쓰기는 항상 primary (replica 에서 읽은 인스턴스의 save() 포함) + 요청을 primary 로 고정
+    """
+    
+    app_label = 'account'
+    
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if model._meta.app_label != self.app_label:
+            return None
+        return replica_selector.primary
+    
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        if model._meta.app_label != self.app_label:
+            return None
+        replica_selector.mark_written()
+        return replica_selector.primary
+    
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        databases = {replica_selector.primary, *replica_selector.replicas}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+    
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        # 운영 replica 는 복제로 스키마를 받으므로 migrate 대상 판단은 하지 않음
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """ 요청마다 primary 고정 상태를 만들고 쓰기가 있었으면 lag 허용 시간 동안 고정 쿠키 설정
+        - settings.MIDDLEWARE 에 'account.db_router.ReplicaPinningMiddleware' 추가 (AccountMetricsMiddleware 앞)
+        - 쿠키가 유효한 동안의 다음 요청은 replica 대신 primary 에서 조회 (read-your-writes)
+    """
+    
+    sync_capable  = True
+    async_capable = True
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async     = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+    
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        
+        with replica_selector.scope(pinned=self.is_pinned_request(request)) as state:
+            response = self.get_response(request)
+        return self.process_response(state, response)
+    
+    async def __acall__(self, request):
+        with replica_selector.scope(pinned=self.is_pinned_request(request)) as state:
+            response = await self.get_response(request)
+        return self.process_response(state, response)
+    
+    def is_pinned_request(self, request) -> bool:
+        try:
+            return float(request.COOKIES.get(DBReplicaConst.PIN_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+    
+    def process_response(self, state: PinState, response):
+        lag_tolerance = replica_selector.lag_tolerance
+        if state.written and lag_tolerance > 0:
+            response.set_cookie(DBReplicaConst.PIN_COOKIE, f'{time.time() + lag_tolerance:.3f}',
+                                max_age=math.ceil(lag_tolerance), httponly=True, samesite='Lax')
+        return response
+
+
+replica_selector = ReplicaSelector()
@@ -0,0 +1,296 @@
+import hashlib
+import json
+import logging
+import os
+import secrets
+import time
+
+from datetime               import timedelta
+from typing                 import Dict, List, Optional
+
+from django.conf            import settings
+from django.core.mail       import EmailMessage, get_connection
+from django.db              import transaction
+from django.db.models       import F, Min
+from django.utils           import timezone
+
+from account.const          import EmailOutboxConst
+from account.enums          import SocialSignUpTypeEnum
+from account.models         import User, EmailOutbox, EmailVerificationToken
+
+logger = logging.getLogger(__name__)
+
+
+def hash_token(raw_token: str) -> str:
+    return hashlib.sha256(raw_token.encode('utf-8')).hexdigest()
+
+
+def build_body(row: EmailOutbox) -> str:
+    """ outbox row -> 메일 본문 (text) """
+    if row.kind == EmailOutboxConst.KIND_VERIFICATION:
+        verify_url = getattr(settings, 'ACCOUNT_EMAIL_VERIFY_URL', '/account/email/verify/?token={token}')
+        return f'아래 링크에서 이메일 인증을 완료해 주세요.\n{verify_url.format(token=row.payload["token"])}\n'
+    return '클래스101 가입을 환영합니다.\n'
+
+
+class FileEmailTransport:
+    """ 로컬 파일 transport (개발 / 테스트)
+        - 메일 1건을 {idempotency_key}.json 파일 1개로 기록. 같은 키를 다시 보내면 덮어쓰므로 중복 발송 없음
+    """
+    
+    def __init__(self):
+        self.directory = getattr(settings, 'ACCOUNT_EMAIL_FILE_DIR', EmailOutboxConst.FILE_DIR)
+        os.makedirs(self.directory, exist_ok=True)
+    
+    def send_batch(self, rows: List[EmailOutbox]) -> Dict[int, Optional[str]]:
+        """ row id -> 에러 메시지 (성공 시 None) """
+        results = dict()
+        for row in rows:
+            message = {
+                'idempotency_key': row.idempotency_key,
+                'to'             : row.to_email,
+                'subject'        : EmailOutboxConst.SUBJECTS[row.kind],
+                'body'           : build_body(row),
+            }
+            path = os.path.join(self.directory, f'{row.idempotency_key.replace(":", "_")}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(message, f, ensure_ascii=False)
+            results[row.id] = None
+        return results
+
+
+class SMTPEmailTransport:
+    """ django.core.mail transport (settings.EMAIL_BACKEND). 배치 1개를 커넥션 1개로 발송 """
+    
+    def send_batch(self, rows: List[EmailOutbox]) -> Dict[int, Optional[str]]:
+        results = dict()
+        with get_connection() as connection:
+            for row in rows:
+                message = EmailMessage(
+                    subject    = EmailOutboxConst.SUBJECTS[row.kind],
+                    body       = build_body(row),
+                    to         = [row.to_email],
+                    headers    = {'X-Idempotency-Key': row.idempotency_key},
+                    connection = connection,
+                )
+                try:
+                    message.send()
+                    results[row.id] = None
+                except Exception as e:
+                    results[row.id] = f'{e.__class__.__name__}: {e}'
+        return results
+
+
+class SendGridEmailTransport:
+    """ SendGrid v3 mail/send transport
+        - settings.ACCOUNT_SENDGRID_API_KEY, settings.ACCOUNT_EMAIL_FROM 필요
+        - idempotency_key 를 custom_args 로 전달 (이벤트 웹훅에서 중복 확인용)
+    """
+    
+    def __init__(self):
+        # requests 는 워커에서 이 transport 를 만들 때만 import (뷰 기동 시간에서 제외)
+        import requests
+        
+        self.session = requests.Session()
+        self.session.headers['Authorization'] = f'Bearer {settings.ACCOUNT_SENDGRID_API_KEY}'
+        self.timeout = getattr(settings, 'ACCOUNT_SENDGRID_TIMEOUT', 5)
+    
+    def send_batch(self, rows: List[EmailOutbox]) -> Dict[int, Optional[str]]:
+        import requests
+        
+        results = dict()
+        for row in rows:
+            body = {
+                'personalizations': [{'to': [{'email': row.to_email}],
+                                      'custom_args': {'idempotency_key': row.idempotency_key}}],
+                'from'            : {'email': settings.ACCOUNT_EMAIL_FROM},
+                'subject'         : EmailOutboxConst.SUBJECTS[row.kind],
+                'content'         : [{'type': 'text/plain', 'value': build_body(row)}],
+            }
+            try:
+                response = self.session.post(EmailOutboxConst.SENDGRID_URL, json=body, timeout=self.timeout)
+                results[row.id] = None if response.status_code < 300 else f'sendgrid status {response.status_code}'
+            except requests.RequestException as e:
+                results[row.id] = e.__class__.__name__
+        return results
+
+
+TRANSPORT_CLASSES = {
+    EmailOutboxConst.TRANSPORT_FILE    : FileEmailTransport,
+    EmailOutboxConst.TRANSPORT_SMTP    : SMTPEmailTransport,
+    EmailOutboxConst.TRANSPORT_SENDGRID: SendGridEmailTransport,
+}
+
+
+def build_transport(name: str=None):
+    name = name or getattr(settings, 'ACCOUNT_EMAIL_TRANSPORT', EmailOutboxConst.DEFAULT_TRANSPORT)
+    return TRANSPORT_CLASSES[name]()
+
+
+class EmailOutboxQuery:
+    """ 가입 메일 outbox / 이메일 인증 토큰 쿼리 """
+    
+    def enqueue_sign_up(self, user: User) -> None:
+        """ 가입 메일 outbox INSERT (가입 트랜잭션 안에서 호출)
+            - 일반 가입: 인증 토큰 INSERT 1회 + 인증 / 환영 메일 bulk INSERT 1회
+            - 소셜 가입: 환영 메일 INSERT 1회 (provider 가 인증한 이메일)
+            - 인증 메일 원본 토큰은 발송 전까지만 payload 에 두고 SENT / FAILED UPDATE 에서 지움 (DB 에는 hash 만 남음)
+            param
+            - user: 가입한 유저 모델 인스턴스
+        """
+        rows = [
+            EmailOutbox(kind=EmailOutboxConst.KIND_WELCOME, idempotency_key=f'welcome:{user.pk}', to_email=user.email),
+        ]
+        
+        if user.social_signup_type_id == SocialSignUpTypeEnum.NO_SOCIAL.value:
+            raw_token = secrets.token_urlsafe(32)
+            EmailVerificationToken.objects.create(
+                user_id    = user.pk,
+                token_hash = hash_token(raw_token),
+                expires_at = timezone.now() + timedelta(seconds=EmailOutboxConst.VERIFICATION_TTL),
+            )
+            rows.append(EmailOutbox(kind=EmailOutboxConst.KIND_VERIFICATION, to_email=user.email,
+                                    idempotency_key=f'verification:{user.pk}:{hash_token(raw_token)[:16]}',
+                                    payload={'token': raw_token}))
+        
+        EmailOutbox.objects.bulk_create(rows)
+    
+    def verify_email(self, raw_token: str) -> bool:
+        """ 인증 토큰 사용 처리 후 유저 이메일 인증일 기록. 없거나 만료 / 사용된 토큰이면 False
+            - used_at IS NULL 조건 UPDATE 로 같은 토큰의 동시 요청 중 하나만 성공
+        """
+        now = timezone.now()
+        
+        with transaction.atomic():
+            tokens  = EmailVerificationToken.objects.filter(token_hash=hash_token(raw_token), used_at__isnull=True, expires_at__gt=now)
+            user_id = tokens.values_list('user_id', flat=True).first()
+            
+            if user_id is None or not tokens.update(used_at=now):
+                return False
+            
+            User.objects.filter(pk=user_id, email_verified_at__isnull=True).update(email_verified_at=now)
+        
+        return True
+
+
+class EmailOutboxWorker:
+    """ outbox 발송 워커 (run_email_worker 명령)
+        - 발송 대기 row 를 SELECT ... FOR UPDATE SKIP LOCKED 로 batch_size 만큼 꺼내고 LEASE_SECONDS 동안 예약
+          (여러 워커를 동시에 띄워도 같은 row 를 나누어 가지지 않음)
+        - 트랜잭션 밖에서 transport 로 발송 후 성공 row 는 UPDATE 1회로 SENT 처리 (payload 의 원본 토큰도 같은 UPDATE 에서 비움)
+        - 실패 row 는 RETRY_BASE * 2^(attempts-1) 초 후 재시도, MAX_ATTEMPTS 회 실패 시 FAILED
+        - 발송 후 상태 기록 전에 워커가 종료되면 lease 만료 후 재발송 (at-least-once). transport 에 idempotency_key 를 전달
+    """
+    
+    def __init__(self, transport=None, batch_size: int=None):
+        self.transport  = transport or build_transport()
+        self.batch_size = batch_size or getattr(settings, 'ACCOUNT_EMAIL_BATCH_SIZE', EmailOutboxConst.BATCH_SIZE)
+        
+        # metrics
+        self.batch_count        = 0
+        self.sent_count         = 0
+        self.retry_count        = 0
+        self.failed_count       = 0
+        self.send_elapsed       = 0.0
+        self.last_batch_latency = 0.0
+        self.last_send_lag      = 0.0  # 마지막 배치의 (발송 시간 - outbox 생성 시간) 최대 값 (초)
+    
+    @property
+    def throughput(self) -> float:
+        """ 초당 발송 건수 (발송 구간 기준) """
+        return self.sent_count / self.send_elapsed if self.send_elapsed else 0.0
+    
+    def pending_lag(self) -> float:
+        """ 발송 대기 중 가장 오래된 row 의 대기 시간 (초). 쿼리 1회 """
+        oldest = EmailOutbox.objects.filter(status=EmailOutboxConst.STATUS_PENDING).aggregate(oldest=Min('created_at'))['oldest']
+        return (timezone.now() - oldest).total_seconds() if oldest else 0.0
+    
+    def metrics(self) -> dict:
+        return {
+            'batch_count'       : self.batch_count,
+            'sent_count'        : self.sent_count,
+            'retry_count'       : self.retry_count,
+            'failed_count'      : self.failed_count,
+            'throughput'        : round(self.throughput, 1),
+            'last_batch_latency': round(self.last_batch_latency, 3),
+            'last_send_lag'     : round(self.last_send_lag, 3),
+            'pending_lag'       : round(self.pending_lag(), 3),
+        }
+    
+    def claim_batch(self) -> List[EmailOutbox]:
+        now = timezone.now()
+        
+        with transaction.atomic():
+            rows = list(
+                EmailOutbox.objects.select_for_update(skip_locked=True)
+                                   .filter(status=EmailOutboxConst.STATUS_PENDING, next_attempt_at__lte=now)
+                                   .order_by('next_attempt_at')[:self.batch_size]
+            )
+            if rows:
+                EmailOutbox.objects.filter(pk__in=[row.pk for row in rows]).update(
+                    attempts        = F('attempts') + 1,
+                    next_attempt_at = now + timedelta(seconds=EmailOutboxConst.LEASE_SECONDS),
+                )
+        
+        for row in rows:
+            row.attempts += 1
+        return rows
+    
+    def process_batch(self) -> int:
+        """ 배치 1개 발송. 꺼낸 row 수 리턴 (0 이면 발송 대기 row 없음) """
+        rows = self.claim_batch()
+        if not rows:
+            return 0
+        
+        start = time.perf_counter()
+        try:
+            results = self.transport.send_batch(rows)
+        except Exception as e:
+            logger.exception('email transport failed. rows=%s', len(rows))
+            results = {row.id: f'{e.__class__.__name__}: {e}' for row in rows}
+        send_elapsed = time.perf_counter() - start
+        
+        now      = timezone.now()
+        sent_ids = [row.id for row in rows if results.get(row.id, 'no result') is None]
+        if sent_ids:
+            EmailOutbox.objects.filter(pk__in=sent_ids).update(status=EmailOutboxConst.STATUS_SENT, sent_at=now, last_error=None,
+                                                               payload=dict())
+        
+        for row in rows:
+            error = results.get(row.id, 'no result')
+            if error is None:
+                continue
+            
+            if row.attempts >= EmailOutboxConst.MAX_ATTEMPTS:
+                EmailOutbox.objects.filter(pk=row.id).update(status=EmailOutboxConst.STATUS_FAILED, last_error=error,
+                                                             payload=dict())
+                self.failed_count += 1
+                logger.error('email outbox failed. id=%s kind=%s error=%s', row.id, row.kind, error)
+            else:
+                retry_at = now + timedelta(seconds=EmailOutboxConst.RETRY_BASE * 2 ** (row.attempts - 1))
+                EmailOutbox.objects.filter(pk=row.id).update(next_attempt_at=retry_at, last_error=error)
+                self.retry_count += 1
+        
+        self.batch_count        += 1
+        self.sent_count         += len(sent_ids)
+        self.send_elapsed       += send_elapsed
+        self.last_batch_latency  = time.perf_counter() - start
+        self.last_send_lag       = max((now - row.created_at).total_seconds() for row in rows)
+        
+        return len(rows)
+    
+    def run(self, poll_interval: float=None, until_empty: bool=False) -> None:
+        """ 발송 대기 row 가 있으면 연속으로 배치 처리, 없으면 poll_interval 대기
+            - until_empty: 발송 대기 row 를 모두 처리하면 종료
+        """
+        poll_interval = poll_interval or EmailOutboxConst.POLL_INTERVAL
+        
+        while True:
+            claimed = self.process_batch()
+            if claimed < self.batch_size:
+                if until_empty:
+                    return
+                time.sleep(poll_interval)
+
+
+email_outbox_query = EmailOutboxQuery()
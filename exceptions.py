@@ -0,0 +1,49 @@
+class SocialProviderNotFoundException(Exception):
+    """ 등록되지 않은 (또는 설정이 없는) 소셜 로그인 provider """
+    
+    def __init__(self, provider: str=None):
+        super().__init__(f'지원하지 않는 소셜 로그인 provider 입니다. ({provider})')
+
+
+class SocialEmailNotVerifiedException(Exception):
+    """ provider 가 인증되지 않았다고 응답한 이메일 (계정 생성 / 연결에 사용하지 않음) """
+    
+    def __init__(self, provider: str=None):
+        super().__init__(f'소셜 계정의 이메일 인증이 필요합니다. ({provider})')
+
+
+class SocialTokenInvalidException(Exception):
+    """ 우리 앱에 발급되지 않은 (다른 앱의) 또는 유효하지 않은 소셜 access token """
+    
+    def __init__(self, provider: str=None):
+        super().__init__(f'유효하지 않은 소셜 로그인 토큰 입니다. ({provider})')
+
+
+class UserImportTooLargeException(Exception):
+    """ HTTP 대량 가입 요청 row 수가 한도를 넘음 (import_users 커맨드로 처리) """
+    
+    def __init__(self, max_rows: int=None):
+        self.max_rows = max_rows
+        super().__init__(f'한 번에 {max_rows} 건까지 가입할 수 있습니다. 대량 이관은 import_users 커맨드를 사용해 주세요.')
+
+
+class SignInFailedException(Exception):
+    """ 로그인 실패. 가입 여부 / 탈퇴 여부 / 비밀번호 불일치를 구분하지 않음 (계정 존재 여부 노출 방지) """
+    
+    def __init__(self):
+        super().__init__('이메일 또는 비밀번호가 일치하지 않습니다.')
+
+
+class TokenInvalidException(Exception):
+    """ 만료 / 위조 / 폐기된 토큰 """
+    
+    def __init__(self, reason: str=None):
+        super().__init__(f'유효하지 않은 토큰 입니다. ({reason})' if reason else '유효하지 않은 토큰 입니다.')
+
+
+class RateLimitExceededException(Exception):
+    """ 요청 횟수 제한 초과 또는 로그인 실패 누적으로 잠금 """
+    
+    def __init__(self, retry_after: int=None):
+        self.retry_after = retry_after
+        super().__init__('요청이 너무 많습니다. 잠시 후 다시 시도해 주세요.')
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from account.archive             import UserArchiver
+
+
+class Command(BaseCommand):
+    help = '탈퇴 후 보관 기간이 지난 유저를 users_archive 로 이동 (cron 등으로 주기 실행)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None, help='보관 기간 (일)')
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--batch-sleep', type=float, default=None, help='배치 사이 대기 (초)')
+        parser.add_argument('--max-batches', type=int, default=None)
+        parser.add_argument('--dry-run', action='store_true', help='대상 유저 수만 출력')
+    
+    def handle(self, *args, **options):
+        archiver = UserArchiver(retention_days=options['days'], batch_size=options['batch_size'],
+                                batch_sleep=options['batch_sleep'])
+        
+        if options['dry_run']:
+            self.stdout.write(f'candidates: {archiver.count_candidates()}')
+            return
+        
+        archiver.run(max_batches=options['max_batches'])
+        self.stdout.write(str(archiver.metrics()))
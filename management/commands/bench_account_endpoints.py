@@ -0,0 +1,202 @@
+import itertools
+import json
+import statistics
+import subprocess
+import threading
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db                   import connection, connections
+from django.test                 import override_settings
+from rest_framework.test         import APIRequestFactory
+
+from account.const               import BenchConst
+from account.enums               import AccountTypeEnum, SocialSignUpTypeEnum
+from account.metrics             import request_metrics
+from account.models              import User
+from account.passwords           import password_manager
+from account.social.fake_kakao   import fake_kakao
+from account.views               import social_login_view
+from account.views.user_views    import UserViewSet
+
+
+class Command(BaseCommand):
+    help = ('account 엔드포인트 부하 테스트. 유저 N명 seed 후 엔드포인트별 동시 요청으로 p50/p95/p99, 처리량, 요청당 쿼리 수 측정. '
+            '--output 으로 JSON 저장, --baseline 과 비교하여 악화 시 실패. 데이터를 남기므로 벤치 전용 DB 에서 실행')
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='seed 유저 수 (1k ~ 10M)')
+        parser.add_argument('--requests', type=int, default=1000, help='엔드포인트별 요청 수')
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--endpoints', default=','.join(BenchConst.ENDPOINTS))
+        parser.add_argument('--kakao-latency', type=float, default=0.0, help='fake 카카오 서버 응답 지연 (초)')
+        parser.add_argument('--output', default=None, help='결과 JSON 파일 경로')
+        parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON 파일 경로')
+        parser.add_argument('--threshold', type=float, default=BenchConst.REGRESSION_THRESHOLD)
+    
+    def handle(self, *args, **options):
+        endpoints = [name.strip() for name in options['endpoints'].split(',') if name.strip()]
+        unknown   = set(endpoints) - set(BenchConst.ENDPOINTS)
+        if unknown:
+            raise CommandError(f'unknown endpoints: {", ".join(sorted(unknown))}')
+        
+        self.seed(options['users'])
+        self.user_ids = list(User.objects.filter(email__startswith='bench-')
+                                         .values_list('id', flat=True)[:BenchConst.SAMPLE_IDS])
+        self.factory  = APIRequestFactory()
+        self.run_id   = uuid.uuid4().hex[:6]
+        
+        results = dict()
+        with fake_kakao(options['kakao_latency']) as host:
+            self.stdout.write(f'fake kakao server: {host}')
+            with override_settings(ACCOUNT_RATE_LIMIT_ENABLED=False, ACCOUNT_METRICS_ENABLED=True):
+                for endpoint in endpoints:
+                    results[endpoint] = self.run_endpoint(endpoint, options['requests'], options['concurrency'], options['users'])
+                    self.stdout.write(f'{endpoint:<12} {results[endpoint]}')
+        
+        report = {
+            'meta'   : {
+                'commit'     : self.git_commit(),
+                'timestamp'  : int(time.time()),
+                'db_vendor'  : connection.vendor,
+                'users'      : options['users'],
+                'requests'   : options['requests'],
+                'concurrency': options['concurrency'],
+            },
+            'results': results,
+        }
+        
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+        
+        if options['baseline']:
+            self.compare(report, options['baseline'], options['threshold'])
+    
+    def seed(self, count: int) -> None:
+        """ bench-{i}@bench.local 유저를 count 명까지 bulk_create (이미 있는 만큼은 건너뜀) """
+        existing = User.all_objects.filter(email__startswith='bench-').count()
+        if existing >= count:
+            return
+        
+        # 해시는 1번만 계산하여 재사용 (seed 시간이 해시 cost 에 묶이지 않도록)
+        password = password_manager.hash(BenchConst.PASSWORD)
+        start    = time.perf_counter()
+        
+        for batch_start in range(existing, count, BenchConst.SEED_BATCH_SIZE):
+            batch_end = min(batch_start + BenchConst.SEED_BATCH_SIZE, count)
+            User.objects.bulk_create([
+                User(
+                    email                 = f'bench-{i}@{BenchConst.EMAIL_DOMAIN}',
+                    password              = password,
+                    account_type_id       = AccountTypeEnum.CONSUMER.value,
+                    social_signup_type_id = SocialSignUpTypeEnum.NO_SOCIAL.value,
+                )
+                for i in range(batch_start, batch_end)
+            ], ignore_conflicts=True)
+        
+        self.stdout.write(f'seeded {count - existing} users in {time.perf_counter() - start:.1f}s')
+    
+    def build_request(self, endpoint: str, i: int, users: int):
+        """ (view, request, kwargs) """
+        if endpoint == 'sign_in':
+            data = {'email': f'bench-{i % users}@{BenchConst.EMAIL_DOMAIN}', 'password': BenchConst.PASSWORD,
+                    'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value}
+            return UserViewSet.as_view({'post': 'sign_in'}), self.factory.post('/sign-in/', data, format='json'), {}
+        
+        if endpoint == 'create':
+            data = {'email': f'new-{self.run_id}-{i}@{BenchConst.EMAIL_DOMAIN}', 'password': BenchConst.PASSWORD,
+                    'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value}
+            return UserViewSet.as_view({'post': 'create'}), self.factory.post('/', data, format='json'), {}
+        
+        if endpoint == 'retrieve':
+            pk = self.user_ids[i % len(self.user_ids)]
+            return UserViewSet.as_view({'get': 'retrieve'}), self.factory.get(f'/{pk}/'), {'pk': pk}
+        
+        if endpoint == 'list':
+            return UserViewSet.as_view({'get': 'list'}, admin_permission_classes=[]), self.factory.get('/'), {}
+        
+        # 카카오 원스텝 로그인: 코드마다 다른 유저 (처음 1번은 가입, 이후 로그인)
+        request = self.factory.post('/social/kakao/login/', {'code': f'{self.run_id}{i % users}'}, format='json')
+        return social_login_view.social_login, request, {'provider': 'kakao'}
+    
+    def run_endpoint(self, endpoint: str, count: int, concurrency: int, users: int) -> dict:
+        latencies, queries, errors = list(), list(), [0]
+        counter, lock = itertools.count(), threading.Lock()
+        
+        def worker():
+            try:
+                while True:
+                    i = next(counter)
+                    if i >= count:
+                        return
+                    
+                    view, request, kwargs = self.build_request(endpoint, i, users)
+                    start = time.perf_counter()
+                    with request_metrics.track(endpoint) as trace:
+                        response = view(request, **kwargs)
+                    elapsed = time.perf_counter() - start
+                    
+                    with lock:
+                        latencies.append(elapsed)
+                        queries.append(trace.db_count)
+                        if response.status_code >= 400:
+                            errors[0] += 1
+            finally:
+                connections.close_all()
+        
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        start   = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - start
+        
+        latencies.sort()
+        return {
+            'count'              : len(latencies),
+            'errors'             : errors[0],
+            'p50_ms'             : round(self.percentile(latencies, 50) * 1000, 3),
+            'p95_ms'             : round(self.percentile(latencies, 95) * 1000, 3),
+            'p99_ms'             : round(self.percentile(latencies, 99) * 1000, 3),
+            'mean_ms'            : round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+            'throughput_rps'     : round(len(latencies) / wall, 1) if wall else 0.0,
+            'queries_per_request': round(sum(queries) / len(queries), 2) if queries else 0.0,
+        }
+    
+    def percentile(self, sorted_values: list, pct: float) -> float:
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+        return sorted_values[index]
+    
+    def git_commit(self):
+        try:
+            return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                  timeout=5).stdout.strip() or None
+        except (OSError, subprocess.SubprocessError):
+            return None
+    
+    def compare(self, report: dict, baseline_path: str, threshold: float) -> None:
+        """ baseline 대비 p95 증가 / 처리량 감소가 threshold 를 넘거나 요청당 쿼리 수가 늘면 실패 """
+        with open(baseline_path, encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+        
+        regressions = list()
+        for endpoint, current in report['results'].items():
+            before = baseline.get(endpoint)
+            if before is None:
+                continue
+            
+            if before['p95_ms'] and current['p95_ms'] > before['p95_ms'] * (1 + threshold):
+                regressions.append(f'{endpoint} p95 {before["p95_ms"]}ms -> {current["p95_ms"]}ms')
+            if before['throughput_rps'] and current['throughput_rps'] < before['throughput_rps'] * (1 - threshold):
+                regressions.append(f'{endpoint} throughput {before["throughput_rps"]} -> {current["throughput_rps"]} rps')
+            if current['queries_per_request'] > before['queries_per_request']:
+                regressions.append(f'{endpoint} queries/request {before["queries_per_request"]} -> {current["queries_per_request"]}')
+        
+        if regressions:
+            raise CommandError('regression against baseline:\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS(f'no regression against {baseline_path} (threshold {threshold:.0%})'))
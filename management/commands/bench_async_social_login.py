@@ -0,0 +1,148 @@
+import asyncio
+import resource
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+
+from concurrent.futures          import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db                   import connections
+from django.test                 import AsyncRequestFactory, override_settings
+from rest_framework.test         import APIRequestFactory
+
+from account.social.fake_kakao   import fake_kakao
+from account.social.registry     import provider_registry
+from account.views               import async_views, social_login_view
+
+
+class Command(BaseCommand):
+    help = ('카카오 원스텝 로그인 동시 요청 벤치마크 (fake 카카오 서버, upstream 지연 흉내). '
+            'async 뷰 (asyncio.gather) / sync 뷰 (스레드 풀) 의 처리량, p50/p95, 최대 메모리, 최대 스레드 수 비교. '
+            'ru_maxrss 는 프로세스 최대값이므로 모드별로 따로 실행 권장. 유저를 생성하므로 벤치 전용 DB 에서 실행')
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--mode', choices=['async', 'sync', 'both'], default='both')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=1000, help='동시 in-flight 요청 수')
+        parser.add_argument('--kakao-latency', type=float, default=0.1, help='fake 카카오 서버 응답 지연 (초)')
+        parser.add_argument('--pool-size', type=int, default=None, help='provider HTTP 커넥션 풀 크기 (기본: concurrency)')
+        parser.add_argument('--tracemalloc', action='store_true', help='Python 힙 최대 사용량 측정 (측정 비용 있음)')
+    
+    def handle(self, *args, **options):
+        modes = ['async', 'sync'] if options['mode'] == 'both' else [options['mode']]
+        
+        # 기본 풀 크기 (SocialHttpConst.POOL_SIZE) 로는 동시 요청이 풀 대기로 직렬화되므로 concurrency 에 맞춤
+        pool_size = options['pool_size'] or options['concurrency']
+        provider_registry.http_client.pool_size       = pool_size
+        provider_registry.async_http_client.pool_size = pool_size
+        provider_registry.http_client.close()
+        
+        with fake_kakao(options['kakao_latency']) as host:
+            self.stdout.write(f'fake kakao server: {host} (latency {options["kakao_latency"]}s, pool {pool_size})')
+            with override_settings(ACCOUNT_RATE_LIMIT_ENABLED=False):
+                for mode in modes:
+                    result = self.run_mode(mode, options['requests'], options['concurrency'], options['tracemalloc'])
+                    self.stdout.write(f'{mode:<6} {result}')
+    
+    def run_mode(self, mode: str, count: int, concurrency: int, trace_memory: bool) -> dict:
+        run_id  = uuid.uuid4().hex[:6]
+        sampler = ThreadCountSampler()
+        
+        if trace_memory:
+            tracemalloc.start()
+        sampler.start()
+        
+        start = time.perf_counter()
+        if mode == 'async':
+            latencies, errors = asyncio.run(self.run_async(run_id, count, concurrency))
+        else:
+            latencies, errors = self.run_sync(run_id, count, concurrency)
+        wall = time.perf_counter() - start
+        
+        sampler.stop()
+        heap_peak = None
+        if trace_memory:
+            heap_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        
+        latencies.sort()
+        return {
+            'count'         : len(latencies),
+            'errors'        : errors,
+            'p50_ms'        : round(self.percentile(latencies, 50) * 1000, 3),
+            'p95_ms'        : round(self.percentile(latencies, 95) * 1000, 3),
+            'mean_ms'       : round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+            'throughput_rps': round(len(latencies) / wall, 1) if wall else 0.0,
+            'peak_threads'  : sampler.peak,
+            'max_rss_mb'    : self.max_rss_mb(),
+            'heap_peak_mb'  : round(heap_peak / 1024 / 1024, 1) if heap_peak is not None else None,
+        }
+    
+    async def run_async(self, run_id: str, count: int, concurrency: int):
+        factory   = AsyncRequestFactory()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def one(i: int):
+            async with semaphore:
+                request  = factory.post('/social/kakao/login/', {'code': f'{run_id}{i}'}, content_type='application/json')
+                start    = time.perf_counter()
+                response = await async_views.social_login(request, provider='kakao')
+                return time.perf_counter() - start, response.status_code
+        
+        results = await asyncio.gather(*(one(i) for i in range(count)))
+        await provider_registry.async_http_client.aclose()
+        
+        return [latency for latency, _ in results], sum(1 for _, status_code in results if status_code >= 400)
+    
+    def run_sync(self, run_id: str, count: int, concurrency: int):
+        factory = APIRequestFactory()
+        
+        def one(i: int):
+            try:
+                request  = factory.post('/social/kakao/login/', {'code': f'{run_id}{i}'}, format='json')
+                start    = time.perf_counter()
+                response = social_login_view.social_login(request, provider='kakao')
+                return time.perf_counter() - start, response.status_code
+            finally:
+                connections.close_all()
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(one, range(count)))
+        
+        return [latency for latency, _ in results], sum(1 for _, status_code in results if status_code >= 400)
+    
+    def percentile(self, sorted_values: list, pct: float) -> float:
+        if not sorted_values:
+            return 0.0
+        index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+        return sorted_values[index]
+    
+    def max_rss_mb(self) -> float:
+        # Linux 는 KB, macOS 는 byte 단위
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class ThreadCountSampler:
+    """ 벤치마크 동안 프로세스 스레드 수 최대값 샘플링 (sync_to_async executor / fake 서버 스레드 포함) """
+    
+    def __init__(self, interval: float=0.01):
+        self.interval = interval
+        self.peak     = threading.active_count()
+        self._stop    = threading.Event()
+        self._thread  = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, threading.active_count())
+    
+    def start(self):
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
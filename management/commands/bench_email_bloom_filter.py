@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base      import BaseCommand
+
+from account.cache.email_bloom_filter import BloomBits
+from account.const                    import UserCacheConst
+
+
+class Command(BaseCommand):
+    help = '가입 이메일 bloom filter 크기 / 실측 오탐률 / 조회 시간 측정 (DB 접근 없음, 합성 이메일 사용)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--emails', type=int, default=1000000, help='가입된 이메일 수')
+        parser.add_argument('--lookups', type=int, default=100000, help='가입되지 않은 이메일 조회 수')
+        parser.add_argument('--error-rate', type=float, default=UserCacheConst.EMAIL_BLOOM_ERROR_RATE)
+    
+    def handle(self, *args, **options):
+        count = options['emails']
+        bits  = BloomBits(count * UserCacheConst.EMAIL_BLOOM_GROWTH, options['error_rate'])
+        
+        start = time.perf_counter()
+        for i in range(count):
+            bits.add(f'member-{i}@class101.net')
+        build = time.perf_counter() - start
+        
+        lookups = options['lookups']
+        start   = time.perf_counter()
+        hits    = sum(1 for i in range(lookups) if f'new-{i}@class101.net' in bits)
+        lookup  = time.perf_counter() - start
+        
+        self.stdout.write(
+            f'emails={count} size={bits.size / 8 / 1024 / 1024:.1f}MiB hash_count={bits.hash_count} '
+            f'build={build:.2f}s lookup={lookup / lookups * 1e6:.2f}us '
+            f'false_positive_rate={hits / lookups:.4f} (target {options["error_rate"]}, '
+            f'{UserCacheConst.EMAIL_BLOOM_GROWTH}x capacity)'
+        )
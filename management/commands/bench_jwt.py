@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from account.tokens              import token_manager
+
+
+class Command(BaseCommand):
+    help = '요청 1건당 JWT 검증 비용 측정 (서명 검증 + 폐기 목록 조회, DB 접근 없음)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100000)
+    
+    def handle(self, *args, **options):
+        count        = options['requests']
+        access_token = token_manager.issue(user_id=1)['access_token']
+        
+        # 측정 중 폐기 목록 동기화 쿼리가 섞이지 않도록 먼저 동기화
+        token_manager.revocations.sync()
+        
+        start = time.perf_counter()
+        for _ in range(count):
+            token_manager.verify(access_token)
+        elapsed = time.perf_counter() - start
+        
+        self.stdout.write(
+            f'algorithm={token_manager.key_ring.algorithm} requests={count} '
+            f'verify={elapsed / count * 1e6:.1f}us/request throughput={count / elapsed:.0f}/s'
+        )
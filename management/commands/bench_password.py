@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.const               import PasswordConst
+from account.passwords           import build_hasher, HASHER_CLASSES
+
+
+class Command(BaseCommand):
+    help = '해시 알고리즘 / cost 별 비밀번호 검증 처리량 (코어 1개 기준 logins/sec) 측정'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--algorithm', default=PasswordConst.DEFAULT_ALGORITHM, choices=list(HASHER_CLASSES.keys()))
+        parser.add_argument('--costs', type=int, nargs='+', required=True,
+                            help='pbkdf2: iterations, argon2: time_cost, bcrypt: rounds (예: --costs 100000 260000 600000)')
+        parser.add_argument('--duration', type=float, default=2.0, help='cost 별 측정 시간 (초)')
+    
+    def handle(self, *args, **options):
+        algorithm = options['algorithm']
+        
+        for cost in options['costs']:
+            try:
+                hasher  = build_hasher(algorithm, cost)
+                encoded = hasher.encode('bench-password', hasher.salt())
+            except ValueError as e:
+                raise CommandError(str(e))
+            
+            count = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < options['duration']:
+                hasher.verify('bench-password', encoded)
+                count += 1
+            elapsed = time.perf_counter() - start
+            
+            self.stdout.write(
+                f'{algorithm} cost={cost:>8} '
+                f'verify={elapsed / count * 1000:8.2f}ms '
+                f'logins/sec/core={count / elapsed:8.1f}'
+            )
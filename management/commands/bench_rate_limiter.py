@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.const               import RateLimitConst
+from account.throttling          import rate_limiter
+
+
+class Command(BaseCommand):
+    help = 'sign-in 요청 1건당 rate limiter 오버헤드 측정. OVERHEAD_BUDGET_US 초과 시 실패'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=20000)
+        parser.add_argument('--budget-us', type=float, default=RateLimitConst.OVERHEAD_BUDGET_US)
+    
+    def handle(self, *args, **options):
+        count = options['requests']
+        
+        # sign_in 성공 경로와 같은 호출 (ip / email 제한, 잠금 확인, 실패 초기화). 제한에 걸리지 않도록 identity 분산
+        start = time.perf_counter()
+        for i in range(count):
+            ip    = f'10.0.{i % 256}.{i // 256 % 256}'
+            email = f'bench{i}@class101.net'
+            rate_limiter.hit('sign_in_ip', ip)
+            rate_limiter.hit('sign_in_email', email)
+            rate_limiter.check_lockout(email)
+            rate_limiter.reset_failures(email)
+        elapsed = time.perf_counter() - start
+        
+        per_request = elapsed / count * 1e6
+        self.stdout.write(f'backend={rate_limiter.backend.__class__.__name__} overhead={per_request:.1f}us/request')
+        
+        if per_request > options['budget_us']:
+            raise CommandError(f'overhead {per_request:.1f}us exceeds budget {options["budget_us"]}us')
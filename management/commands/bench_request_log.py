@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from account.request_log         import request_logger
+from common.const                import AppNameConst, MethodNameConst
+
+
+class Command(BaseCommand):
+    help = '뷰 진입 요청 로그 1건당 요청 스레드 비용 측정 (샘플링 / 큐 적용 후)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=20000)
+    
+    def handle(self, *args, **options):
+        count   = options['requests']
+        payload = {'email': 'bench@class101.net', 'password': 'secret-password', 'social_signup_type': 0}
+        
+        for method_name in (MethodNameConst.SIGN_IN, MethodNameConst.CREATE):
+            start = time.perf_counter()
+            for _ in range(count):
+                request_logger.print_log(app_name=AppNameConst.ACCOUNT, method_name=method_name, request_data=payload, class_=self)
+            elapsed = time.perf_counter() - start
+            
+            rate = request_logger.sample_rates.get(method_name, 1.0)
+            self.stdout.write(f'{method_name}: sample_rate={rate} {elapsed / count * 1e6:.2f}us/request')
+        
+        request_logger.stop()
+        self.stdout.write(str(request_logger.metrics()))
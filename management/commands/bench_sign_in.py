@@ -0,0 +1,58 @@
+from django.core.management.base  import BaseCommand
+from django.db                    import connection, transaction
+from django.test.utils            import CaptureQueriesContext
+
+from account.enums                import AccountTypeEnum, SocialSignUpTypeEnum
+from account.models               import User, AccountTypes, SocialSignUpType
+from account.query_orm.user_query import UserDatabaseQuery
+from common.util_date             import TimeUtils
+
+
+class Command(BaseCommand):
+    help = '로그인 1회당 쿼리 수 비교 (기존 exists/first/save 경로 vs get_sign_in_user/F-expression 경로)'
+    
+    BENCH_EMAIL = 'bench-sign-in@class101.net'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=100, help='측정할 로그인 횟수')
+    
+    def handle(self, *args, **options):
+        logins     = options['logins']
+        user_query = UserDatabaseQuery()
+        
+        # 측정용 데이터는 롤백하여 남기지 않음
+        with transaction.atomic():
+            AccountTypes.objects.get_or_create(id=AccountTypeEnum.CONSUMER.value, defaults={'name': AccountTypeEnum.CONSUMER.name})
+            SocialSignUpType.objects.get_or_create(id=SocialSignUpTypeEnum.NO_SOCIAL.value, defaults={'name': SocialSignUpTypeEnum.NO_SOCIAL.name})
+            User.objects.create(
+                email                 = self.BENCH_EMAIL,
+                password              = 'bench',
+                account_type_id       = AccountTypeEnum.CONSUMER.value,
+                social_signup_type_id = SocialSignUpTypeEnum.NO_SOCIAL.value,
+            )
+            
+            with CaptureQueriesContext(connection) as before:
+                for _ in range(logins):
+                    self.legacy_sign_in(user_query)
+            
+            with CaptureQueriesContext(connection) as after:
+                for _ in range(logins):
+                    user_obj = user_query.get_sign_in_user(email=self.BENCH_EMAIL)
+                    user_query.increase_login_count(user=user_obj, present_time=TimeUtils.get_today())
+            
+            transaction.set_rollback(True)
+        
+        self.stdout.write(f'logins            : {logins}')
+        self.stdout.write(f'before (queries)  : {len(before.captured_queries)} ({len(before.captured_queries) / logins:.2f}/login)')
+        self.stdout.write(f'after  (queries)  : {len(after.captured_queries)} ({len(after.captured_queries) / logins:.2f}/login)')
+    
+    def legacy_sign_in(self, user_query: UserDatabaseQuery):
+        """ 기존 sign_in 경로: exists() -> first() -> save(update_fields=...) """
+        user = user_query.get_user_by_email(email=self.BENCH_EMAIL)
+        if not user.exists():
+            return
+        
+        user_obj: User = user.first()
+        user_obj.login_count    += 1
+        user_obj.last_login_date = TimeUtils.get_today()
+        user_obj.save(update_fields=['login_count', 'last_login_date'])
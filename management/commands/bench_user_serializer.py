@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base          import BaseCommand
+
+from account.enums                        import AccountTypeEnum, SocialSignUpTypeEnum
+from account.models                       import User, AccountTypes, SocialSignUpType
+from account.serializers.user_serializers import UserInfoSerializer, UserInfoProjection
+
+
+class Command(BaseCommand):
+    help = '유저 1명당 직렬화 비용 비교 (UserInfoSerializer vs UserInfoProjection). DB 접근 없이 메모리 인스턴스로 측정'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, nargs='+', default=[1000, 100000], help='직렬화할 유저 수 (여러 개 지정 가능)')
+    
+    def handle(self, *args, **options):
+        account_type       = AccountTypes(id=AccountTypeEnum.CONSUMER.value)
+        social_signup_type = SocialSignUpType(id=SocialSignUpTypeEnum.KAKAO.value)
+        
+        for count in options['users']:
+            users = [
+                User(id=i, email=f'user{i}@class101.net', login_count=i, is_deleted=False,
+                     account_type=account_type, social_signup_type=social_signup_type)
+                for i in range(count)
+            ]
+            
+            start = time.perf_counter()
+            UserInfoSerializer(users, many=True).data
+            serializer_elapsed = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            [UserInfoProjection.from_instance(user) for user in users]
+            projection_elapsed = time.perf_counter() - start
+            
+            self.stdout.write(
+                f'users={count:>7} '
+                f'serializer={serializer_elapsed / count * 1e6:8.2f}us/obj '
+                f'projection={projection_elapsed / count * 1e6:8.2f}us/obj '
+                f'speedup={serializer_elapsed / projection_elapsed:6.1f}x'
+            )
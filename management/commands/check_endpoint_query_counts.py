@@ -0,0 +1,73 @@
+from django.core.management.base      import BaseCommand, CommandError
+from django.db                        import transaction
+from django.test                      import override_settings
+from rest_framework.test              import APIRequestFactory
+
+from account.const                    import RequestMetricsConst
+from account.enums                    import AccountTypeEnum, SocialSignUpTypeEnum
+from account.metrics                  import request_metrics
+from account.models                   import User
+from account.passwords                import password_manager
+from account.views.user_views         import UserViewSet
+
+
+class Command(BaseCommand):
+    help = ('account 엔드포인트를 직접 호출하여 request_metrics 가 집계한 쿼리 수를 QUERY_BUDGETS 와 비교. '
+            '초과 시 실패 (트랜잭션 롤백으로 데이터는 남지 않음)')
+    
+    SAMPLE_EMAIL = 'query-count-check@class101.net'
+    SAMPLE_PASS  = 'query-count-check'
+    
+    class Rollback(Exception):
+        pass
+    
+    def get_requests(self, user: User) -> list:
+        """ (action, view, request, kwargs) """
+        factory = APIRequestFactory()
+        
+        return [
+            ('sign_in', UserViewSet.as_view({'post': 'sign_in'}),
+             factory.post('/sign-in/', {'email': self.SAMPLE_EMAIL, 'password': self.SAMPLE_PASS,
+                                        'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value}, format='json'), {}),
+            ('create', UserViewSet.as_view({'post': 'create'}),
+             factory.post('/', {'email': 'new-' + self.SAMPLE_EMAIL, 'password': self.SAMPLE_PASS,
+                                'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value}, format='json'), {}),
+            ('retrieve', UserViewSet.as_view({'get': 'retrieve'}), factory.get(f'/{user.pk}/'), {'pk': user.pk}),
+            ('list', UserViewSet.as_view({'get': 'list'}, admin_permission_classes=[]), factory.get('/'), {}),
+        ]
+    
+    @override_settings(ACCOUNT_METRICS_ENABLED=True, ACCOUNT_SIGN_IN_CACHE_ENABLED=False,
+                       ACCOUNT_LOGIN_STAT_BUFFER_ENABLED=False, ACCOUNT_RATE_LIMIT_ENABLED=False)
+    def handle(self, *args, **options):
+        failures = list()
+        
+        try:
+            with transaction.atomic():
+                user = User.objects.create(
+                    email                 = self.SAMPLE_EMAIL,
+                    password              = password_manager.hash(self.SAMPLE_PASS),
+                    login_count           = 0,
+                    account_type_id       = AccountTypeEnum.CONSUMER.value,
+                    social_signup_type_id = SocialSignUpTypeEnum.NO_SOCIAL.value,
+                )
+                
+                for action, view, request, kwargs in self.get_requests(user):
+                    with request_metrics.track(action) as trace:
+                        response = view(request, **kwargs)
+                    
+                    budget = RequestMetricsConst.QUERY_BUDGETS[action]
+                    line   = f'{action}: status={response.status_code} queries={trace.db_count} budget={budget}'
+                    
+                    if response.status_code >= 400 or trace.db_count > budget:
+                        failures.append(action)
+                        self.stdout.write(self.style.ERROR(f'[FAIL] {line}'))
+                    else:
+                        self.stdout.write(self.style.SUCCESS(f'[OK] {line}'))
+                
+                raise self.Rollback
+            
+        except self.Rollback:
+            pass
+        
+        if failures:
+            raise CommandError(f'query budget exceeded: {", ".join(failures)}')
@@ -0,0 +1,140 @@
+from collections                     import Counter
+from contextlib                      import ExitStack, contextmanager
+
+from django.conf                     import settings
+from django.core.management.base     import BaseCommand, CommandError
+from django.db                       import connections
+from django.test                     import override_settings
+from rest_framework.test             import APIRequestFactory
+
+from account.db_router               import AccountReplicaRouter, replica_selector
+from account.enums                   import AccountTypeEnum, SocialSignUpTypeEnum
+from account.models                  import User
+from account.passwords               import password_manager
+from account.query_orm.user_query    import UserDatabaseQuery
+from account.views.user_views        import UserViewSet
+
+
+class Command(BaseCommand):
+    help = ('읽기 replica 라우팅 확인. weighted round-robin 분배, 조회 전용 액션의 replica 사용, '
+            '요청 내 쓰기 / lag 허용 시간 (쿠키) 동안의 primary 고정을 실제 쿼리가 실행된 DB alias 로 검사. '
+            '로컬에서는 SQLite 파일 2개로 확인: DATABASES = {"default": primary.sqlite3, "replica": replica.sqlite3}, '
+            'ACCOUNT_DB_REPLICAS = {"replica": 1}, DATABASE_ROUTERS = ["account.db_router.AccountReplicaRouter"] '
+            '후 두 DB 모두 migrate')
+    
+    SAMPLE_EMAIL = 'replica-routing-check@class101.net'
+    SAMPLE_PASS  = 'replica-routing-check'
+    
+    @override_settings(ACCOUNT_SIGN_IN_CACHE_ENABLED=False, ACCOUNT_LOGIN_STAT_BUFFER_ENABLED=False,
+                       ACCOUNT_RATE_LIMIT_ENABLED=False)
+    def handle(self, *args, **options):
+        replicas = replica_selector.replicas
+        if not replicas:
+            raise CommandError('settings.ACCOUNT_DB_REPLICAS is empty')
+        if not any(router == 'account.db_router.AccountReplicaRouter' or isinstance(router, AccountReplicaRouter)
+                   for router in getattr(settings, 'DATABASE_ROUTERS', [])):
+            raise CommandError('account.db_router.AccountReplicaRouter is not in settings.DATABASE_ROUTERS')
+        
+        self.primary    = replica_selector.primary
+        self.user_query = UserDatabaseQuery()
+        self.factory    = APIRequestFactory()
+        self.failures   = list()
+        
+        self.check_weights(replicas)
+        
+        User.all_objects.filter(email=self.SAMPLE_EMAIL).delete()
+        try:
+            self.check_routes(replicas)
+        finally:
+            User.all_objects.filter(email=self.SAMPLE_EMAIL).delete()
+        
+        if self.failures:
+            raise CommandError('replica routing check failed:\n' + '\n'.join(self.failures))
+        self.stdout.write(self.style.SUCCESS('replica routing ok'))
+    
+    def check(self, name: str, ok: bool, detail: str) -> None:
+        self.stdout.write(f'{"ok  " if ok else "FAIL"} {name}: {detail}')
+        if not ok:
+            self.failures.append(f'{name}: {detail}')
+    
+    def check_weights(self, replicas: dict) -> None:
+        """ 가중치 합 x 100 회 조회 시 alias 별 횟수가 가중치 비율과 정확히 일치 """
+        rounds = sum(replicas.values()) * 100
+        with replica_selector.scope():
+            counts = Counter(replica_selector.read_alias() for _ in range(rounds))
+        
+        expected = {alias: weight * 100 for alias, weight in replicas.items()}
+        self.check('weighted round-robin', dict(counts) == expected, f'{dict(counts)} (expected {expected})')
+    
+    @contextmanager
+    def capture_aliases(self):
+        """ 블록 안에서 쿼리가 실행된 DB alias 목록 """
+        aliases = list()
+        
+        def recorder(alias):
+            def wrapper(execute, sql, params, many, context):
+                aliases.append(alias)
+                return execute(sql, params, many, context)
+            return wrapper
+        
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder(alias)))
+            yield aliases
+    
+    def run_view(self, actions: dict, request, **kwargs) -> list:
+        with self.capture_aliases() as aliases:
+            # 관리자 권한 조회 (primary) 는 라우팅 확인 대상이 아니므로 제외
+            response = UserViewSet.as_view(actions, admin_permission_classes=[])(request, **kwargs)
+        if response.status_code >= 400:
+            self.failures.append(f'{actions}: status {response.status_code}')
+        return aliases
+    
+    def check_routes(self, replicas: dict) -> None:
+        replica_aliases = set(replicas)
+        
+        # 요청 scope 밖 (관리 명령 / 워커): 쓰기 여부를 알 수 없으므로 primary
+        with self.capture_aliases() as aliases:
+            self.user_query.check_user_alive(email=self.SAMPLE_EMAIL)
+        self.check('outside request scope', set(aliases) == {self.primary}, f'{aliases}')
+        
+        # 조회 전용 액션은 replica
+        with replica_selector.scope():
+            aliases = self.run_view({'get': 'list'}, self.factory.get('/'))
+        self.check('list on replica', bool(aliases) and set(aliases) <= replica_aliases, f'{aliases}')
+        
+        with replica_selector.scope():
+            with self.capture_aliases() as aliases:
+                self.user_query.check_user_email(email=self.SAMPLE_EMAIL)
+                self.user_query.check_user_alive(email=self.SAMPLE_EMAIL)
+        self.check('check_user_email / check_user_alive on replica', bool(aliases) and set(aliases) <= replica_aliases, f'{aliases}')
+        
+        # 요청 내 쓰기 이후 조회는 primary + 고정 쿠키 대상
+        with replica_selector.scope() as state:
+            with self.capture_aliases() as aliases:
+                user = User.objects.create(
+                    email                 = self.SAMPLE_EMAIL,
+                    password              = password_manager.hash(self.SAMPLE_PASS),
+                    account_type_id       = AccountTypeEnum.CONSUMER.value,
+                    social_signup_type_id = SocialSignUpTypeEnum.NO_SOCIAL.value,
+                )
+                alive = self.user_query.check_user_alive(email=self.SAMPLE_EMAIL)
+        self.check('read-after-write on primary', set(aliases) == {self.primary} and alive and state.written, f'{aliases} alive={alive}')
+        
+        # 로그인은 조회 / 쓰기 모두 primary
+        with replica_selector.scope():
+            request = self.factory.post('/sign-in/', {'email': self.SAMPLE_EMAIL, 'password': self.SAMPLE_PASS,
+                                                      'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value}, format='json')
+            aliases = self.run_view({'post': 'sign_in'}, request)
+        self.check('sign_in on primary', bool(aliases) and set(aliases) == {self.primary}, f'{aliases}')
+        
+        # lag 허용 시간 안 (쿠키로 고정된 다음 요청) 조회는 primary
+        with replica_selector.scope(pinned=True):
+            aliases = self.run_view({'get': 'retrieve'}, self.factory.get(f'/{user.pk}/'), pk=user.pk)
+        self.check('retrieve within lag window on primary', bool(aliases) and set(aliases) == {self.primary}, f'{aliases}')
+        
+        # 고정 시간이 지난 요청은 replica (복제가 없는 로컬 SQLite 에서는 방금 만든 유저가 보이지 않음)
+        with replica_selector.scope():
+            with self.capture_aliases() as aliases:
+                alive = self.user_query.check_user_alive(email=self.SAMPLE_EMAIL)
+        self.check('read after lag window on replica', bool(aliases) and set(aliases) <= replica_aliases, f'{aliases} alive={alive}')
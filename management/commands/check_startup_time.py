@@ -0,0 +1,142 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from collections                 import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.const               import StartupConst
+
+# 자식 프로세스 (콜드 스타트) 에서 실행. importtime 은 stderr, 측정 결과는 stdout 의 RESULT_PREFIX 줄 (JSON)
+# - argv: sign-in 경로, default DB NAME 대체 값 (테스트 DB 등, 빈 값이면 설정 그대로)
+# - 요청 제한을 끄고 요청을 롤백되는 트랜잭션 안에서 실행 (대상 DB / 캐시에 실패 기록 / 잠금 상태를 남기지 않음)
+RESULT_PREFIX = 'startup-result: '
+CHILD_SCRIPT = '''
+import json, sys, time
+process_start = time.perf_counter()
+
+import django
+setup_start = time.perf_counter()
+django.setup()
+setup_end = time.perf_counter()
+
+from django.conf import settings
+from django.db import transaction
+from django.test import Client
+from django.urls import reverse
+
+path = sys.argv[1] or reverse('user-viewset-sign-in')
+if sys.argv[2]:
+    settings.DATABASES['default']['NAME'] = sys.argv[2]
+settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+settings.ACCOUNT_RATE_LIMIT_ENABLED = False
+modules_before = set(sys.modules)
+
+request_start = time.perf_counter()
+with transaction.atomic():
+    response = Client().post(path, {'email': 'startup-check@class101.net', 'password': 'startup-check',
+                                    'social_signup_type': 0}, content_type='application/json')
+    transaction.set_rollback(True)
+request_end = time.perf_counter()
+
+print('startup-result: ' + json.dumps({
+    'import_django_s'  : setup_start - process_start,
+    'setup_s'          : setup_end - setup_start,
+    'first_sign_in_s'  : request_end - request_start,
+    'status_code'      : response.status_code,
+    'modules'          : sorted(sys.modules),
+    'request_modules'  : sorted(set(sys.modules) - modules_before),
+}))
+'''
+
+
+class Command(BaseCommand):
+    help = ('콜드 스타트 측정. 새 프로세스에서 django.setup() 후 첫 sign-in 요청 (URLconf / 뷰 import 포함) 까지의 시간을 '
+            'FIRST_SIGN_IN_BUDGET 과 비교 (초과 시 실패). python -X importtime 으로 import 비용 상위 모듈 / 패키지, '
+            '첫 요청에서 import 된 모듈, LAZY_MODULES 로드 여부를 함께 출력')
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='콜드 스타트 반복 횟수 (중앙값 사용)')
+        parser.add_argument('--path', default='', help='sign-in URL (기본: reverse("user-viewset-sign-in"))')
+        parser.add_argument('--database-name', default='', help='default DB NAME 대체 (테스트 DB 등)')
+        parser.add_argument('--budget', type=float, default=StartupConst.FIRST_SIGN_IN_BUDGET, help='초')
+        parser.add_argument('--top', type=int, default=StartupConst.TOP_IMPORTS)
+    
+    def handle(self, *args, **options):
+        runs = [self.run_child(options['path'], options['database_name']) for _ in range(options['runs'])]
+        
+        for key in ('import_django_s', 'setup_s', 'first_sign_in_s'):
+            values = [result[key] for result in runs]
+            self.stdout.write(f'{key:<16} median={statistics.median(values) * 1000:.1f}ms '
+                              f'min={min(values) * 1000:.1f}ms max={max(values) * 1000:.1f}ms')
+        
+        last = runs[-1]
+        self.write_import_profile(last, options['top'])
+        
+        loaded = [name for name in StartupConst.LAZY_MODULES if name in last['modules']]
+        self.stdout.write(f'lazy modules loaded by first sign-in: {", ".join(loaded) or "none"}')
+        
+        statuses = {result['status_code'] for result in runs}
+        if any(status_code >= 500 for status_code in statuses):
+            raise CommandError(f'sign-in failed: status {sorted(statuses)}')
+        
+        first_sign_in = statistics.median([result['first_sign_in_s'] for result in runs])
+        if first_sign_in > options['budget']:
+            raise CommandError(f'first sign-in {first_sign_in * 1000:.1f}ms exceeds budget {options["budget"] * 1000:.0f}ms')
+        self.stdout.write(self.style.SUCCESS(
+            f'first sign-in {first_sign_in * 1000:.1f}ms within budget {options["budget"] * 1000:.0f}ms'
+        ))
+    
+    def run_child(self, path: str, database_name: str='') -> dict:
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(entry for entry in sys.path if entry)
+        
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD_SCRIPT, path, database_name],
+                                   capture_output=True, text=True, env=env)
+        if completed.returncode != 0:
+            raise CommandError(f'startup child failed:\n{completed.stderr[-4000:]}')
+        
+        lines  = [line for line in completed.stdout.splitlines() if line.startswith(RESULT_PREFIX)]
+        if not lines:
+            raise CommandError(f'startup child printed no result:\n{completed.stdout[-4000:]}')
+        
+        result = json.loads(lines[-1][len(RESULT_PREFIX):])
+        result['imports'] = self.parse_importtime(completed.stderr)
+        return result
+    
+    def parse_importtime(self, stderr: str) -> list:
+        """ 'import time: self [us] | cumulative | imported package' -> [(module, self_us, cumulative_us, depth)] """
+        imports = list()
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'imported package' in line:
+                continue
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            module = name.strip()
+            depth  = (len(name) - len(name.lstrip()) - 1) // 2
+            imports.append((module, int(self_us), int(cumulative_us), depth))
+        return imports
+    
+    def write_import_profile(self, result: dict, top: int) -> None:
+        imports = result['imports']
+        
+        self.stdout.write(f'\ntop {top} imports by cumulative time (top-level only)')
+        for module, _, cumulative_us, _ in sorted((item for item in imports if item[3] == 0), key=lambda item: -item[2])[:top]:
+            self.stdout.write(f'  {cumulative_us / 1000:8.1f}ms  {module}')
+        
+        by_package = defaultdict(int)
+        for module, self_us, _, _ in imports:
+            by_package[module.split('.')[0]] += self_us
+        
+        self.stdout.write(f'\ntop {top} packages by self time')
+        for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+            self.stdout.write(f'  {self_us / 1000:8.1f}ms  {package}')
+        
+        request_modules = set(result['request_modules'])
+        request_us      = sum(self_us for module, self_us, _, _ in imports if module in request_modules)
+        account_modules = sorted(module for module in request_modules if module.startswith('account.'))
+        
+        self.stdout.write(f'\nimported during first sign-in: {len(request_modules)} modules, {request_us / 1000:.1f}ms')
+        self.stdout.write(f'  account: {", ".join(account_modules) or "none"}')
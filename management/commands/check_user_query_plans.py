@@ -0,0 +1,58 @@
+from django.core.management.base   import BaseCommand, CommandError
+from django.db                     import connection, transaction
+from django.test                   import override_settings
+
+from account.enums                 import AccountTypeEnum, SocialSignUpTypeEnum
+from account.models                import User
+from account.management.query_plan import QueryPlanInspector, user_query_calls
+
+
+class Command(BaseCommand):
+    help = ('UserDatabaseQuery 메소드 (및 목록 / 아카이브 조회) 를 실제로 호출하여 실행된 쿼리의 실행 계획(EXPLAIN) 을 확인, '
+            'users 테이블 full scan 이 있으면 실패 (SQLite / PostgreSQL, 트랜잭션 롤백으로 데이터는 남지 않음)')
+    
+    SAMPLE_EMAIL = 'plan-check@class101.net'
+    
+    class Rollback(Exception):
+        pass
+    
+    @override_settings(ACCOUNT_SIGN_IN_CACHE_ENABLED=False, ACCOUNT_EMAIL_BLOOM_ENABLED=False,
+                       ACCOUNT_LOGIN_STAT_BUFFER_ENABLED=False, ACCOUNT_DB_REPLICAS={})
+    def handle(self, *args, **options):
+        inspector = QueryPlanInspector()
+        if not inspector.supported:
+            raise CommandError(f'{connection.vendor} is not supported')
+        
+        failures = list()
+        
+        try:
+            with transaction.atomic():
+                user = User.objects.create(
+                    email                 = self.SAMPLE_EMAIL,
+                    password              = 'plan-check',
+                    account_type_id       = AccountTypeEnum.CONSUMER.value,
+                    social_signup_type_id = SocialSignUpTypeEnum.NO_SOCIAL.value,
+                )
+                
+                for name, call in user_query_calls(user).items():
+                    with inspector.capture() as queries:
+                        call()
+                    
+                    seq_scans = inspector.seq_scans(queries)
+                    if not queries:
+                        failures.append(name)
+                        self.stdout.write(self.style.ERROR(f'[NO QUERY] {name}'))
+                    elif seq_scans:
+                        failures.append(name)
+                        for sql, plan in seq_scans:
+                            self.stdout.write(self.style.ERROR(f'[SEQ SCAN] {name}\n{sql}\n{plan}'))
+                    else:
+                        self.stdout.write(self.style.SUCCESS(f'[OK] {name} ({len(queries)} queries)'))
+                
+                raise self.Rollback
+                
+        except self.Rollback:
+            pass
+        
+        if failures:
+            raise CommandError(f'query plan check failed: {", ".join(failures)}')
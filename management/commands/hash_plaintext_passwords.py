@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+from django.db.models            import Q
+
+from account.const               import PasswordConst
+from account.models              import User
+from account.passwords           import HASHER_CLASSES, password_manager
+
+
+class Command(BaseCommand):
+    help = ('해싱 도입 이전 평문 비밀번호를 현재 설정 hasher 로 일괄 해시 '
+            '(ACCOUNT_PLAINTEXT_PASSWORD_UNTIL 이전에 실행, 중단 후 다시 실행해도 됨)')
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PasswordConst.PLAINTEXT_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='대상 유저 수만 출력')
+    
+    def handle(self, *args, **options):
+        candidates = self.get_candidates()
+        
+        if options['dry_run']:
+            self.stdout.write(f'candidates: {candidates.count()}')
+            return
+        
+        last_pk, hashed = 0, 0
+        while True:
+            rows = list(candidates.filter(pk__gt=last_pk).order_by('pk').values_list('pk', 'password')[:options['batch_size']])
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+            
+            rows = [(pk, password) for pk, password in rows if not password_manager.is_hashed(password)]
+            for (pk, password), encoded in zip(rows, password_manager.hash_many([password for _, password in rows])):
+                # 조회 이후 비밀번호가 바뀐 (로그인 재해시 등) row 는 건너뜀
+                hashed += User.all_objects.filter(pk=pk, password=password).update(password=encoded)
+        
+        self.stdout.write(f'hashed: {hashed}')
+    
+    def get_candidates(self):
+        """ 해시 형식 ('<algorithm>$...') 이 아닌 비밀번호를 가진 유저 (탈퇴 유저 포함) """
+        hashed = Q()
+        for algorithm in HASHER_CLASSES:
+            hashed |= Q(password__startswith=f'{algorithm}$')
+        
+        return User.all_objects.filter(password__isnull=False).exclude(hashed)
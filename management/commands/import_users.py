@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from account.bulk_import         import UserBulkImporter
+from account.const               import UserImportConst
+
+
+class Command(BaseCommand):
+    help = '파트너 플랫폼 유저 대량 가입 (NDJSON / CSV). 결과와 처리량(rows/s) 출력'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="입력 파일 경로 ('-' 이면 stdin)")
+        parser.add_argument('--format', dest='data_format', choices=[UserImportConst.FORMAT_CSV, UserImportConst.FORMAT_NDJSON],
+                            default=None, help='생략 시 확장자로 판단')
+        parser.add_argument('--chunk-size', type=int, default=UserImportConst.CHUNK_SIZE)
+    
+    def handle(self, *args, **options):
+        path        = options['path']
+        data_format = options['data_format']
+        
+        if data_format is None:
+            data_format = UserImportConst.FORMAT_CSV if path.endswith('.csv') else UserImportConst.FORMAT_NDJSON
+        
+        importer = UserBulkImporter(chunk_size=options['chunk_size'])
+        
+        if path == '-':
+            import sys
+            result = importer.run(sys.stdin, data_format)
+        else:
+            try:
+                with open(path, encoding='utf-8', newline='') as f:
+                    result = importer.run(f, data_format)
+            except OSError as e:
+                raise CommandError(str(e))
+        
+        for error in result.errors:
+            self.stderr.write(f"line {error['line']}: {error['email']} - {error['error']}")
+        
+        self.stdout.write(
+            f'total={result.total} created={result.created} errors={result.error_count} '
+            f'elapsed={result.elapsed:.2f}s throughput={result.rows_per_sec:.1f} rows/s'
+        )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from account.tokens              import token_manager
+
+
+class Command(BaseCommand):
+    help = '만료된 폐기 토큰 (revoked_tokens) row 삭제 (cron 등으로 주기 실행)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None)
+    
+    def handle(self, *args, **options):
+        deleted = token_manager.prune_revoked(batch_size=options['batch_size'])
+        self.stdout.write(f'deleted: {deleted}')
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from account.const               import EmailOutboxConst
+from account.email_outbox        import EmailOutboxWorker, build_transport
+
+
+class Command(BaseCommand):
+    help = '가입 메일 outbox 발송 워커. 여러 프로세스를 동시에 띄워도 됨'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--transport', choices=[EmailOutboxConst.TRANSPORT_FILE, EmailOutboxConst.TRANSPORT_SMTP,
+                                                    EmailOutboxConst.TRANSPORT_SENDGRID], default=None)
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--poll-interval', type=float, default=EmailOutboxConst.POLL_INTERVAL)
+        parser.add_argument('--until-empty', action='store_true', help='발송 대기 메일을 모두 보내면 종료')
+        parser.add_argument('--metrics-interval', type=float, default=60, help='metrics 출력 주기 (초)')
+    
+    def handle(self, *args, **options):
+        worker = EmailOutboxWorker(transport=build_transport(options['transport']), batch_size=options['batch_size'])
+        
+        if options['until_empty']:
+            worker.run(until_empty=True)
+            self.stdout.write(str(worker.metrics()))
+            return
+        
+        last_report = time.monotonic()
+        try:
+            while True:
+                if worker.process_batch() < worker.batch_size:
+                    time.sleep(options['poll_interval'])
+                
+                if time.monotonic() - last_report >= options['metrics_interval']:
+                    self.stdout.write(str(worker.metrics()))
+                    last_report = time.monotonic()
+                    
+        except KeyboardInterrupt:
+            self.stdout.write(str(worker.metrics()))
@@ -0,0 +1,103 @@
+import re
+
+from contextlib                   import contextmanager
+from typing                       import Callable, Dict, List, Tuple
+
+from django.db                    import connections
+from django.utils                 import timezone
+from rest_framework.pagination    import Cursor
+from rest_framework.test          import APIRequestFactory
+
+from account.archive              import UserArchiver
+from account.models               import User
+from account.pagination           import UserCursorPagination
+from account.query_orm.user_query import UserDatabaseQuery
+from account.views.user_views     import UserViewSet
+
+
+class QueryPlanInspector:
+    """ 실제 실행된 users 쿼리를 캡처하여 EXPLAIN 으로 full scan 여부 확인 (SQLite / PostgreSQL)
+        - check_user_query_plans 커맨드 / 테스트 전용 (뷰 / rest_framework.test 를 import 하므로 query_orm 등 런타임 코드에서 import 하지 않음)
+        - capture() 블록 안에서 실행된 users 테이블 SELECT / UPDATE / DELETE 의 (sql, params) 기록
+        - seq_scans() : users 테이블 full scan 계획인 쿼리 [(sql, plan)]
+        - PostgreSQL 은 데이터가 적으면 인덱스가 있어도 seq scan 을 고르므로 enable_seqscan = off 후 확인
+          (SET LOCAL 이므로 트랜잭션 안에서 사용)
+    """
+    
+    SEQ_SCAN_PATTERNS = {
+        'sqlite'    : re.compile(r'\bSCAN users\b'),
+        'postgresql': re.compile(r'Seq Scan on users\b'),
+    }
+    EXPLAIN_PREFIXES = {
+        'sqlite'    : 'EXPLAIN QUERY PLAN ',
+        'postgresql': 'EXPLAIN ',
+    }
+    STATEMENTS = ('SELECT', 'UPDATE', 'DELETE')
+    
+    def __init__(self, using: str='default'):
+        self.connection = connections[using]
+        self.queries    = list()  # [(sql, params)]
+    
+    @property
+    def supported(self) -> bool:
+        return self.connection.vendor in self.SEQ_SCAN_PATTERNS
+    
+    @contextmanager
+    def capture(self):
+        """ 블록 안에서 실행된 users 쿼리 목록 (이 블록 것만) """
+        queries = list()
+        
+        def wrapper(execute, sql, params, many, context):
+            if not many and '"users"' in sql and sql.lstrip().upper().startswith(self.STATEMENTS):
+                queries.append((sql, params))
+            return execute(sql, params, many, context)
+        
+        with self.connection.execute_wrapper(wrapper):
+            yield queries
+        self.queries.extend(queries)
+    
+    def explain(self, sql: str, params) -> str:
+        with self.connection.cursor() as cursor:
+            if self.connection.vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(self.EXPLAIN_PREFIXES[self.connection.vendor] + sql, params)
+            rows = cursor.fetchall()
+        return '\n'.join(' '.join(str(column) for column in row) for row in rows)
+    
+    def seq_scans(self, queries: List[Tuple[str, tuple]]=None) -> List[Tuple[str, str]]:
+        pattern = self.SEQ_SCAN_PATTERNS[self.connection.vendor]
+        result  = list()
+        for sql, params in (self.queries if queries is None else queries):
+            plan = self.explain(sql, params)
+            if pattern.search(plan):
+                result.append((sql, plan))
+        return result
+
+
+def user_query_calls(user: User) -> Dict[str, Callable]:
+    """ 실행 계획 검사 대상. UserDatabaseQuery 메소드 / 뷰 / 아카이브를 실제로 호출 (쿼리를 따로 만들지 않음)
+        - 유저를 수정하는 호출 (update / soft delete) 은 마지막에 두고 트랜잭션 롤백 안에서 실행
+        - 로그인 캐시 / bloom filter / login stat 버퍼가 켜져 있으면 쿼리가 생략되므로 끈 상태에서 호출
+    """
+    user_query = UserDatabaseQuery()
+    now        = timezone.now()
+    list_view  = UserViewSet.as_view({'get': 'list'}, admin_permission_classes=[])
+    
+    # 두 번째 이후 페이지 (id > cursor) 요청 URL
+    paginator          = UserCursorPagination()
+    paginator.base_url = '/'
+    list_url           = paginator.encode_cursor(Cursor(offset=0, reverse=False, position=str(user.pk - 1)))
+    
+    return {
+        'get_user_by_email'   : lambda: list(user_query.get_user_by_email(email=user.email)),
+        'check_user_email'    : lambda: user_query.check_user_email(email=user.email),
+        'get_email_is_deleted': lambda: user_query.get_email_is_deleted(email=user.email, use_bloom_filter=False),
+        'check_user_alive'    : lambda: user_query.check_user_alive(email=user.email),
+        'check_user_admin'    : lambda: user_query.check_user_admin(user_id=user.pk),
+        'get_sign_in_user'    : lambda: user_query.get_sign_in_user(email=user.email),
+        'list (cursor)'       : lambda: list_view(APIRequestFactory().get(list_url)),
+        'archive_candidates'  : lambda: UserArchiver().count_candidates(),
+        'increase_login_count': lambda: user_query.increase_login_count(user=user, present_time=now),
+        'update_password'     : lambda: user_query.update_password(user=user, encoded_password=user.password),
+        'soft_delete_user'    : lambda: user_query.soft_delete_user(user_id=user.pk, present_time=now),
+    }
@@ -0,0 +1,273 @@
+import contextvars
+import logging
+import threading
+import time
+
+from bisect                 import bisect_left
+from contextlib             import ExitStack, contextmanager
+from typing                 import Dict, List, Optional, Tuple
+
+from asgiref.sync           import iscoroutinefunction, markcoroutinefunction
+
+from django.conf            import settings
+from django.db              import connections
+
+from account.const          import RequestMetricsConst
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """ Prometheus histogram (label 값별 bucket 카운트 / 합계) """
+    
+    def __init__(self, name: str, documentation: str, buckets: tuple, label: str='action'):
+        self.name          = name
+        self.documentation = documentation
+        self.buckets       = tuple(buckets)
+        self.label         = label
+        
+        self._lock   = threading.Lock()
+        self._series = dict()  # label 값 -> [bucket 카운트..., +Inf 카운트, 합계]
+    
+    def observe(self, label_value: str, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1]    += value
+    
+    def snapshot(self) -> Dict[str, Tuple[List[int], float]]:
+        """ label 값 -> (누적 bucket 카운트 (+Inf 포함), 합계) """
+        with self._lock:
+            series = {label_value: list(values) for label_value, values in self._series.items()}
+        
+        result = dict()
+        for label_value, values in series.items():
+            cumulative, total = list(), 0
+            for count in values[:-1]:
+                total += count
+                cumulative.append(total)
+            result[label_value] = (cumulative, values[-1])
+        return result
+    
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for label_value, (cumulative, total) in sorted(self.snapshot().items()):
+            label_value = escape_label_value(label_value)
+            for bound, count in zip(self.buckets + ('+Inf',), cumulative):
+                lines.append(f'{self.name}_bucket{{{self.label}="{label_value}",le="{bound}"}} {count}')
+            lines.append(f'{self.name}_sum{{{self.label}="{label_value}"}} {total}')
+            lines.append(f'{self.name}_count{{{self.label}="{label_value}"}} {cumulative[-1]}')
+        return lines
+
+
+class RequestTrace:
+    """ 요청 1건의 DB / 외부 HTTP 계측 값 """
+    
+    __slots__ = ('action', 'db_count', 'db_time', 'http_count', 'http_time', 'items')
+    
+    def __init__(self, action: Optional[str], collect_items: bool=False):
+        self.action     = action
+        self.db_count   = 0
+        self.db_time    = 0.0
+        self.http_count = 0
+        self.http_time  = 0.0
+        self.items      = list() if collect_items else None  # slow trace 용 (종류, 내용, 소요 시간)
+    
+    def add_item(self, kind: str, detail: str, elapsed: float) -> None:
+        if self.items is not None and len(self.items) < RequestMetricsConst.SLOW_TRACE_MAX_ITEMS:
+            self.items.append((kind, detail[:300], round(elapsed, 6)))
+
+
+def escape_label_value(value: str) -> str:
+    """ Prometheus label 값 escape (역슬래시, 큰따옴표, 줄바꿈) """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+_current_trace = contextvars.ContextVar('account_request_trace', default=None)
+
+
+class RequestMetrics:
+    """ 액션별 요청 시간 / DB 쿼리 수, 시간 / 외부 HTTP 시간 계측
+        - AccountMetricsMiddleware 가 account 앱 뷰 요청마다 track() 으로 감쌈
+        - DB 는 connection.execute_wrapper, HTTP 는 SocialHttpClient 에서 record_http() 호출로 집계
+        - 값은 프로세스 메모리 histogram 에 누적하고 render() 로 Prometheus text 형식 출력
+        - settings.ACCOUNT_METRICS_ENABLED            : False 면 계측하지 않음 (기본 True)
+        - settings.ACCOUNT_METRICS_SLOW_TRACE_ENABLED : True 면 SLOW_REQUEST_SECONDS 이상 걸린 요청의 쿼리 / HTTP 목록을 경고 로그로 남김
+    """
+    
+    def __init__(self):
+        self.duration = Histogram('account_request_duration_seconds', 'account view wall time',
+                                  RequestMetricsConst.DURATION_BUCKETS)
+        self.db_queries = Histogram('account_request_db_queries', 'SQL queries per request',
+                                    RequestMetricsConst.QUERY_COUNT_BUCKETS)
+        self.db_duration = Histogram('account_request_db_duration_seconds', 'SQL time per request',
+                                     RequestMetricsConst.DURATION_BUCKETS)
+        self.http_duration = Histogram('account_request_http_duration_seconds', 'outbound HTTP time per request',
+                                       RequestMetricsConst.DURATION_BUCKETS)
+        self.slow_requests = dict()  # action -> count
+    
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'ACCOUNT_METRICS_ENABLED', True)
+    
+    @property
+    def slow_trace_enabled(self) -> bool:
+        return getattr(settings, 'ACCOUNT_METRICS_SLOW_TRACE_ENABLED', False)
+    
+    @property
+    def slow_request_seconds(self) -> float:
+        return getattr(settings, 'ACCOUNT_METRICS_SLOW_REQUEST_SECONDS', RequestMetricsConst.SLOW_REQUEST_SECONDS)
+    
+    @contextmanager
+    def track(self, action: Optional[str]=None):
+        """ 요청 1건 계측. with 블록 안의 쿼리 / HTTP 호출을 action 으로 집계
+            - action 을 블록 안에서 정할 수 있도록 trace.action 을 나중에 설정해도 됨. 끝까지 None 이면 집계하지 않음
+        """
+        if not self.enabled:
+            yield None
+            return
+        
+        trace = RequestTrace(action, collect_items=self.slow_trace_enabled)
+        token = _current_trace.set(trace)
+        start = time.perf_counter()
+        
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(self._db_wrapper))
+                yield trace
+        finally:
+            elapsed = time.perf_counter() - start
+            _current_trace.reset(token)
+            if trace.action is not None:
+                self.observe(trace, elapsed)
+    
+    def observe(self, trace: RequestTrace, elapsed: float) -> None:
+        self.duration.observe(trace.action, elapsed)
+        self.db_queries.observe(trace.action, trace.db_count)
+        self.db_duration.observe(trace.action, trace.db_time)
+        self.http_duration.observe(trace.action, trace.http_time)
+        
+        if elapsed >= self.slow_request_seconds:
+            self.slow_requests[trace.action] = self.slow_requests.get(trace.action, 0) + 1
+            if trace.items is not None:
+                logger.warning('slow request action=%s elapsed=%.3f db=%s/%.3f http=%s/%.3f items=%s',
+                               trace.action, elapsed, trace.db_count, trace.db_time,
+                               trace.http_count, trace.http_time, trace.items)
+    
+    def _db_wrapper(self, execute, sql, params, many, context):
+        trace = _current_trace.get()
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            if trace is not None:
+                elapsed = time.perf_counter() - start
+                trace.db_count += 1
+                trace.db_time  += elapsed
+                trace.add_item('sql', sql, elapsed)
+    
+    def record_http(self, method: str, url: str, elapsed: float) -> None:
+        """ 외부 HTTP 호출 1회 기록 (요청 계측 중이 아니면 무시) """
+        trace = _current_trace.get()
+        if trace is None:
+            return
+        trace.http_count += 1
+        trace.http_time  += elapsed
+        trace.add_item('http', f'{method} {url.split("?", 1)[0]}', elapsed)
+    
+    def render(self, extra: Optional[Dict[str, dict]]=None) -> str:
+        """ Prometheus text exposition format
+            - extra: {prefix: metrics dict} 숫자 값은 gauge 로 함께 출력 (login_stat_recorder.metrics() 등)
+        """
+        lines = list()
+        for histogram in (self.duration, self.db_queries, self.db_duration, self.http_duration):
+            lines.extend(histogram.render())
+        
+        lines.append('# HELP account_slow_requests_total requests slower than the slow request threshold')
+        lines.append('# TYPE account_slow_requests_total counter')
+        for action, count in sorted(self.slow_requests.items()):
+            lines.append(f'account_slow_requests_total{{action="{escape_label_value(action)}"}} {count}')
+        
+        for prefix, values in (extra or {}).items():
+            for key, value in values.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f'# TYPE account_{prefix}_{key} gauge')
+                    lines.append(f'account_{prefix}_{key} {value}')
+        
+        return '\n'.join(lines) + '\n'
+
+
+def resolve_action(request, view_func, view_kwargs: dict) -> Optional[str]:
+    """ account 앱 뷰면 계측용 action 이름, 아니면 None
+        - ViewSet: 액션 이름 (sign_in, create, retrieve, list ...)
+        - 함수 뷰: 함수 이름 + provider (social_login:kakao). 등록되지 않은 provider 는 unknown
+          (URL 의 임의 값으로 series 가 늘어나지 않도록)
+    """
+    view_class = getattr(view_func, 'cls', None) or view_func
+    if not view_class.__module__.startswith('account.'):
+        return None
+    
+    actions = getattr(view_func, 'actions', None)
+    if actions:
+        return actions.get(request.method.lower(), request.method.lower())
+    
+    # social.http_client 가 이 모듈을 import 하므로 호출 시점에 import
+    from account.social.registry import provider_registry
+    
+    action = view_class.__name__
+    if 'provider' in view_kwargs:
+        provider = str(view_kwargs['provider']).lower()
+        action   = f'{action}:{provider if provider in provider_registry.names else "unknown"}'
+    return action
+
+
+class AccountMetricsMiddleware:
+    """ account 앱 뷰 요청을 request_metrics.track() 으로 계측
+        - settings.MIDDLEWARE 의 마지막에 'account.metrics.AccountMetricsMiddleware' 추가
+        - get_response 구간을 계측하고 process_view 에서는 action 만 정함
+          (뷰는 Django 가 호출하므로 뒤 미들웨어의 process_view / process_exception, ATOMIC_REQUESTS 가 그대로 적용)
+        - account 앱 뷰가 아니면 (action 이 정해지지 않으면) 집계하지 않음
+        - StreamingHttpResponse 는 본문 생성 시간 제외
+        - ASGI 에서는 async 로 동작하여 async 뷰를 스레드로 옮기지 않음
+    """
+    
+    sync_capable  = True
+    async_capable = True
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async     = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+            self.process_view = self.aprocess_view
+    
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        with request_metrics.track():
+            return self.get_response(request)
+    
+    async def __acall__(self, request):
+        with request_metrics.track():
+            return await self.get_response(request)
+    
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        self.set_action(request, view_func, view_kwargs)
+        return None
+    
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        self.set_action(request, view_func, view_kwargs)
+        return None
+    
+    @staticmethod
+    def set_action(request, view_func, view_kwargs: dict) -> None:
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.action = resolve_action(request, view_func, view_kwargs)
+
+
+request_metrics = RequestMetrics()
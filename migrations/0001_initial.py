@@ -0,0 +1,66 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountTypes',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(choices=[(0, 'ADMIN'), (1, 'CREATOR'), (2, 'CONSUMER')], primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=10)),
+                ('created_at', models.DateTimeField(auto_now=True, verbose_name='생성일')),
+            ],
+            options={
+                'db_table': 'account_types',
+            },
+        ),
+        migrations.CreateModel(
+            name='SocialSignUpType',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(choices=[(0, 'NO_SOCIAL'), (1, 'KAKAO'), (2, 'NAVER'), (3, 'FACEBOOK'), (4, 'GOOGLE'), (5, 'APPLE')], primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=50)),
+                ('created_at', models.DateTimeField(auto_now=True, verbose_name='생성일')),
+            ],
+            options={
+                'db_table': 'social_signup_types',
+            },
+        ),
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('jti', models.CharField(max_length=64, null=True, verbose_name='토큰 ID')),
+                ('user_id', models.BigIntegerField(null=True, verbose_name='유저 ID')),
+                ('revoked_at', models.DateTimeField(verbose_name='폐기일')),
+                ('expires_at', models.DateTimeField(verbose_name='토큰 만료일')),
+            ],
+            options={
+                'db_table': 'revoked_tokens',
+            },
+        ),
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('email', models.EmailField(max_length=30, unique=True, verbose_name='이메일')),
+                ('password', models.CharField(max_length=128, null=True, verbose_name='비밀번호')),
+                ('login_count', models.IntegerField(default=0, verbose_name='로그인 횟숫')),
+                ('last_login_date', models.DateTimeField(null=True, verbose_name='최신 로그인 날짜')),
+                ('is_deleted', models.BooleanField(default=False, verbose_name='탈퇴여부')),
+                ('created_at', models.DateTimeField(auto_now=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now_add=True, verbose_name='수정일')),
+                ('account_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user', to='account.accounttypes')),
+                ('social_signup_type', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='user', to='account.socialsignuptype')),
+            ],
+            options={
+                'db_table': 'users',
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_user_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_verified_at',
+            field=models.DateTimeField(null=True, verbose_name='이메일 인증일'),
+        ),
+        migrations.CreateModel(
+            name='EmailOutbox',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(max_length=30, verbose_name='메일 종류')),
+                ('idempotency_key', models.CharField(max_length=100, unique=True, verbose_name='중복 발송 방지 키')),
+                ('to_email', models.EmailField(max_length=254, verbose_name='수신 이메일')),
+                ('payload', models.JSONField(default=dict, verbose_name='본문 데이터')),
+                ('status', models.PositiveSmallIntegerField(choices=[(0, 'PENDING'), (1, 'SENT'), (2, 'FAILED')], default=0, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='발송 시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='다음 발송 시도일')),
+                ('last_error', models.TextField(null=True, verbose_name='마지막 에러')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('sent_at', models.DateTimeField(null=True, verbose_name='발송일')),
+            ],
+            options={
+                'db_table': 'email_outbox',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='emailoutbox',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='email_outbox_pending_idx'),
+        ),
+        migrations.CreateModel(
+            name='EmailVerificationToken',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('token_hash', models.CharField(max_length=64, unique=True, verbose_name='토큰 해시')),
+                ('expires_at', models.DateTimeField(verbose_name='만료일')),
+                ('used_at', models.DateTimeField(null=True, verbose_name='사용일')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='email_verification_tokens', to='account.user')),
+            ],
+            options={
+                'db_table': 'email_verification_tokens',
+            },
+        ),
+    ]
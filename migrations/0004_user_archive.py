@@ -0,0 +1,48 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_email_outbox'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='user',
+            options={'default_manager_name': 'all_objects'},
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='deleted_at',
+            field=models.DateTimeField(null=True, verbose_name='탈퇴일'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_deleted', True)), fields=['deleted_at'], name='users_deleted_at_idx'),
+        ),
+        migrations.CreateModel(
+            name='UserArchive',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False, verbose_name='유저 ID')),
+                ('email', models.EmailField(max_length=30, verbose_name='이메일')),
+                ('password', models.CharField(max_length=128, null=True, verbose_name='비밀번호')),
+                ('login_count', models.IntegerField(default=0, verbose_name='로그인 횟숫')),
+                ('last_login_date', models.DateTimeField(null=True, verbose_name='최신 로그인 날짜')),
+                ('email_verified_at', models.DateTimeField(null=True, verbose_name='이메일 인증일')),
+                ('account_type_id', models.PositiveSmallIntegerField(verbose_name='계정 타입')),
+                ('social_signup_type_id', models.PositiveSmallIntegerField(null=True, verbose_name='소셜 가입 타입')),
+                ('created_at', models.DateTimeField(null=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(null=True, verbose_name='수정일')),
+                ('deleted_at', models.DateTimeField(null=True, verbose_name='탈퇴일')),
+                ('archived_at', models.DateTimeField(verbose_name='아카이브일')),
+            ],
+            options={
+                'db_table': 'users_archive',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='userarchive',
+            index=models.Index(fields=['email'], name='users_archive_email_idx'),
+        ),
+    ]
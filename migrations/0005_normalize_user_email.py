@@ -0,0 +1,62 @@
+import unicodedata
+
+from django.db import migrations
+from django.db.models.functions import Lower
+
+BATCH_SIZE = 1000
+
+
+def normalize(email):
+    # account.utils.normalize_email 과 같은 기준 (마이그레이션은 앱 코드 변경에 영향받지 않도록 복사)
+    return unicodedata.normalize('NFKC', email).strip().lower()
+
+
+def normalize_user_emails(apps, schema_editor):
+    """ normalize_email 이전에 저장된 이메일을 NFKC + strip + 소문자로 (pk 순서 BATCH_SIZE 단위)
+        - 정규화 결과가 다른 유저 이메일과 같아지는 row 는 (users_email_lower_uniq 위반) 그대로 두고 pk 를 출력
+    """
+    User    = apps.get_model('account', 'User')
+    users   = User._base_manager.using(schema_editor.connection.alias)  # 탈퇴 유저 포함
+    last_pk = 0
+    skipped = list()
+
+    while True:
+        rows = list(users.filter(pk__gt=last_pk).order_by('pk').values_list('pk', 'email')[:BATCH_SIZE])
+        if not rows:
+            break
+        last_pk = rows[-1][0]
+
+        changes = {pk: normalize(email) for pk, email in rows if email is not None and normalize(email) != email}
+        if not changes:
+            continue
+
+        taken = set(
+            users.annotate(email_lower=Lower('email'))
+                 .filter(email_lower__in=set(changes.values()))
+                 .exclude(pk__in=changes.keys())
+                 .values_list('email_lower', flat=True)
+        )
+
+        updates = list()
+        for pk, email in changes.items():
+            if email in taken:
+                skipped.append(pk)
+                continue
+            taken.add(email)
+            updates.append(User(pk=pk, email=email))
+
+        users.bulk_update(updates, ['email'])
+
+    if skipped:
+        print(f'\n  email normalization skipped (duplicate after normalization) user pk: {skipped}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_user_archive'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_user_emails, migrations.RunPython.noop),
+    ]
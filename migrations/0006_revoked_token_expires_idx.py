@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_normalize_user_email'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='revokedtoken',
+            index=models.Index(fields=['expires_at'], name='revoked_tokens_expires_idx'),
+        ),
+    ]
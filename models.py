@@ -1,7 +1,8 @@
-from django.utils  import timezone
-from django.db     import models
+from django.utils               import timezone
+from django.db                  import models
+from django.db.models.functions import Lower
 
-from account.const import UserConst
+from account.const              import UserConst, EmailOutboxConst
 
 
 class AccountTypes(models.Model):
@@ -22,20 +23,120 @@ class SocialSignUpType(models.Model):
         db_table = 'social_signup_types'
 
 
+class LiveUserManager(models.Manager):
+    """ 탈퇴하지 않은 유저만 조회 (User.objects) """
+    
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
 class User(models.Model):
     id                 = models.BigAutoField(primary_key=True)
     email              = models.EmailField(max_length=30, unique=True, verbose_name='이메일')
-    password           = models.CharField(max_length=80, null=True, verbose_name='비밀번호')
+    password           = models.CharField(max_length=128, null=True, verbose_name='비밀번호')
     login_count        = models.IntegerField(default=0, verbose_name='로그인 횟숫')
     last_login_date    = models.DateTimeField(null=True, verbose_name='최신 로그인 날짜')
+    email_verified_at  = models.DateTimeField(null=True, verbose_name='이메일 인증일')
     is_deleted         = models.BooleanField(default=False, verbose_name='탈퇴여부')
+    deleted_at         = models.DateTimeField(null=True, verbose_name='탈퇴일')
     created_at         = models.DateTimeField(auto_now=True, verbose_name='생성일')
     updated_at         = models.DateTimeField(auto_now_add=True, verbose_name='수정일')
     account_type       = models.ForeignKey('account.AccountTypes', on_delete=models.CASCADE, related_name='user')
     social_signup_type = models.ForeignKey('account.SocialSignUpType', null=True, on_delete=models.CASCADE, related_name='user')
     
+    # objects: 탈퇴하지 않은 유저 (기본), all_objects: 탈퇴 유저 포함 (중복 가입 체크, 로그인 시 탈퇴 여부 확인 등)
+    objects     = LiveUserManager()
+    all_objects = models.Manager()
+    
+    class Meta:
+        db_table             = 'users'
+        # admin / serializer UniqueValidator 등 Django 내부는 탈퇴 유저 포함 manager 사용
+        default_manager_name = 'all_objects'
+        constraints          = [
+            # 대소문자만 다른 이메일 중복 가입 방지
+            models.UniqueConstraint(Lower('email'), name='users_email_lower_uniq'),
+        ]
+        indexes              = [
+            # 탈퇴하지 않은 유저 이메일 조회 (check_user_alive, get_queryset)
+            models.Index(fields=['email'], condition=models.Q(is_deleted=False), name='users_live_email_idx'),
+            # 최근 로그인 기간 조회
+            models.Index(fields=['last_login_date'], name='users_last_login_idx'),
+            # 아카이브 대상 (탈퇴 후 보관 기간이 지난 유저) 조회
+            models.Index(fields=['deleted_at'], condition=models.Q(is_deleted=True), name='users_deleted_at_idx'),
+        ]
+
+
+# 탈퇴 후 보관 기간이 지난 유저 (archive_deleted_users 가 users 에서 옮김). FK 없이 id 값만 보관
+class UserArchive(models.Model):
+    id                    = models.BigIntegerField(primary_key=True, verbose_name='유저 ID')
+    email                 = models.EmailField(max_length=30, verbose_name='이메일')
+    password              = models.CharField(max_length=128, null=True, verbose_name='비밀번호')
+    login_count           = models.IntegerField(default=0, verbose_name='로그인 횟숫')
+    last_login_date       = models.DateTimeField(null=True, verbose_name='최신 로그인 날짜')
+    email_verified_at     = models.DateTimeField(null=True, verbose_name='이메일 인증일')
+    account_type_id       = models.PositiveSmallIntegerField(verbose_name='계정 타입')
+    social_signup_type_id = models.PositiveSmallIntegerField(null=True, verbose_name='소셜 가입 타입')
+    created_at            = models.DateTimeField(null=True, verbose_name='생성일')
+    updated_at            = models.DateTimeField(null=True, verbose_name='수정일')
+    deleted_at            = models.DateTimeField(null=True, verbose_name='탈퇴일')
+    archived_at           = models.DateTimeField(verbose_name='아카이브일')
+    
+    class Meta:
+        db_table = 'users_archive'
+        indexes  = [
+            models.Index(fields=['email'], name='users_archive_email_idx'),
+        ]
+
+
+# 폐기된 JWT (로그아웃 / 탈퇴). jti 가 없으면 user_id 의 revoked_at 이전 발급 토큰 전체 폐기
+class RevokedToken(models.Model):
+    id         = models.BigAutoField(primary_key=True)
+    jti        = models.CharField(max_length=64, null=True, verbose_name='토큰 ID')
+    user_id    = models.BigIntegerField(null=True, verbose_name='유저 ID')
+    revoked_at = models.DateTimeField(verbose_name='폐기일')
+    expires_at = models.DateTimeField(verbose_name='토큰 만료일')
+    
+    class Meta:
+        db_table = 'revoked_tokens'
+        indexes  = [
+            # prune_revoked_tokens 의 만료 row 삭제
+            models.Index(fields=['expires_at'], name='revoked_tokens_expires_idx'),
+        ]
+
+
+# 가입 메일 발송 outbox. 가입 트랜잭션에서 INSERT 하고 워커(run_email_worker)가 발송
+class EmailOutbox(models.Model):
+    id              = models.BigAutoField(primary_key=True)
+    kind            = models.CharField(max_length=30, verbose_name='메일 종류')
+    idempotency_key = models.CharField(max_length=100, unique=True, verbose_name='중복 발송 방지 키')
+    to_email        = models.EmailField(max_length=254, verbose_name='수신 이메일')
+    payload         = models.JSONField(default=dict, verbose_name='본문 데이터')
+    status          = models.PositiveSmallIntegerField(default=EmailOutboxConst.STATUS_PENDING, choices=EmailOutboxConst.STATUS, verbose_name='상태')
+    attempts        = models.PositiveSmallIntegerField(default=0, verbose_name='발송 시도 횟수')
+    next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name='다음 발송 시도일')
+    last_error      = models.TextField(null=True, verbose_name='마지막 에러')
+    created_at      = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    sent_at         = models.DateTimeField(null=True, verbose_name='발송일')
+    
+    class Meta:
+        db_table = 'email_outbox'
+        indexes  = [
+            # 워커의 발송 대기 row 조회
+            models.Index(fields=['status', 'next_attempt_at'], name='email_outbox_pending_idx'),
+        ]
+
+
+# 이메일 인증 토큰. 원문 토큰은 메일로만 보내고 DB 에는 sha256 해시만 저장
+class EmailVerificationToken(models.Model):
+    id         = models.BigAutoField(primary_key=True)
+    user       = models.ForeignKey('account.User', on_delete=models.CASCADE, related_name='email_verification_tokens')
+    token_hash = models.CharField(max_length=64, unique=True, verbose_name='토큰 해시')
+    expires_at = models.DateTimeField(verbose_name='만료일')
+    used_at    = models.DateTimeField(null=True, verbose_name='사용일')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    
     class Meta:
-        db_table = 'users'
+        db_table = 'email_verification_tokens'
 
 
 # class Consumer(models.Model):
@@ -0,0 +1,14 @@
+from rest_framework.pagination import CursorPagination
+
+from account.const             import UserListConst
+
+
+class UserCursorPagination(CursorPagination):
+    """ 유저 목록 keyset 페이지네이션
+        - OFFSET 대신 id > cursor 조건으로 PK 인덱스를 타므로 깊은 페이지도 조회 비용이 일정
+        - ?cursor=<next/previous 링크 값>&page_size=<n>
+    """
+    ordering              = 'id'
+    page_size             = UserListConst.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size         = UserListConst.MAX_PAGE_SIZE
@@ -0,0 +1,141 @@
+import asyncio
+import datetime
+import os
+import threading
+
+from concurrent.futures          import ThreadPoolExecutor
+from typing                      import List, Optional, Tuple
+
+from django.conf                 import settings
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher,
+    Argon2PasswordHasher,
+    BCryptSHA256PasswordHasher
+)
+from django.utils.crypto         import constant_time_compare
+from django.utils                import timezone
+
+from account.const               import PasswordConst
+
+
+# 알고리즘별 hasher 클래스와 cost 속성
+HASHER_CLASSES = {
+    PasswordConst.ALGORITHM_PBKDF2: (PBKDF2PasswordHasher, 'iterations'),
+    PasswordConst.ALGORITHM_ARGON2: (Argon2PasswordHasher, 'time_cost'),
+    PasswordConst.ALGORITHM_BCRYPT: (BCryptSHA256PasswordHasher, 'rounds'),
+}
+
+
+def build_hasher(algorithm: str, cost: int=None):
+    """ cost 를 지정한 hasher 인스턴스 생성 (cost 가 None 이면 Django 기본 값)
+        - argon2: argon2-cffi, bcrypt: bcrypt 패키지 필요
+    """
+    hasher_class, cost_attr = HASHER_CLASSES[algorithm]
+    
+    if cost is None:
+        return hasher_class()
+    
+    tuned_class = type(f'Tuned{hasher_class.__name__}', (hasher_class,), {cost_attr: cost})
+    return tuned_class()
+
+
+class PasswordManager:
+    """ 비밀번호 해시 / 검증
+        - settings.ACCOUNT_PASSWORD_HASHER : pbkdf2_sha256(기본) / argon2 / bcrypt_sha256
+        - settings.ACCOUNT_PASSWORD_COST   : pbkdf2 iterations / argon2 time_cost / bcrypt rounds
+        - 알고리즘이나 cost 가 바뀌면 로그인 성공 시 needs_rehash=True 로 알려 재해시
+        - 해시 형식이 아닌 기존 평문 비밀번호도 검증 후 재해시 대상으로 처리
+          - settings.ACCOUNT_PLAINTEXT_PASSWORD_UNTIL 이후에는 평문 비밀번호 검증 실패 (hash_plaintext_passwords 로 일괄 해시)
+        - averify / ahash: 해시 계산을 스레드 풀에서 실행 (hashlib / argon2-cffi / bcrypt 모두 GIL 을 놓음)
+        - hash_many: 대량 가입 chunk 의 비밀번호를 같은 스레드 풀에서 병렬 해시
+    """
+    
+    def __init__(self):
+        self._hasher   = None
+        self._executor = None
+        self._lock     = threading.Lock()
+    
+    @property
+    def hasher(self):
+        if self._hasher is None:
+            self._hasher = build_hasher(
+                getattr(settings, 'ACCOUNT_PASSWORD_HASHER', PasswordConst.DEFAULT_ALGORITHM),
+                getattr(settings, 'ACCOUNT_PASSWORD_COST', None),
+            )
+        return self._hasher
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    pool_size = getattr(settings, 'ACCOUNT_PASSWORD_VERIFY_POOL_SIZE', PasswordConst.VERIFY_POOL_SIZE)
+                    self._executor = ThreadPoolExecutor(max_workers=pool_size or os.cpu_count(),
+                                                        thread_name_prefix='password-verify')
+        return self._executor
+    
+    def reset(self) -> None:
+        """ 설정 변경 후 hasher 재생성 """
+        self._hasher = None
+    
+    def hash(self, raw_password: str) -> str:
+        hasher = self.hasher
+        return hasher.encode(raw_password, hasher.salt())
+    
+    def hash_many(self, raw_passwords: List[str]) -> List[str]:
+        """ hash 를 스레드 풀에서 병렬 실행 (입력 순서 유지) """
+        return list(self.executor.map(self.hash, raw_passwords))
+    
+    def is_hashed(self, encoded: str) -> bool:
+        return self.get_hasher_for(encoded) is not None
+    
+    def allows_plaintext(self) -> bool:
+        until = getattr(settings, 'ACCOUNT_PLAINTEXT_PASSWORD_UNTIL', PasswordConst.PLAINTEXT_PASSWORD_UNTIL)
+        return until is not None and timezone.localdate() <= datetime.date.fromisoformat(str(until))
+    
+    def get_hasher_for(self, encoded: str):
+        """ 저장된 해시 값의 알고리즘에 맞는 hasher. 해시 형식이 아니면 None (평문) """
+        algorithm = encoded.split('$', 1)[0] if '$' in encoded else None
+        
+        if algorithm == self.hasher.algorithm:
+            return self.hasher
+        if algorithm in HASHER_CLASSES:
+            return build_hasher(algorithm)
+        return None
+    
+    def verify(self, raw_password: Optional[str], encoded: Optional[str]) -> Tuple[bool, bool]:
+        """ 비밀번호 검증
+            return
+            - (일치 여부, 재해시 필요 여부)
+        """
+        if raw_password is None or encoded is None:
+            return False, False
+        
+        hasher = self.get_hasher_for(encoded)
+        
+        if hasher is None:
+            # 해싱 도입 이전 평문 비밀번호 (허용 기간 이후에는 실패)
+            if not self.allows_plaintext():
+                return False, False
+            is_correct = constant_time_compare(raw_password, encoded)
+            return is_correct, is_correct
+        
+        is_correct = hasher.verify(raw_password, encoded)
+        if not is_correct:
+            return False, False
+        
+        needs_rehash = hasher.algorithm != self.hasher.algorithm or self.hasher.must_update(encoded)
+        return True, needs_rehash
+    
+    async def averify(self, raw_password: Optional[str], encoded: Optional[str]) -> Tuple[bool, bool]:
+        """ verify 를 스레드 풀에서 실행하여 이벤트 루프를 막지 않음 """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.verify, raw_password, encoded)
+    
+    async def ahash(self, raw_password: str) -> str:
+        """ hash 를 스레드 풀에서 실행 """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.hash, raw_password)
+
+
+password_manager = PasswordManager()
@@ -0,0 +1,22 @@
+from rest_framework.permissions   import BasePermission
+
+from account.authentication       import JWTAuthentication
+from account.query_orm.user_query import UserDatabaseQuery
+
+
+class IsAccountAdmin(BasePermission):
+    """ 관리자 계정 (AccountTypeEnum.ADMIN) 의 access 토큰만 허용
+        - Authorization: Bearer <access_token>
+        - UserViewSet 은 sign-in / token refresh 등 토큰 없이 (또는 만료 토큰 헤더로) 호출하는 액션이 있어
+          기본 authentication_classes 를 두지 않으므로 여기서 직접 JWT 검증 (destroy 와 같은 방식)
+        - 잘못된 토큰은 AuthenticationFailed, 토큰이 없거나 관리자가 아니면 403
+    """
+    
+    user_query = UserDatabaseQuery()
+    
+    def has_permission(self, request, view) -> bool:
+        auth = JWTAuthentication().authenticate(request)
+        if auth is None:
+            return False
+        
+        return self.user_query.check_user_admin(user_id=auth[0].id)
@@ -0,0 +1,172 @@
+import atexit
+import logging
+import os
+import threading
+import time
+
+from datetime                   import datetime
+from typing                     import Dict, List
+
+from django.conf                import settings
+from django.db                  import connections, DatabaseError
+from django.db.models           import F, Case, When, Value, IntegerField, DateTimeField
+from django.db.models.functions import Coalesce, Greatest
+
+from account.const              import LoginStatBufferConst
+from account.models             import User
+
+logger = logging.getLogger(__name__)
+
+
+class LoginStatRecorder:
+    """ 로그인 카운트 / 마지막 로그인 시간 write-behind 버퍼
+        - settings.ACCOUNT_LOGIN_STAT_BUFFER_ENABLED 가 True 일 때만 사용 (기본 비활성)
+        - 유저별 증가분과 최신 로그인 시간을 메모리에 모았다가 size / time 조건에 한 번의 UPDATE 로 반영
+        - UPDATE 는 login_count = login_count + n, last_login_date = GREATEST(기존 값, 버퍼 최대 값) 이므로
+          여러 워커 프로세스가 각자 flush 해도 증가분이 유실되거나 시간이 역행하지 않음
+        - 프로세스 종료 시 atexit 에서 남은 버퍼를 flush (SIGKILL 등 강제 종료 시에는 버퍼 유실)
+    """
+    
+    def __init__(self, max_size: int=None, flush_interval: float=None):
+        self.max_size       = max_size or getattr(settings, 'ACCOUNT_LOGIN_STAT_BUFFER_MAX_SIZE', LoginStatBufferConst.MAX_SIZE)
+        self.flush_interval = flush_interval or getattr(settings, 'ACCOUNT_LOGIN_STAT_BUFFER_FLUSH_INTERVAL', LoginStatBufferConst.FLUSH_INTERVAL)
+        
+        self._lock        = threading.Lock()
+        self._flush_lock  = threading.Lock()
+        self._buffer      = dict()  # user_id -> [count, last_login_date]
+        self._thread      = None
+        self._stop_event  = threading.Event()
+        
+        # metrics
+        self.flush_count        = 0
+        self.flush_error_count  = 0
+        self.flushed_rows       = 0
+        self.last_flush_latency = 0.0
+        self.max_flush_latency  = 0.0
+    
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'ACCOUNT_LOGIN_STAT_BUFFER_ENABLED', False)
+    
+    @property
+    def depth(self) -> int:
+        """ 현재 버퍼에 쌓인 유저 수 """
+        return len(self._buffer)
+    
+    def metrics(self) -> dict:
+        return {
+            'buffer_depth'      : self.depth,
+            'flush_count'       : self.flush_count,
+            'flush_error_count' : self.flush_error_count,
+            'flushed_rows'      : self.flushed_rows,
+            'last_flush_latency': self.last_flush_latency,
+            'max_flush_latency' : self.max_flush_latency,
+        }
+    
+    def record(self, user_id: int, present_time: datetime, flush_when_full: bool=True) -> None:
+        """ 로그인 1회 기록. 버퍼가 max_size 에 도달하면 호출 스레드에서 flush
+            - flush_when_full=False: 이벤트 루프 등 DB 를 호출하면 안 되는 곳. 다음 주기에 백그라운드 스레드가 flush
+        """
+        self._ensure_started()
+        
+        with self._lock:
+            stat = self._buffer.get(user_id)
+            if stat is None:
+                self._buffer[user_id] = [1, present_time]
+            else:
+                stat[0] += 1
+                stat[1]  = max(stat[1], present_time)
+            
+            is_full = len(self._buffer) >= self.max_size
+        
+        if is_full and flush_when_full:
+            self.flush()
+    
+    def flush(self) -> int:
+        """ 버퍼 내용을 UPDATE 1회로 반영. 반영한 유저 수 리턴
+            - DB 오류 시 꺼낸 값을 버퍼에 되돌려 다음 flush 에서 재시도
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._buffer:
+                    return 0
+                pending, self._buffer = self._buffer, dict()
+            
+            start = time.perf_counter()
+            try:
+                self._bulk_update(pending)
+                
+            except DatabaseError:
+                logger.exception('login stat flush failed. rows=%s', len(pending))
+                self.flush_error_count += 1
+                self._merge_back(pending)
+                return 0
+            
+            latency = time.perf_counter() - start
+            
+            self.flush_count        += 1
+            self.flushed_rows       += len(pending)
+            self.last_flush_latency  = latency
+            self.max_flush_latency   = max(self.max_flush_latency, latency)
+            
+            return len(pending)
+    
+    def stop(self) -> None:
+        """ 백그라운드 스레드 종료 후 남은 버퍼 flush """
+        self._stop_event.set()
+        self.flush()
+    
+    def _bulk_update(self, pending: Dict[int, List]) -> None:
+        count_cases = [When(pk=user_id, then=Value(stat[0])) for user_id, stat in pending.items()]
+        date_cases  = [When(pk=user_id, then=Value(stat[1])) for user_id, stat in pending.items()]
+        
+        login_date = Case(*date_cases, output_field=DateTimeField())
+        
+        User.objects.filter(pk__in=list(pending.keys())).update(
+            login_count     = F('login_count') + Case(*count_cases, default=Value(0), output_field=IntegerField()),
+            last_login_date = Greatest(Coalesce(F('last_login_date'), login_date), login_date),
+        )
+    
+    def _merge_back(self, pending: Dict[int, List]) -> None:
+        with self._lock:
+            for user_id, (count, last_login_date) in pending.items():
+                stat = self._buffer.get(user_id)
+                if stat is None:
+                    self._buffer[user_id] = [count, last_login_date]
+                else:
+                    stat[0] += count
+                    stat[1]  = max(stat[1], last_login_date)
+    
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        
+        with self._lock:
+            if self._thread is not None:
+                return
+            
+            self._thread = threading.Thread(target=self._run, name='login-stat-recorder', daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+    
+    def _reset_after_fork(self) -> None:
+        # fork 된 워커(gunicorn --preload 등)는 부모의 스레드/버퍼를 이어받지 않음
+        self._lock       = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer     = dict()
+        self._thread     = None
+        self._stop_event = threading.Event()
+    
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            try:
+                self.flush()
+            finally:
+                # 백그라운드 스레드 전용 커넥션 정리
+                connections.close_all()
+
+
+login_stat_recorder = LoginStatRecorder()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=login_stat_recorder._reset_after_fork)
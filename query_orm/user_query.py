@@ -1,28 +1,200 @@
-from datetime         import datetime
+from datetime                              import datetime
+from typing                                import Optional
 
-from django.db.models import QuerySet
+from asgiref.sync                          import sync_to_async
 
-from account.models   import User
+from django.db                             import transaction
+from django.db.models                      import QuerySet, F
+
+from account.db_router                     import replica_selector
+from account.email_outbox                  import email_outbox_query
+from account.enums                         import AccountTypeEnum
+from account.models                        import User
+from account.reference_data                import reference_data
+from account.cache.email_bloom_filter      import email_bloom_filter
+from account.cache.sign_in_cache           import sign_in_cache
+from account.query_orm.login_stat_recorder import login_stat_recorder
 
 
 class UserDatabaseQuery:
     
+    # 로그인 처리 및 로그인 응답 시리얼라이징에 필요한 컬럼만 조회
+    SIGN_IN_FIELDS = (
+        'id',
+        'email',
+        'password',
+        'login_count',
+        'last_login_date',
+        'is_deleted',
+        'account_type_id',
+        'social_signup_type_id',
+    )
+    
+    def on_replica(self, queryset: QuerySet) -> QuerySet:
+        """ 읽기 전용 조회를 replica 로 (weighted round-robin)
+            - 요청 내 쓰기 이후 / 트랜잭션 안 / 쓰기 후 lag 허용 시간 안이면 primary (account.db_router)
+            - 로그인 / 회원가입 등 직후 쓰기로 이어지는 조회에는 사용하지 않음
+        """
+        return queryset.using(replica_selector.read_alias())
+    
     def get_user_by_email(self, email: str=None) -> QuerySet:
-        user = User.objects.filter(email=email)
+        user = User.all_objects.filter(email=email)
         return user
     
     def check_user_email(self, email: str=None) -> bool:
-        user = User.objects.filter(email=email)
+        if not email_bloom_filter.might_exist(email):
+            return False
+        user = self.on_replica(User.all_objects.filter(email=email))
+        return user.exists()
+    
+    def get_email_is_deleted(self, email: str, use_bloom_filter: bool=True) -> Optional[bool]:
+        """ 회원가입 중복 체크. 조회 최대 1회 (bloom filter 음성이면 0회)
+            - 동시 가입 / bloom filter 동기화 전 가입은 INSERT 시 DB 유니크 제약 (IntegrityError) 으로 판단
+            param
+            - email: 정규화된 이메일 (normalize_email)
+            - use_bloom_filter: False 면 항상 DB 조회 (IntegrityError 이후 재확인 등)
+            
+            return
+            - None: 가입되지 않은 이메일
+            - False: 가입된 유저, True: 탈퇴 유저
+        """
+        if use_bloom_filter and not email_bloom_filter.might_exist(email):
+            return None
+        return User.all_objects.filter(email=email).values_list('is_deleted', flat=True).first()
+    
+    async def aget_email_is_deleted(self, email: str, use_bloom_filter: bool=True) -> Optional[bool]:
+        """ get_email_is_deleted 의 async ORM 버전 """
+        if use_bloom_filter and not email_bloom_filter.might_exist(email):
+            return None
+        return await User.all_objects.filter(email=email).values_list('is_deleted', flat=True).afirst()
+    
+    def check_user_admin(self, user_id: int) -> bool:
+        """ 관리자 계정 (AccountTypeEnum.ADMIN) 여부. 권한 판단이므로 primary 에서 조회 """
+        user = User.objects.filter(pk=user_id, account_type_id=AccountTypeEnum.ADMIN.value)
         return user.exists()
     
     def check_user_alive(self, email: str=None) -> bool:
-        user = User.objects.filter(is_deleted=False, email=email)
+        user = self.on_replica(User.objects.filter(email=email))
         return user.exists()
     
+    def get_sign_in_user(self, email: str=None) -> Optional[User]:
+        """ 로그인용 유저 조회 (탈퇴 유저 포함). 캐시 hit 시 쿼리 0회, miss 시 SELECT 1회
+            param
+            - email: 유저 이메일
+            
+            return
+            - User 인스턴스 (account_type, social_signup_type 은 DB 조회 없이 메모리 상에서 채움)
+            - 유저가 없으면 None
+        """
+        projection = sign_in_cache.get(email)
+        
+        if projection is None:
+            projection = User.all_objects.filter(email=email).values(*self.SIGN_IN_FIELDS).first()
+            if projection is None:
+                return None
+            sign_in_cache.set(email, projection)
+        
+        return self.build_user(projection)
+    
+    async def aget_sign_in_user(self, email: str=None) -> Optional[User]:
+        """ get_sign_in_user 의 async ORM 버전 """
+        projection = await sign_in_cache.aget(email)
+        
+        if projection is None:
+            projection = await User.all_objects.filter(email=email).values(*self.SIGN_IN_FIELDS).afirst()
+            if projection is None:
+                return None
+            await sign_in_cache.aset(email, projection)
+        
+        return self.build_user(projection)
+    
+    def build_user(self, projection: dict) -> User:
+        """ projection(dict) 으로 User 인스턴스 생성
+            - FK 는 reference_data 레지스트리 인스턴스로 채워 DB 조회가 발생하지 않도록 함
+        """
+        user = User.from_db(User.objects.db, list(projection.keys()), list(projection.values()))
+        user.account_type = reference_data.get_account_type(projection['account_type_id'])
+        
+        if projection['social_signup_type_id'] is not None:
+            user.social_signup_type = reference_data.get_social_signup_type(projection['social_signup_type_id'])
+        
+        return user
+    
+    def create_social_user(self, email: str, social_signup_type: int, present_time: datetime) -> User:
+        """ 소셜 로그인 최초 진입 시 회원가입 (컨슈머) 및 첫 로그인 처리를 INSERT 1회로 처리 (+ 환영 메일 outbox INSERT)
+            - 동시 가입으로 email 유니크 제약 위반 시 IntegrityError 를 그대로 올림 (호출부에서 로그인으로 전환)
+            param
+            - email: 소셜 프로필 이메일
+            - social_signup_type: SocialSignUpTypeEnum 값
+            - present_time: 현재 시간 (datetime 객체)
+            
+            return
+            - 생성된 User 인스턴스
+        """
+        with transaction.atomic():
+            user = User.objects.create(
+                email                 = email,
+                password              = None,
+                login_count           = 1,
+                last_login_date       = present_time,
+                account_type_id       = AccountTypeEnum.CONSUMER.value,
+                social_signup_type_id = social_signup_type,
+            )
+            email_outbox_query.enqueue_sign_up(user)
+        
+        user.account_type       = reference_data.get_account_type(user.account_type_id)
+        user.social_signup_type = reference_data.get_social_signup_type(user.social_signup_type_id)
+        return user
+    
+    async def acreate_social_user(self, email: str, social_signup_type: int, present_time: datetime) -> User:
+        """ create_social_user 의 async 버전 (transaction.atomic 은 async 를 지원하지 않아 스레드에서 실행) """
+        return await sync_to_async(self.create_social_user)(email=email, social_signup_type=social_signup_type,
+                                                            present_time=present_time)
+    
+    def soft_delete_user(self, user_id: int, present_time: datetime) -> Optional[str]:
+        """ 회원 탈퇴 처리 (is_deleted, deleted_at). 보관 기간 후 archive_deleted_users 가 users_archive 로 이동
+            param
+            - user_id: 유저 id
+            - present_time: 현재 시간 (datetime 객체)
+            
+            return
+            - 탈퇴 처리한 유저 이메일 (없거나 이미 탈퇴한 유저면 None)
+        """
+        email = User.objects.filter(pk=user_id).values_list('email', flat=True).first()
+        if email is None:
+            return None
+        
+        if not User.objects.filter(pk=user_id).update(is_deleted=True, deleted_at=present_time):
+            return None
+        
+        sign_in_cache.delete(email)
+        return email
+    
+    def update_password(self, user: User, encoded_password: str) -> None:
+        """ 비밀번호 해시 값 업데이트 (로그인 시 재해시)
+            param
+            - user: 유저 모델 인스턴스
+            - encoded_password: password_manager.hash() 결과
+        """
+        User.objects.filter(pk=user.pk).update(password=encoded_password)
+        user.password = encoded_password
+        
+        sign_in_cache.delete(user.email)
+    
+    async def aupdate_password(self, user: User, encoded_password: str) -> None:
+        """ update_password 의 async ORM 버전 """
+        await User.objects.filter(pk=user.pk).aupdate(password=encoded_password)
+        user.password = encoded_password
+        
+        await sign_in_cache.adelete(user.email)
+    
     def increase_login_count(self, user: User, present_time: datetime) -> None:
         """ 유저가 로그인 했을 때 로그인 카운트와 마지막 로그인 시간 업데이트
         - login_count, last_login 컬럼만 업데이트 1 증가
         - login_count 1 증가, last_login 현재 시간으로 업데이트
+        - F-expression UPDATE 1회로 처리하여 동시 로그인 시에도 증가분이 유실되지 않음
+        - 인스턴스 및 캐시의 login_count 는 응답용 값 (동시 로그인 시 DB 값과 다를 수 있음)
+        - ACCOUNT_LOGIN_STAT_BUFFER_ENABLED 설정 시 login_stat_recorder 버퍼에 기록 후 일괄 반영
             param
             - user: 유저 모델 인스턴스
             - present_time: 현재 시간 (datetime 객체)
@@ -30,6 +202,26 @@ class UserDatabaseQuery:
             return
             - None
         """
-        user.login_count += 1
+        if login_stat_recorder.enabled:
+            login_stat_recorder.record(user_id=user.pk, present_time=present_time)
+        else:
+            User.objects.filter(pk=user.pk).update(login_count=F('login_count') + 1, last_login_date=present_time)
+        
+        user.login_count    += 1
+        user.last_login_date = present_time
+        
+        sign_in_cache.set(user.email, {field: getattr(user, field) for field in self.SIGN_IN_FIELDS})
+    
+    async def aincrease_login_count(self, user: User, present_time: datetime) -> None:
+        """ increase_login_count 의 async ORM 버전
+            - login_stat_recorder 는 버퍼에만 기록 (이벤트 루프에서 DB flush 하지 않고 백그라운드 스레드가 flush)
+        """
+        if login_stat_recorder.enabled:
+            login_stat_recorder.record(user_id=user.pk, present_time=present_time, flush_when_full=False)
+        else:
+            await User.objects.filter(pk=user.pk).aupdate(login_count=F('login_count') + 1, last_login_date=present_time)
+        
+        user.login_count    += 1
         user.last_login_date = present_time
-        user.save(update_fields=['login_count', 'last_login_date'])
+        
+        await sign_in_cache.aset(user.email, {field: getattr(user, field) for field in self.SIGN_IN_FIELDS})
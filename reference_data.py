@@ -0,0 +1,105 @@
+import logging
+import threading
+
+from typing                       import Optional
+
+from django.core.exceptions       import ImproperlyConfigured
+from django.db                    import DatabaseError
+from django.db.backends.base.base import NO_DB_ALIAS
+
+from account.const                import UserConst
+from account.enums                import AccountTypeEnum, SocialSignUpTypeEnum
+from account.models               import AccountTypes, SocialSignUpType
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceDataRegistry:
+    """ AccountTypes / SocialSignUpType 참조 테이블 프로세스 캐시
+        - 로드 전에는 UserConst 기준 메모리 인스턴스로 조회. 조회 메서드는 DB 에 접근하지 않음 (async 뷰에서도 그대로 호출)
+        - 프로세스의 첫 DB 커넥션이 열릴 때 (connection_created, signals) 그 커넥션으로 한 번 load()
+          (ready() 에서는 DB 에 접근하지 않음. 실패하면 다음 커넥션에서 다시 시도)
+        - UserConst 와 enum 이 일치하지 않으면 ImproperlyConfigured (ready() 에서 validate_const)
+        - row 가 없거나 UserConst 와 다르면 경고 후 UserConst 기준 메모리 인스턴스 사용
+        - 참조 테이블 변경 시 reload() (signals 에서 자동 호출)
+    """
+    
+    def __init__(self):
+        self._lock                = threading.Lock()
+        self._loaded              = False
+        self._account_types       = self._const_instances(AccountTypes, UserConst.ACCOUNT_TYPE)
+        self._social_signup_types = self._const_instances(SocialSignUpType, UserConst.SOCIAL_SIGNUP_TYPE)
+        
+        # 응답의 *_type_name 은 choices(UserConst) 표시 값
+        self._account_type_names       = dict(UserConst.ACCOUNT_TYPE)
+        self._social_signup_type_names = dict(UserConst.SOCIAL_SIGNUP_TYPE)
+    
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+    
+    def load(self, using: str=None) -> None:
+        """ DB row 로 교체. 테이블이 없으면 (migrate 이전) 경고 후 기존 값 유지 (loaded 는 False 그대로) """
+        self.validate_const()
+        
+        try:
+            account_types       = self._load_table(AccountTypes, UserConst.ACCOUNT_TYPE, using)
+            social_signup_types = self._load_table(SocialSignUpType, UserConst.SOCIAL_SIGNUP_TYPE, using)
+            
+        except DatabaseError:
+            logger.warning('reference tables are not ready. use UserConst values')
+            return
+        
+        with self._lock:
+            self._account_types       = account_types
+            self._social_signup_types = social_signup_types
+            self._loaded              = True
+    
+    def reload(self) -> None:
+        self.load()
+    
+    def load_on_connection(self, connection) -> None:
+        """ connection_created 수신. 아직 로드하지 않았으면 새 커넥션으로 로드 (다른 커넥션을 열지 않음) """
+        if self._loaded or connection.alias == NO_DB_ALIAS:
+            return
+        self.load(using=connection.alias)
+    
+    def validate_const(self) -> None:
+        """ UserConst 튜플과 enum 이 같은 (id, name) 을 가지는지 체크 """
+        for const, enum_class in ((UserConst.ACCOUNT_TYPE, AccountTypeEnum),
+                                  (UserConst.SOCIAL_SIGNUP_TYPE, SocialSignUpTypeEnum)):
+            if dict(const) != {member.value: member.name for member in enum_class}:
+                raise ImproperlyConfigured(f'UserConst and {enum_class.__name__} are out of sync')
+    
+    def _const_instances(self, model, const: list) -> dict:
+        return {pk: model(id=pk, name=name) for pk, name in const}
+    
+    def _load_table(self, model, const: list, using: str=None) -> dict:
+        instances = self._const_instances(model, const)
+        rows      = {row.id: row for row in model.objects.using(using).all()}
+        
+        for pk, name in const:
+            row = rows.get(pk)
+            if row is None:
+                logger.warning('%s row is missing. id=%s', model._meta.db_table, pk)
+                continue
+            if row.name != name:
+                logger.warning('%s row name mismatch. id=%s db=%s const=%s', model._meta.db_table, pk, row.name, name)
+            instances[pk] = row
+        
+        return instances
+    
+    def get_account_type(self, pk: int) -> Optional[AccountTypes]:
+        return self._account_types.get(pk)
+    
+    def get_social_signup_type(self, pk: int) -> Optional[SocialSignUpType]:
+        return self._social_signup_types.get(pk)
+    
+    def get_account_type_name(self, pk: int) -> Optional[str]:
+        return self._account_type_names.get(pk)
+    
+    def get_social_signup_type_name(self, pk: int) -> Optional[str]:
+        return self._social_signup_type_names.get(pk)
+
+
+reference_data = ReferenceDataRegistry()
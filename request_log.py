@@ -0,0 +1,204 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import threading
+
+from logging.handlers                 import QueueHandler, QueueListener
+from typing                           import Any, Dict, Optional
+
+from django.conf                      import settings
+from django.core.serializers.json     import DjangoJSONEncoder
+
+from account.const                    import RequestLogConst
+from common.const                     import MethodNameConst
+
+
+class StructuredFormatter(logging.Formatter):
+    """ 로그 레코드 1개 -> JSON 1줄
+        - record.structured (dict) 를 그대로 필드로 사용
+        - 큐를 쓰는 경우 writer 스레드에서만 호출되므로 요청 스레드는 직렬화 비용을 내지 않음
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            'ts'    : round(record.created, 3),
+            'level' : record.levelname,
+            'logger': record.name,
+            'msg'   : record.getMessage(),
+        }
+        data.update(getattr(record, 'structured', None) or {})
+        if record.exc_info:
+            data['exc'] = self.formatException(record.exc_info)
+        return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """ 큐가 가득 차면 기다리지 않고 레코드를 버림 (dropped 카운트)
+        - 기본 QueueHandler.prepare 는 요청 스레드에서 메시지를 포맷하므로 포맷 없이 그대로 넘김
+    """
+    
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RequestLogger:
+    """ 뷰 진입 요청 로그 (CommonUtil.print_log 대체)
+        - settings.ACCOUNT_REQUEST_LOG_ENABLED      : False 면 기록하지 않음 (기본 True)
+        - settings.ACCOUNT_REQUEST_LOG_SAMPLE_RATES : {method_name: 비율}. 샘플링에서 빠진 요청은 복사 / 포맷 없이 바로 리턴
+        - settings.ACCOUNT_REQUEST_LOG_ASYNC        : True (기본) 면 큐 + 백그라운드 writer 스레드에서 기록
+        - password / token 등 REDACT_FIELDS 에 해당하는 값은 기록 전에 가림
+        - 'account.request' logger 에 핸들러가 설정되어 있으면 (settings.LOGGING) 그 핸들러를 writer 로 사용, 없으면 stderr
+    """
+    
+    def __init__(self):
+        self.logger    = logging.getLogger(RequestLogConst.LOGGER_NAME)
+        self._lock     = threading.Lock()
+        self._handler  = None
+        self._listener = None
+        self._rates    = None
+        
+        # metrics
+        self.emitted     = 0
+        self.sampled_out = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'ACCOUNT_REQUEST_LOG_ENABLED', True)
+    
+    @property
+    def sample_rates(self) -> Dict[str, float]:
+        if self._rates is None:
+            rates = {
+                MethodNameConst.SIGN_IN: RequestLogConst.HOT_PATH_SAMPLE_RATE,
+                MethodNameConst.LIST   : RequestLogConst.HOT_PATH_SAMPLE_RATE,
+            }
+            rates.update(getattr(settings, 'ACCOUNT_REQUEST_LOG_SAMPLE_RATES', {}))
+            self._rates = rates
+        return self._rates
+    
+    def metrics(self) -> dict:
+        return {
+            'emitted'    : self.emitted,
+            'sampled_out': self.sampled_out,
+            'dropped'    : self._handler.dropped if self._handler else 0,
+            'queue_depth': self._handler.queue.qsize() if self._handler else 0,
+        }
+    
+    def print_log(self, app_name: str, method_name: str, request_data: Any=None, class_: Any=None, **fields) -> None:
+        """ CommonUtil.print_log 와 같은 인자로 호출 """
+        if not self.enabled:
+            return
+        
+        # 핸들러 / INFO 레벨 설정 (_attach) 이 끝난 뒤 레벨 체크 (기본 logging 설정은 WARNING 이라 먼저 체크하면 모두 버려짐)
+        self._ensure_started()
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        rate = self.sample_rates.get(method_name, RequestLogConst.DEFAULT_SAMPLE_RATE)
+        if rate < 1.0 and random.random() >= rate:
+            self.sampled_out += 1
+            return
+        
+        structured = {
+            'app'   : app_name,
+            'method': method_name,
+            'view'  : class_.__class__.__name__ if class_ is not None else None,
+            'data'  : self.redact(request_data),
+        }
+        structured.update(fields)
+        
+        self.emitted += 1
+        self.logger.info('request', extra={'structured': structured})
+    
+    def redact(self, request_data: Any) -> Optional[Any]:
+        """ 요청 데이터 얕은 복사 + 민감 필드 가림 (QueryDict 는 마지막 값 기준) """
+        if request_data is None:
+            return None
+        if hasattr(request_data, 'dict'):
+            request_data = request_data.dict()
+        if not isinstance(request_data, dict):
+            return str(request_data)
+        
+        return {
+            key: RequestLogConst.REDACTED if self.is_sensitive(key) else value
+            for key, value in request_data.items()
+        }
+    
+    def is_sensitive(self, key: str) -> bool:
+        key = str(key).lower()
+        return any(field in key for field in RequestLogConst.REDACT_FIELDS)
+    
+    def _ensure_started(self) -> None:
+        if self._handler is not None:
+            return
+        
+        with self._lock:
+            if self._handler is not None:
+                return
+            
+            if not getattr(settings, 'ACCOUNT_REQUEST_LOG_ASYNC', True):
+                if not self.logger.handlers:
+                    self._attach(self.logger, self._default_handler())
+                self._handler = False
+                return
+            
+            # 설정된 핸들러를 writer 로 옮기고 logger 에는 큐 핸들러만 남김
+            targets = list(self.logger.handlers) or [self._default_handler()]
+            for target in targets:
+                self.logger.removeHandler(target)
+            
+            handler  = NonBlockingQueueHandler(queue.Queue(maxsize=RequestLogConst.QUEUE_SIZE))
+            listener = QueueListener(handler.queue, *targets, respect_handler_level=True)
+            listener.start()
+            
+            self._attach(self.logger, handler)
+            self._listener = listener
+            self._handler  = handler
+            atexit.register(self.stop)
+    
+    def _attach(self, logger: logging.Logger, handler: logging.Handler) -> None:
+        logger.addHandler(handler)
+        # settings.LOGGING 으로 레벨을 설정했으면 그대로 두고, 미설정 (NOTSET -> root WARNING) 이면 INFO
+        if logger.level == logging.NOTSET:
+            logger.setLevel(logging.INFO)
+        logger.propagate = False
+    
+    def _default_handler(self) -> logging.Handler:
+        handler = logging.StreamHandler()
+        handler.setFormatter(StructuredFormatter())
+        return handler
+    
+    def stop(self) -> None:
+        """ 큐에 남은 레코드 기록 후 writer 스레드 종료 """
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+    
+    def _reset_after_fork(self) -> None:
+        # fork 된 워커는 부모의 writer 스레드를 이어받지 않으므로 첫 기록 시 다시 시작
+        if self._handler:
+            self.logger.removeHandler(self._handler)
+            for target in self._listener.handlers if self._listener else ():
+                self.logger.addHandler(target)
+        self._lock     = threading.Lock()
+        self._handler  = None
+        self._listener = None
+
+
+request_logger = RequestLogger()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=request_logger._reset_after_fork)
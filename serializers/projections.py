@@ -0,0 +1,63 @@
+from account.models         import User
+from account.reference_data import reference_data
+
+# DRF 에 의존하지 않는 응답 dict 생성 경로. sign-in 등 serializer 를 쓰지 않는 액션이
+# user_serializers (DRF ModelSerializer) 를 import 하지 않도록 분리
+
+
+class UserInfoProjection:
+    """ UserInfoSerializer 와 같은 결과를 DRF 필드 처리 없이 dict 로 만드는 읽기 전용 경로 (sign-in, export 응답용) """
+    
+    VALUES_FIELDS = (
+        'id',
+        'email',
+        'is_deleted',
+        'login_count',
+        'account_type_id',
+        'social_signup_type_id',
+    )
+    
+    @staticmethod
+    def from_instance(obj: User) -> dict:
+        return {
+            'id'                     : obj.id,
+            'email'                  : obj.email,
+            'is_deleted'             : obj.is_deleted,
+            'login_count'            : obj.login_count,
+            'user_account_type_name' : reference_data.get_account_type_name(obj.account_type_id),
+            'social_signup_type_name': reference_data.get_social_signup_type_name(obj.social_signup_type_id),
+        }
+    
+    @staticmethod
+    def from_values(row: dict) -> dict:
+        """ queryset.values(*VALUES_FIELDS) 의 row """
+        return {
+            'id'                     : row['id'],
+            'email'                  : row['email'],
+            'is_deleted'             : row['is_deleted'],
+            'login_count'            : row['login_count'],
+            'user_account_type_name' : reference_data.get_account_type_name(row['account_type_id']),
+            'social_signup_type_name': reference_data.get_social_signup_type_name(row['social_signup_type_id']),
+        }
+
+
+class UserListProjection:
+    """ 목록 응답 (UserCreateSerializer 읽기 필드와 동일) 을 values() row 에서 바로 만드는 경로 """
+    
+    VALUES_FIELDS = (
+        'id',
+        'email',
+        'account_type_id',
+        'social_signup_type_id',
+    )
+    
+    @staticmethod
+    def from_values(row: dict) -> dict:
+        return {
+            'id'                     : row['id'],
+            'email'                  : row['email'],
+            'social_signup_type'     : row['social_signup_type_id'],
+            'account_type'           : row['account_type_id'],
+            'user_account_type_name' : reference_data.get_account_type_name(row['account_type_id']),
+            'social_signup_type_name': reference_data.get_social_signup_type_name(row['social_signup_type_id']),
+        }
@@ -1,18 +1,50 @@
-from rest_framework             import serializers
-from rest_framework.serializers import ValidationError
+from rest_framework                  import serializers
+from rest_framework.validators       import UniqueValidator
 
-from account.models import User
+from account.models                  import User, AccountTypes, SocialSignUpType
+from account.reference_data          import reference_data
+from account.serializers.projections import UserInfoProjection, UserListProjection  # noqa: F401 (기존 import 경로 호환)
+from account.utils                   import normalize_email
 
 
-class UserCreateSerializer(serializers.ModelSerializer):
-    user_account_type_name  = serializers.SerializerMethodField()
-    social_signup_type_name = serializers.SerializerMethodField()
+class ReferenceDataField(serializers.PrimaryKeyRelatedField):
+    """ 참조 테이블 FK 필드. 존재 여부를 DB 대신 reference_data 레지스트리에서 체크
+        - reference_type: 'account_type' | 'social_signup_type' (reference_data.get_<reference_type> 로 조회)
+          DRF 가 필드 생성 인자를 deepcopy 하므로 레지스트리 메서드 대신 이름을 받음
+    """
+    
+    def __init__(self, reference_type: str, **kwargs):
+        self.reference_type = reference_type
+        super().__init__(**kwargs)
+    
+    def to_internal_value(self, data):
+        try:
+            pk = int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        
+        instance = getattr(reference_data, f'get_{self.reference_type}')(pk)
+        if instance is None:
+            self.fail('does_not_exist', pk_value=data)
+        return instance
+
+
+class UserTypeNameMixin:
+    """ account_type / social_signup_type 이름을 FK 인스턴스 대신 *_id 로 조회 (DB 접근 없음, null 허용) """
     
     def get_user_account_type_name(self, obj: User):
-        return obj.account_type.get_id_display()
+        return reference_data.get_account_type_name(obj.account_type_id)
     
     def get_social_signup_type_name(self, obj: User):
-        return obj.social_signup_type.get_id_display()
+        return reference_data.get_social_signup_type_name(obj.social_signup_type_id)
+
+
+class UserCreateSerializer(UserTypeNameMixin, serializers.ModelSerializer):
+    account_type            = ReferenceDataField(queryset=AccountTypes.objects.all(), reference_type='account_type')
+    social_signup_type      = ReferenceDataField(queryset=SocialSignUpType.objects.all(), reference_type='social_signup_type',
+                                                 allow_null=True, required=False)
+    user_account_type_name  = serializers.SerializerMethodField()
+    social_signup_type_name = serializers.SerializerMethodField()
     
     class Meta:
         model = User
@@ -33,18 +65,24 @@ class UserCreateSerializer(serializers.ModelSerializer):
             'user_account_type_name' : {'read_only' : True},
             'social_signup_type_name': {'read_only' : True}
         }
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        
+        # 가입 시 이메일 중복은 뷰의 중복 체크 1회 + DB 유니크 제약으로 판단 (UniqueValidator 쿼리 생략)
+        if self.instance is None:
+            fields['email'].validators = [validator for validator in fields['email'].validators
+                                          if not isinstance(validator, UniqueValidator)]
+        return fields
+    
+    def validate_email(self, value: str) -> str:
+        return normalize_email(value)
 
 
-class UserInfoSerializer(serializers.ModelSerializer):
+class UserInfoSerializer(UserTypeNameMixin, serializers.ModelSerializer):
     user_account_type_name  = serializers.SerializerMethodField()
     social_signup_type_name = serializers.SerializerMethodField()
     
-    def get_user_account_type_name(self, obj: User):
-        return obj.account_type.get_id_display()
-    
-    def get_social_signup_type_name(self, obj: User):
-        return obj.social_signup_type.get_id_display()
-    
     class Meta:
         model  = User
         fields = (
@@ -0,0 +1,38 @@
+from django.db.backends.signals      import connection_created
+from django.db.models.signals        import post_save, post_delete
+from django.dispatch                  import receiver
+
+from account.models                   import User, AccountTypes, SocialSignUpType
+from account.cache.email_bloom_filter import email_bloom_filter
+from account.cache.sign_in_cache      import sign_in_cache
+from account.reference_data           import reference_data
+
+
+@receiver(post_save, sender=User)
+def invalidate_sign_in_cache_on_save(sender, instance: User, created: bool=False, **kwargs):
+    """ 유저 생성/수정 시 로그인 캐시 삭제, 생성 시 가입 이메일 bloom filter 에 추가 """
+    sign_in_cache.delete(instance.email)
+    
+    if created:
+        email_bloom_filter.add(instance.email)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_sign_in_cache_on_delete(sender, instance: User, **kwargs):
+    """ 유저 삭제 시 로그인 캐시 삭제 """
+    sign_in_cache.delete(instance.email)
+
+
+@receiver(post_save, sender=AccountTypes)
+@receiver(post_delete, sender=AccountTypes)
+@receiver(post_save, sender=SocialSignUpType)
+@receiver(post_delete, sender=SocialSignUpType)
+def reload_reference_data(sender, **kwargs):
+    """ 참조 테이블 변경 시 프로세스 캐시 재로드 (다른 프로세스는 재기동 또는 reload 필요) """
+    reference_data.reload()
+
+
+@receiver(connection_created)
+def load_reference_data(sender, connection, **kwargs):
+    """ 프로세스의 첫 DB 커넥션에서 참조 테이블 캐시 로드 (sync 스레드에서만 호출됨. 로드 후에는 무시) """
+    reference_data.load_on_connection(connection)
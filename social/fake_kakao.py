@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+
+from contextlib              import contextmanager
+from http.server             import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse            import urlparse, parse_qs
+
+from django.test             import override_settings
+
+from account.const           import BenchConst
+from account.social.registry import provider_registry
+
+
+class FakeKakaoHandler(BaseHTTPRequestHandler):
+    """ 카카오 토큰 / 프로필 API 흉내 (로컬 벤치마크용)
+        - GET /oauth/token?code=N  -> {'access_token': 'bench-N'}
+        - GET /v2/user/me (Bearer bench-N) -> {'kakao_account': {'email': 'k-N@bench.local', 'is_email_verified': True, ...}}
+        - GET /v1/user/access_token_info (Bearer bench-N) -> {'app_id': APP_ID}. bench- 로 시작하지 않는 토큰은 다른 앱 ID
+    """
+    
+    APP_ID       = 101
+    OTHER_APP_ID = 202
+    
+    latency = 0.0  # 초. upstream 응답 지연 흉내
+    
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        
+        url = urlparse(self.path)
+        if url.path == '/oauth/token':
+            code = parse_qs(url.query).get('code', [''])[0]
+            self.send_json({'access_token': f'bench-{code}', 'token_type': 'bearer'})
+        elif url.path == '/v1/user/access_token_info':
+            token = self.headers.get('Authorization', '').replace('Bearer ', '')
+            self.send_json({'id': 1, 'expires_in': 3600,
+                            'app_id': self.APP_ID if token.startswith('bench-') else self.OTHER_APP_ID})
+        elif url.path == '/v2/user/me':
+            token = self.headers.get('Authorization', '').replace('Bearer ', '')
+            self.send_json({'kakao_account': {'email': f'k-{token[6:]}@{BenchConst.EMAIL_DOMAIN}',
+                                              'is_email_valid': True, 'is_email_verified': True}})
+        else:
+            self.send_json({'error': 'not found'}, status=404)
+    
+    def send_json(self, data: dict, status: int=200):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+class FakeKakaoServer(ThreadingHTTPServer):
+    # 동시 요청 1k 수준의 벤치마크에서 연결이 거부되지 않도록 listen backlog 확대
+    request_queue_size = 1024
+    daemon_threads     = True
+
+
+@contextmanager
+def fake_kakao(latency: float=0.0):
+    """ fake 카카오 서버를 띄우고 kakao provider 가 그 서버를 호출하도록 설정. 서버 주소를 yield """
+    handler = type('FakeKakaoHandler', (FakeKakaoHandler,), {'latency': latency})
+    server  = FakeKakaoServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    host = f'http://127.0.0.1:{server.server_port}'
+    
+    try:
+        with override_settings(SOCIAL_PROVIDERS={'kakao': {
+            'CLIENT_ID'     : 'bench',
+            'REDIRECT_URI'  : f'{host}/callback',
+            'TOKEN_URL'     : f'{host}/oauth/token',
+            'PROFILE_URL'   : f'{host}/v2/user/me',
+            'TOKEN_INFO_URL': f'{host}/v1/user/access_token_info',
+            'APP_ID'        : FakeKakaoHandler.APP_ID,
+        }}):
+            provider_registry.load()
+            yield host
+    finally:
+        server.shutdown()
+        provider_registry.load()
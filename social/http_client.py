@@ -0,0 +1,267 @@
+import asyncio
+import threading
+import time
+import weakref
+
+from typing             import TYPE_CHECKING
+
+from django.conf        import settings
+
+from account.const      import SocialHttpConst
+from account.metrics    import request_metrics
+from common.exceptions  import RequestsError
+
+if TYPE_CHECKING:
+    import requests
+
+
+class CircuitBreaker:
+    """ 연속 실패 시 upstream 호출을 일정 시간 차단
+        - closed    : 정상 호출
+        - open      : failure_threshold 회 연속 실패 후 reset_timeout 동안 호출 없이 즉시 실패
+        - half-open : reset_timeout 경과 후 1회 시험 호출. 성공하면 closed, 실패하면 다시 open
+    """
+    
+    CLOSED    = 'closed'
+    OPEN      = 'open'
+    HALF_OPEN = 'half-open'
+    
+    def __init__(self, name: str, failure_threshold: int=None, reset_timeout: float=None):
+        self.name              = name
+        self.failure_threshold = failure_threshold or SocialHttpConst.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_timeout     = reset_timeout or SocialHttpConst.CIRCUIT_RESET_TIMEOUT
+        
+        self._lock      = threading.Lock()
+        self._failures  = 0
+        self._opened_at = None
+        self._trial     = False
+    
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+    
+    def before_call(self) -> None:
+        """ 호출 가능 여부 확인. open 상태면 RequestsError """
+        with self._lock:
+            state = self.state
+            
+            if state == self.OPEN:
+                raise RequestsError(f'{self.name} circuit open')
+            
+            if state == self.HALF_OPEN:
+                # half-open 상태에서는 한 번에 하나의 시험 호출만 허용
+                if self._trial:
+                    raise RequestsError(f'{self.name} circuit open')
+                self._trial = True
+    
+    def on_success(self) -> None:
+        with self._lock:
+            self._failures  = 0
+            self._opened_at = None
+            self._trial     = False
+    
+    def on_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial     = False
+            
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class SocialHttpClient:
+    """ 소셜 provider 공용 HTTP 클라이언트 (sync)
+        - requests.Session + HTTPAdapter 로 호스트별 keep-alive 커넥션 풀 재사용 (첫 호출 시 생성)
+        - connect / read 타임아웃 고정
+        - 연결 실패 및 RETRY_STATUS 응답에 대해 backoff 재시도 (urllib3 Retry)
+        - 서킷 브레이커로 장애 시 upstream 호출 차단
+        - 모든 실패는 RequestsError 로 변환
+    """
+    
+    def __init__(self, name: str='social', timeout: tuple=None, max_retries: int=None,
+                 backoff_factor: float=None, pool_size: int=None, breaker: CircuitBreaker=None):
+        self.name           = name
+        self.timeout        = timeout or (
+            getattr(settings, 'SOCIAL_HTTP_CONNECT_TIMEOUT', SocialHttpConst.CONNECT_TIMEOUT),
+            getattr(settings, 'SOCIAL_HTTP_READ_TIMEOUT', SocialHttpConst.READ_TIMEOUT),
+        )
+        self.max_retries    = SocialHttpConst.MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_factor = SocialHttpConst.BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        self.pool_size      = pool_size or SocialHttpConst.POOL_SIZE
+        self.breaker        = breaker or CircuitBreaker(name=name)
+        
+        self._session      = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self) -> 'requests.Session':
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+    
+    def _build_session(self) -> 'requests.Session':
+        # requests / urllib3 는 첫 호출 시 import (기동 시간에서 제외)
+        import requests
+        
+        from requests.adapters  import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry = Retry(
+            total            = self.max_retries,
+            connect          = self.max_retries,
+            read             = 0,  # 응답 대기 중 끊긴 요청은 upstream 에서 처리되었을 수 있으므로 재시도 하지 않음
+            status_forcelist = SocialHttpConst.RETRY_STATUS,
+            backoff_factor   = self.backoff_factor,
+            allowed_methods  = frozenset(['GET']),
+            raise_on_status  = False,
+        )
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def request(self, method: str, url: str, breaker: CircuitBreaker=None, **kwargs) -> dict:
+        """ upstream 호출 후 JSON 리턴
+            - 4xx 응답은 provider 가 에러 내용을 JSON 으로 내려주므로 그대로 리턴 (서킷 실패로 집계하지 않음)
+            - breaker: 커넥션 풀은 공유하고 서킷만 provider 별로 분리할 때 지정
+        """
+        import requests
+        
+        breaker = breaker or self.breaker
+        breaker.before_call()
+        
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            
+        except requests.RequestException as e:
+            breaker.on_failure()
+            raise RequestsError(f'{breaker.name} request failed: {e.__class__.__name__}')
+            
+        finally:
+            request_metrics.record_http(method, url, time.perf_counter() - start)
+        
+        if response.status_code >= 500:
+            breaker.on_failure()
+            raise RequestsError(f'{breaker.name} upstream error: {response.status_code}')
+        
+        breaker.on_success()
+        
+        try:
+            return response.json()
+        except ValueError:
+            raise RequestsError(f'{breaker.name} invalid response')
+    
+    def get(self, url: str, **kwargs) -> dict:
+        return self.request('GET', url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> dict:
+        return self.request('POST', url, **kwargs)
+    
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+class AsyncSocialHttpClient:
+    """ 소셜 provider 공용 HTTP 클라이언트 (asyncio)
+        - httpx.AsyncClient 커넥션 풀을 이벤트 루프별로 재사용
+        - 타임아웃 / 재시도 / 서킷 브레이커 정책은 SocialHttpClient 와 동일 (브레이커 공유 가능)
+        - httpx 가 설치되어 있어야 함
+    """
+    
+    def __init__(self, name: str='social', timeout: tuple=None, max_retries: int=None,
+                 backoff_factor: float=None, pool_size: int=None, breaker: CircuitBreaker=None):
+        self.name           = name
+        self.timeout        = timeout or (
+            getattr(settings, 'SOCIAL_HTTP_CONNECT_TIMEOUT', SocialHttpConst.CONNECT_TIMEOUT),
+            getattr(settings, 'SOCIAL_HTTP_READ_TIMEOUT', SocialHttpConst.READ_TIMEOUT),
+        )
+        self.max_retries    = SocialHttpConst.MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_factor = SocialHttpConst.BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        self.pool_size      = pool_size or SocialHttpConst.POOL_SIZE
+        self.breaker        = breaker or CircuitBreaker(name=name)
+        
+        self._clients = weakref.WeakKeyDictionary()  # event loop -> httpx.AsyncClient
+    
+    def _get_client(self):
+        import httpx
+        
+        loop   = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        
+        if client is None or client.is_closed:
+            connect_timeout, read_timeout = self.timeout
+            client = httpx.AsyncClient(
+                timeout = httpx.Timeout(read_timeout, connect=connect_timeout),
+                limits  = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+            )
+            self._clients[loop] = client
+        
+        return client
+    
+    async def request(self, method: str, url: str, breaker: CircuitBreaker=None, **kwargs) -> dict:
+        import httpx
+        
+        breaker = breaker or self.breaker
+        breaker.before_call()
+        client = self._get_client()
+        
+        for attempt in range(self.max_retries + 1):
+            is_last = attempt == self.max_retries
+            
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+                
+            except httpx.ConnectError as e:
+                if not is_last:
+                    await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                    continue
+                breaker.on_failure()
+                raise RequestsError(f'{breaker.name} request failed: {e.__class__.__name__}')
+                
+            except httpx.HTTPError as e:
+                # 응답 대기 중 타임아웃 등은 재시도 하지 않음
+                breaker.on_failure()
+                raise RequestsError(f'{breaker.name} request failed: {e.__class__.__name__}')
+                
+            finally:
+                request_metrics.record_http(method, url, time.perf_counter() - start)
+            
+            if response.status_code in SocialHttpConst.RETRY_STATUS and method == 'GET' and not is_last:
+                await asyncio.sleep(self.backoff_factor * (2 ** attempt))
+                continue
+            
+            break
+        
+        if response.status_code >= 500:
+            breaker.on_failure()
+            raise RequestsError(f'{breaker.name} upstream error: {response.status_code}')
+        
+        breaker.on_success()
+        
+        try:
+            return response.json()
+        except ValueError:
+            raise RequestsError(f'{breaker.name} invalid response')
+    
+    async def get(self, url: str, **kwargs) -> dict:
+        return await self.request('GET', url, **kwargs)
+    
+    async def post(self, url: str, **kwargs) -> dict:
+        return await self.request('POST', url, **kwargs)
+    
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, weakref.WeakKeyDictionary()
+        for client in list(clients.values()):
+            await client.aclose()
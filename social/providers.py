@@ -0,0 +1,330 @@
+import asyncio
+import time
+
+from typing                             import Optional
+from urllib.parse                       import urlencode
+
+from account.cache.social_profile_cache import social_profile_cache
+from account.const                      import SocialProviderConst
+from account.enums                      import SocialSignUpTypeEnum
+from account.exceptions                 import SocialEmailNotVerifiedException, SocialTokenInvalidException
+from account.social.http_client         import SocialHttpClient, AsyncSocialHttpClient, CircuitBreaker
+from account.utils                      import normalize_email
+from common.const                       import CommonConst
+from common.exceptions                  import RequestsError
+
+
+class SocialProviderConfig:
+    """ provider 설정. 앱 기동 시 registry 에서 한 번 만들어 재사용 (요청마다 settings 를 읽지 않음) """
+    
+    def __init__(self, client_id: str, redirect_uri: str, authorize_url: str, token_url: str, profile_url: str,
+                 client_secret: str=None, scope: str=None, app_id: str=None, token_info_url: str=None):
+        self.client_id      = client_id
+        self.client_secret  = client_secret
+        self.redirect_uri   = redirect_uri
+        self.authorize_url  = authorize_url
+        self.token_url      = token_url
+        self.profile_url    = profile_url
+        self.scope          = scope
+        self.app_id         = app_id or client_id  # access token 발급 앱 확인 값 (kakao 는 REST API 키와 다른 앱 ID)
+        self.token_info_url = token_info_url
+
+
+class BaseSocialProvider:
+    """ 소셜 로그인 provider 공통 인터페이스
+        - authorize_url(state)         : 인가 코드 요청 URL
+        - exchange_code(code)          : 인가 코드 -> 엑세스 토큰
+        - get_profile(access_token)    : 엑세스 토큰 -> provider 프로필
+        - extract_email(profile)       : 프로필 -> 이메일
+        - is_email_verified(profile)   : provider 가 이메일 소유를 인증했는지 여부
+        - token_app_id(token_info)     : token info 응답 -> 토큰을 발급받은 앱 (config.app_id 와 다르면 SocialTokenInvalidException)
+        - get_email(access_token)      : 토큰 발급 앱 확인 + 프로필 조회 + 인증 여부 확인 + 이메일 추출 / 정규화
+                                         (access_token -> email 캐시 적용, 캐시에는 확인을 통과한 토큰만 저장)
+                                         인증되지 않은 이메일이면 SocialEmailNotVerifiedException
+        - aexchange_code / aget_profile / aget_email: asyncio 버전
+        
+        클라이언트가 보낸 access token 을 그대로 받으므로, 다른 앱이 발급받은 토큰으로 로그인하지 못하도록
+        token info API (config.token_info_url) 로 발급 앱을 확인한다. token info API 가 없는 provider (naver) 는 확인하지 않음.
+        
+        HTTP 커넥션 풀은 전 provider 가 공유하고, 서킷 브레이커만 provider 별로 분리한다.
+    """
+    
+    name: str = None
+    signup_type: SocialSignUpTypeEnum = None
+    token_method = 'POST'
+    
+    def __init__(self, config: SocialProviderConfig, http_client: SocialHttpClient, async_http_client: AsyncSocialHttpClient):
+        self.config            = config
+        self.http_client       = http_client
+        self.async_http_client = async_http_client
+        self.breaker           = CircuitBreaker(name=self.name)
+        
+        # 고정 값은 한 번만 만들어 둠
+        self._authorize_params = {
+            'client_id'    : config.client_id,
+            'redirect_uri' : config.redirect_uri,
+            'response_type': 'code',
+        }
+        if config.scope:
+            self._authorize_params['scope'] = config.scope
+    
+    def authorize_url(self, state: str=None) -> str:
+        params = dict(self._authorize_params)
+        if state:
+            params['state'] = state
+        return f'{self.config.authorize_url}?{urlencode(params)}'
+    
+    def token_params(self, code: str) -> dict:
+        params = {
+            'grant_type'  : 'authorization_code',
+            'client_id'   : self.config.client_id,
+            'redirect_uri': self.config.redirect_uri,
+            'code'        : code,
+        }
+        if self.config.client_secret:
+            params['client_secret'] = self.config.client_secret
+        return params
+    
+    def token_request_kwargs(self, code: str) -> dict:
+        if self.token_method == 'GET':
+            return {'params': self.token_params(code)}
+        return {'data': self.token_params(code)}
+    
+    def parse_token(self, result: dict) -> str:
+        if result.get('error'):
+            raise RequestsError(result.get('error_code') or result.get('error'))
+        return result['access_token']
+    
+    def profile_request_kwargs(self, access_token: str) -> dict:
+        return {
+            'headers': {
+                'Authorization': f'Bearer {access_token}',
+                'Content-Type' : CommonConst.CONTENT_TYPE_X_WWW
+            }
+        }
+    
+    def extract_email(self, profile: dict) -> str:
+        return profile['email']
+    
+    def is_email_verified(self, profile: dict) -> bool:
+        return profile.get('email_verified') in (True, 'true')
+    
+    def verified_email(self, profile: dict) -> str:
+        if not self.is_email_verified(profile):
+            raise SocialEmailNotVerifiedException(self.name)
+        return normalize_email(self.extract_email(profile))
+    
+    def token_info_request_kwargs(self, access_token: str) -> dict:
+        return self.profile_request_kwargs(access_token)
+    
+    def token_app_id(self, token_info: dict) -> Optional[str]:
+        raise NotImplementedError
+    
+    def check_token_info(self, token_info: dict) -> None:
+        app_id = self.token_app_id(token_info)
+        if app_id is None or str(app_id) != str(self.config.app_id):
+            raise SocialTokenInvalidException(self.name)
+    
+    def verify_token(self, access_token: str) -> None:
+        if self.config.token_info_url:
+            self.check_token_info(self.http_client.get(self.config.token_info_url, breaker=self.breaker,
+                                                       **self.token_info_request_kwargs(access_token)))
+    
+    def exchange_code(self, code: str) -> str:
+        result = self.http_client.request(self.token_method, self.config.token_url,
+                                          breaker=self.breaker, **self.token_request_kwargs(code))
+        return self.parse_token(result)
+    
+    def get_profile(self, access_token: str) -> dict:
+        return self.http_client.get(self.config.profile_url, breaker=self.breaker,
+                                    **self.profile_request_kwargs(access_token))
+    
+    def get_email(self, access_token: str) -> str:
+        email = social_profile_cache.get(self.name, access_token)
+        if email is None:
+            self.verify_token(access_token)
+            email = self.verified_email(self.get_profile(access_token))
+            social_profile_cache.set(self.name, access_token, email)
+        return email
+    
+    async def aexchange_code(self, code: str) -> str:
+        result = await self.async_http_client.request(self.token_method, self.config.token_url,
+                                                      breaker=self.breaker, **self.token_request_kwargs(code))
+        return self.parse_token(result)
+    
+    async def aget_profile(self, access_token: str) -> dict:
+        return await self.async_http_client.get(self.config.profile_url, breaker=self.breaker,
+                                                **self.profile_request_kwargs(access_token))
+    
+    async def aget_token_info(self, access_token: str) -> Optional[dict]:
+        if not self.config.token_info_url:
+            return None
+        return await self.async_http_client.get(self.config.token_info_url, breaker=self.breaker,
+                                                **self.token_info_request_kwargs(access_token))
+    
+    async def aget_email(self, access_token: str) -> str:
+        email = await social_profile_cache.aget(self.name, access_token)
+        if email is None:
+            # token info / 프로필 조회를 동시에 요청하고, 발급 앱 확인을 통과한 경우에만 프로필 사용
+            token_info, profile = await asyncio.gather(self.aget_token_info(access_token), self.aget_profile(access_token))
+            if token_info is not None:
+                self.check_token_info(token_info)
+            
+            email = self.verified_email(profile)
+            await social_profile_cache.aset(self.name, access_token, email)
+        return email
+
+
+class KakaoProvider(BaseSocialProvider):
+    name         = 'kakao'
+    signup_type  = SocialSignUpTypeEnum.KAKAO
+    token_method = 'GET'
+    
+    def extract_email(self, profile: dict) -> str:
+        return profile['kakao_account']['email']
+    
+    def is_email_verified(self, profile: dict) -> bool:
+        account = profile['kakao_account']
+        return bool(account.get('is_email_valid') and account.get('is_email_verified'))
+    
+    def token_app_id(self, token_info: dict) -> Optional[str]:
+        # GET /v1/user/access_token_info -> {'id', 'expires_in', 'app_id'}
+        return token_info.get('app_id')
+
+
+class NaverProvider(BaseSocialProvider):
+    name        = 'naver'
+    signup_type = SocialSignUpTypeEnum.NAVER
+    
+    def parse_token(self, result: dict) -> str:
+        if result.get('error'):
+            raise RequestsError(result.get('error_description') or result.get('error'))
+        return result['access_token']
+    
+    def extract_email(self, profile: dict) -> str:
+        return profile['response']['email']
+    
+    def is_email_verified(self, profile: dict) -> bool:
+        # 네이버는 인증 여부 필드가 없고 본인 확인된 연락처 이메일만 제공
+        return True
+
+
+class FacebookProvider(BaseSocialProvider):
+    name         = 'facebook'
+    signup_type  = SocialSignUpTypeEnum.FACEBOOK
+    token_method = 'GET'
+    
+    def parse_token(self, result: dict) -> str:
+        if result.get('error'):
+            raise RequestsError(result['error'].get('message') if isinstance(result['error'], dict) else result['error'])
+        return result['access_token']
+    
+    def profile_request_kwargs(self, access_token: str) -> dict:
+        return {'params': {'fields': 'id,email', 'access_token': access_token}}
+    
+    def is_email_verified(self, profile: dict) -> bool:
+        # Graph API 는 인증 여부 필드가 없고 인증된 기본 이메일만 제공
+        return True
+    
+    def token_info_request_kwargs(self, access_token: str) -> dict:
+        # debug_token 은 앱 토큰 ({app_id}|{app_secret}) 으로 호출
+        return {'params': {'input_token': access_token,
+                           'access_token': f'{self.config.client_id}|{self.config.client_secret}'}}
+    
+    def token_app_id(self, token_info: dict) -> Optional[str]:
+        data = token_info.get('data') or {}
+        return data.get('app_id') if data.get('is_valid') else None
+
+
+class GoogleProvider(BaseSocialProvider):
+    name        = 'google'
+    signup_type = SocialSignUpTypeEnum.GOOGLE
+    
+    def profile_request_kwargs(self, access_token: str) -> dict:
+        return {'headers': {'Authorization': f'Bearer {access_token}'}}
+    
+    def token_info_request_kwargs(self, access_token: str) -> dict:
+        return {'params': {'access_token': access_token}}
+    
+    def token_app_id(self, token_info: dict) -> Optional[str]:
+        # tokeninfo 의 aud 는 토큰을 발급받은 OAuth 클라이언트 ID
+        return token_info.get('aud')
+
+
+class AppleProvider(BaseSocialProvider):
+    """ 애플 로그인
+        - 프로필 API 가 없어 토큰 응답의 id_token(JWT) 에서 이메일을 꺼냄
+        - exchange_code 는 access_token 대신 id_token 을 리턴하고, get_profile 은 id_token 서명 / aud / iss 를
+          애플 JWKS(profile_url) 로 검증한 claim 을 리턴 (PyJWT 필요)
+        - JWKS 는 공용 HTTP 클라이언트 (커넥션 풀 / 서킷 브레이커) 로 조회하여 APPLE_JWKS_TTL 동안 캐시,
+          모르는 kid 가 오면 (키 로테이션) APPLE_JWKS_MIN_REFRESH 간격으로 재조회
+        - client_secret 은 애플 개발자 키로 서명한 JWT 를 settings 에 설정
+    """
+    name        = 'apple'
+    signup_type = SocialSignUpTypeEnum.APPLE
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._keys       = dict()  # kid -> 서명 검증 key
+        self._fetched_at = 0.0
+    
+    def parse_token(self, result: dict) -> str:
+        if result.get('error'):
+            raise RequestsError(result.get('error'))
+        return result['id_token']
+    
+    def get_kid(self, id_token: str) -> str:
+        import jwt
+        
+        try:
+            return jwt.get_unverified_header(id_token).get('kid')
+        except jwt.PyJWTError as e:
+            raise RequestsError(f'{self.name} invalid id_token: {e.__class__.__name__}')
+    
+    def needs_fetch(self, kid: str) -> bool:
+        age = time.monotonic() - self._fetched_at
+        if age >= SocialProviderConst.APPLE_JWKS_TTL:
+            return True
+        return kid not in self._keys and age >= SocialProviderConst.APPLE_JWKS_MIN_REFRESH
+    
+    def set_keys(self, jwks: dict) -> None:
+        import jwt
+        
+        try:
+            key_set = jwt.PyJWKSet.from_dict(jwks)
+        except jwt.PyJWTError as e:
+            raise RequestsError(f'{self.name} invalid jwks: {e.__class__.__name__}')
+        
+        self._keys       = {key.key_id: key.key for key in key_set.keys}
+        self._fetched_at = time.monotonic()
+    
+    def decode_id_token(self, id_token: str, kid: str) -> dict:
+        import jwt
+        
+        key = self._keys.get(kid)
+        if key is None:
+            raise RequestsError(f'{self.name} invalid id_token: unknown kid')
+        
+        try:
+            return jwt.decode(id_token, key, algorithms=['RS256'], audience=self.config.client_id,
+                              issuer=SocialProviderConst.APPLE_ISSUER)
+        except jwt.PyJWTError as e:
+            raise RequestsError(f'{self.name} invalid id_token: {e.__class__.__name__}')
+    
+    def get_profile(self, access_token: str) -> dict:
+        kid = self.get_kid(access_token)
+        if self.needs_fetch(kid):
+            self.set_keys(self.http_client.get(self.config.profile_url, breaker=self.breaker))
+        return self.decode_id_token(access_token, kid)
+    
+    async def aget_profile(self, access_token: str) -> dict:
+        kid = self.get_kid(access_token)
+        if self.needs_fetch(kid):
+            self.set_keys(await self.async_http_client.get(self.config.profile_url, breaker=self.breaker))
+        return self.decode_id_token(access_token, kid)
+
+
+PROVIDER_CLASSES = {
+    provider_class.signup_type: provider_class
+    for provider_class in (KakaoProvider, NaverProvider, FacebookProvider, GoogleProvider, AppleProvider)
+}
@@ -0,0 +1,115 @@
+import threading
+
+from typing                     import Optional
+
+from django.conf                import settings
+
+from account.const              import SocialProviderConst
+from account.exceptions         import SocialProviderNotFoundException
+from account.social.http_client import SocialHttpClient, AsyncSocialHttpClient
+from account.social.providers   import BaseSocialProvider, SocialProviderConfig, PROVIDER_CLASSES
+
+
+class SocialProviderRegistry:
+    """ 소셜 로그인 provider 레지스트리
+        - 첫 조회 시 load() 하여 provider 설정/엔드포인트를 한 번만 해석 (기동 시간에서 제외)
+        - 설정이 있는 provider 만 등록 (settings.SOCIAL_PROVIDERS, 카카오는 기존 KAKAO_* 설정도 지원)
+        - 전 provider 가 하나의 SocialHttpClient / AsyncSocialHttpClient 커넥션 풀을 공유
+        
+        settings.SOCIAL_PROVIDERS 예시
+            {
+                'naver': {'CLIENT_ID': '...', 'CLIENT_SECRET': '...', 'REDIRECT_URI': '...'},
+                'google': {'CLIENT_ID': '...', 'CLIENT_SECRET': '...', 'REDIRECT_URI': '...', 'SCOPE': 'openid email'},
+            }
+    """
+    
+    def __init__(self):
+        self._lock    = threading.Lock()
+        self._loaded  = False
+        self._by_name = dict()  # name -> provider
+        self._by_type = dict()  # social_signup_type -> provider
+        
+        self.http_client       = SocialHttpClient(name='social')
+        self.async_http_client = AsyncSocialHttpClient(name='social', breaker=self.http_client.breaker)
+    
+    def load(self) -> None:
+        """ settings 로부터 provider 재구성 (설정 변경 후 명시적으로 호출 가능) """
+        with self._lock:
+            by_name, by_type = dict(), dict()
+            
+            for signup_type, provider_class in PROVIDER_CLASSES.items():
+                config = self._build_config(provider_class.name)
+                if config is None:
+                    continue
+                
+                provider = provider_class(config=config, http_client=self.http_client,
+                                          async_http_client=self.async_http_client)
+                by_name[provider.name]     = provider
+                by_type[signup_type.value] = provider
+            
+            self._by_name, self._by_type = by_name, by_type
+            self._loaded = True
+    
+    def _build_config(self, name: str) -> Optional[SocialProviderConfig]:
+        endpoints = SocialProviderConst.ENDPOINTS[name]
+        options   = dict(getattr(settings, 'SOCIAL_PROVIDERS', {}).get(name, {}))
+        
+        if name == 'kakao' and not options and hasattr(settings, 'KAKAO_REST_API_KEY'):
+            kakao_host     = getattr(settings, 'KAKAO_HOST', None)
+            kakao_api_host = getattr(settings, 'KAKAO_API_HOST', None)
+            options = {
+                'CLIENT_ID'   : settings.KAKAO_REST_API_KEY,
+                'REDIRECT_URI': settings.KAKAO_SIGNUP_REDIRECT_URI,
+                'APP_ID'      : getattr(settings, 'KAKAO_APP_ID', None),
+            }
+            if kakao_host:
+                options['AUTHORIZE_URL']  = f'{kakao_host}/oauth/authorize'
+                options['TOKEN_URL']      = f'{kakao_host}/oauth/token'
+            if kakao_api_host:
+                options['PROFILE_URL']    = f'{kakao_api_host}/v2/user/me'
+                options['TOKEN_INFO_URL'] = f'{kakao_api_host}/v1/user/access_token_info'
+        
+        if not options.get('CLIENT_ID'):
+            return None
+        
+        return SocialProviderConfig(
+            client_id      = options['CLIENT_ID'],
+            client_secret  = options.get('CLIENT_SECRET'),
+            redirect_uri   = options.get('REDIRECT_URI'),
+            scope          = options.get('SCOPE'),
+            authorize_url  = options.get('AUTHORIZE_URL', endpoints['AUTHORIZE_URL']),
+            token_url      = options.get('TOKEN_URL', endpoints['TOKEN_URL']),
+            profile_url    = options.get('PROFILE_URL', endpoints['PROFILE_URL']),
+            app_id         = options.get('APP_ID'),
+            token_info_url = options.get('TOKEN_INFO_URL', endpoints.get('TOKEN_INFO_URL')),
+        )
+    
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+    
+    def get(self, name: str) -> BaseSocialProvider:
+        """ provider 이름(kakao, naver ...) 으로 조회. 없으면 SocialProviderNotFoundException """
+        self._ensure_loaded()
+        
+        provider = self._by_name.get((name or '').lower())
+        if provider is None:
+            raise SocialProviderNotFoundException(name)
+        return provider
+    
+    def get_by_type(self, social_signup_type: int) -> BaseSocialProvider:
+        """ SocialSignUpTypeEnum 값으로 조회 """
+        self._ensure_loaded()
+        
+        provider = self._by_type.get(social_signup_type)
+        if provider is None:
+            raise SocialProviderNotFoundException(social_signup_type)
+        return provider
+    
+    @property
+    def names(self) -> list:
+        self._ensure_loaded()
+        return list(self._by_name.keys())
+
+
+provider_registry = SocialProviderRegistry()
@@ -0,0 +1,154 @@
+from unittest              import mock
+
+from asgiref.sync          import async_to_sync
+
+from django.test           import AsyncClient, SimpleTestCase, TestCase, override_settings
+from django.urls           import path
+from django.utils          import timezone
+
+from account.const         import RateLimitConst
+from account.enums         import SocialSignUpTypeEnum
+from account.exceptions    import RateLimitExceededException
+from account.tests.utils   import VIEW_TEST_SETTINGS, TEST_PASSWORD, create_reference_rows, create_user
+from account.throttling    import CacheBackend, LocalMemoryBackend, rate_limiter
+from account.views         import async_views
+
+# urls 는 import 시점에 ACCOUNT_ASYNC_VIEWS 를 보므로 테스트용 urlconf 로 async 뷰를 연결
+urlpatterns = [
+    path('sign-in/', async_views.sign_in),
+    path('', async_views.user_collection),
+    path('<int:pk>/', async_views.user_detail),
+]
+
+ASYNC_VIEW_TEST_SETTINGS = dict(VIEW_TEST_SETTINGS, ROOT_URLCONF='account.tests.test_async_views', ACCOUNT_ASYNC_VIEWS=True)
+
+
+@override_settings(**ASYNC_VIEW_TEST_SETTINGS)
+class AsyncSignInTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        cls.user        = create_user('async-sign-in@class101.net')
+        cls.social_user = create_user('async-social@class101.net', password=None, social_signup_type=SocialSignUpTypeEnum.KAKAO)
+        cls.deleted     = create_user('async-deleted@class101.net', is_deleted=True, deleted_at=timezone.now())
+    
+    def setUp(self):
+        self.async_client = AsyncClient()
+    
+    async def sign_in(self, **data):
+        return await self.async_client.post('/sign-in/', data, content_type='application/json')
+    
+    async def test_sign_in_issues_tokens(self):
+        response = await self.sign_in(email='Async-Sign-In@class101.net', password=TEST_PASSWORD,
+                                      social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access_token', response.content.decode())
+    
+    async def test_social_user_gets_no_token(self):
+        for password in (None, 'guess'):
+            response = await self.sign_in(email=self.social_user.email, password=password,
+                                          social_signup_type=SocialSignUpTypeEnum.KAKAO.value)
+            
+            self.assertEqual(response.status_code, 400)
+            self.assertNotIn('access_token', response.content.decode())
+    
+    async def test_failures_are_indistinguishable(self):
+        responses = [
+            await self.sign_in(email='nobody@class101.net', password=TEST_PASSWORD, social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value),
+            await self.sign_in(email=self.deleted.email, password=TEST_PASSWORD, social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value),
+            await self.sign_in(email=self.user.email, password='wrong', social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value),
+        ]
+        
+        self.assertEqual({response.status_code for response in responses}, {400})
+        self.assertEqual(len({response.content for response in responses}), 1)
+    
+    @override_settings(ACCOUNT_RATE_LIMIT_ENABLED=True, ACCOUNT_RATE_LIMITS={'sign_in_ip': (2, 60)})
+    async def test_rate_limited(self):
+        with mock.patch.object(rate_limiter, '_backend', LocalMemoryBackend()):
+            statuses = [(await self.sign_in(email=self.user.email, password='wrong',
+                                            social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value)).status_code
+                        for _ in range(3)]
+        
+        self.assertEqual(statuses, [400, 400, 429])
+
+
+@override_settings(**ASYNC_VIEW_TEST_SETTINGS)
+class AsyncUserCollectionTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        cls.user    = create_user('async-exists@class101.net')
+        cls.deleted = create_user('async-left@class101.net', is_deleted=True, deleted_at=timezone.now())
+    
+    def setUp(self):
+        self.async_client = AsyncClient()
+    
+    async def sign_up(self, email: str):
+        return await self.async_client.post('/', {'email': email, 'password': TEST_PASSWORD,
+                                                  'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value},
+                                            content_type='application/json')
+    
+    async def test_sign_up(self):
+        response = await self.sign_up('async-new@class101.net')
+        self.assertEqual(response.status_code, 201)
+    
+    async def test_existing_and_deleted_emails_are_indistinguishable(self):
+        existing = await self.sign_up(self.user.email)
+        deleted  = await self.sign_up(self.deleted.email)
+        
+        self.assertEqual((existing.status_code, deleted.status_code), (400, 400))
+        self.assertEqual(existing.content, deleted.content)
+    
+    def test_retrieve_matches_sync(self):
+        async_response = async_to_sync(self.async_client.get)(f'/{self.user.pk}/')
+        with override_settings(ROOT_URLCONF='account.urls'):
+            sync_response = self.client.get(f'/{self.user.pk}/')
+        
+        self.assertEqual(async_response.status_code, 200)
+        self.assertEqual(async_response.json(), sync_response.json())
+    
+    async def test_list_requires_admin(self):
+        response = await self.async_client.get('/')
+        self.assertIn(response.status_code, (401, 403))
+    
+    async def test_update_requires_admin(self):
+        for method in (self.async_client.put, self.async_client.patch):
+            response = await method(f'/{self.user.pk}/', {'email': 'taken@class101.net'}, content_type='application/json')
+            self.assertIn(response.status_code, (401, 403))
+
+
+class AsyncRateLimiterTest(SimpleTestCase):
+    """ ahit / acheck_lockout / arecord_failure / areset_failures 가 sync 메서드와 같은 제한을 적용 """
+    
+    def backends(self):
+        yield LocalMemoryBackend()
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            yield CacheBackend('default')
+    
+    @override_settings(ACCOUNT_RATE_LIMIT_ENABLED=True, ACCOUNT_RATE_LIMITS={'sign_in_ip': (2, 60)})
+    async def test_ahit(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.__class__.__name__), mock.patch.object(rate_limiter, '_backend', backend):
+                await rate_limiter.ahit('sign_in_ip', '127.0.0.1')
+                await rate_limiter.ahit('sign_in_ip', '127.0.0.1')
+                with self.assertRaises(RateLimitExceededException):
+                    await rate_limiter.ahit('sign_in_ip', '127.0.0.1')
+    
+    @override_settings(ACCOUNT_RATE_LIMIT_ENABLED=True)
+    async def test_lockout(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.__class__.__name__), mock.patch.object(rate_limiter, '_backend', backend):
+                for _ in range(RateLimitConst.FAILURE_THRESHOLD):
+                    await rate_limiter.arecord_failure('locked@class101.net')
+                with self.assertRaises(RateLimitExceededException):
+                    await rate_limiter.acheck_lockout('locked@class101.net')
+                
+                # sync 메서드와 같은 키를 사용
+                with self.assertRaises(RateLimitExceededException):
+                    rate_limiter.check_lockout('locked@class101.net')
+                
+                await rate_limiter.areset_failures('locked@class101.net')
+                self.assertEqual(await backend.aget(rate_limiter.make_key('failure', 'locked@class101.net')), 0)
@@ -0,0 +1,69 @@
+import json
+
+from django.test          import TestCase, override_settings
+from rest_framework.test  import APIClient
+
+from account.bulk_import  import UserBulkImporter
+from account.enums        import AccountTypeEnum, SocialSignUpTypeEnum
+from account.exceptions   import UserImportTooLargeException
+from account.models       import User
+from account.passwords    import password_manager
+from account.tests.utils  import VIEW_TEST_SETTINGS, create_reference_rows, create_user
+from account.tokens       import token_manager
+
+
+def ndjson(count: int, prefix: str='bulk') -> bytes:
+    return ''.join(
+        json.dumps({'email': f'{prefix}-{i}@class101.net', 'password': f'password-{i}',
+                    'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value}) + '\n'
+        for i in range(count)
+    ).encode()
+
+
+class UserBulkImporterTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+    
+    def test_passwords_are_hashed(self):
+        result = UserBulkImporter(chunk_size=2).run(ndjson(3).splitlines(), 'ndjson')
+        
+        self.assertEqual(result.created, 3)
+        for i, user in enumerate(User.objects.order_by('email')):
+            self.assertEqual(password_manager.verify(f'password-{i}', user.password), (True, False))
+    
+    def test_max_rows_rejects_before_saving(self):
+        with self.assertRaises(UserImportTooLargeException):
+            UserBulkImporter(chunk_size=2, max_rows=4).run(ndjson(5).splitlines(), 'ndjson')
+        
+        self.assertFalse(User.objects.exists())
+
+
+@override_settings(**VIEW_TEST_SETTINGS, ACCOUNT_USER_IMPORT_MAX_HTTP_ROWS=3)
+class BulkCreateViewTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        cls.admin = create_user('admin@class101.net', account_type=AccountTypeEnum.ADMIN)
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token_manager.issue(self.admin.id)['access_token']}")
+    
+    def post(self, body: bytes):
+        return self.client.generic('POST', '/bulk/', body, content_type='application/x-ndjson')
+    
+    def test_within_limit(self):
+        response = self.post(ndjson(3))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(User.objects.filter(email__startswith='bulk-').count(), 3)
+    
+    def test_over_limit_is_rejected(self):
+        response = self.post(ndjson(4))
+        
+        self.assertEqual(response.status_code, 413)
+        self.assertIn('import_users', response.content.decode())
+        self.assertFalse(User.objects.filter(email__startswith='bulk-').exists())
@@ -0,0 +1,62 @@
+from django.test          import TestCase
+
+from account.const        import EmailOutboxConst
+from account.email_outbox import EmailOutboxWorker, email_outbox_query, hash_token
+from account.models       import EmailOutbox, EmailVerificationToken
+from account.tests.utils  import create_reference_rows, create_user
+
+
+class StubTransport:
+    """ 모든 row 를 error 결과로 처리 (None 이면 성공). 발송 시점의 payload 를 기록 """
+    
+    def __init__(self, error: str=None):
+        self.error    = error
+        self.payloads = list()
+    
+    def send_batch(self, rows: list) -> dict:
+        self.payloads.extend(dict(row.payload) for row in rows)
+        return {row.id: self.error for row in rows}
+
+
+class EmailOutboxTokenTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+    
+    def setUp(self):
+        self.user = create_user('outbox@class101.net')
+        email_outbox_query.enqueue_sign_up(self.user)
+        self.verification = EmailOutbox.objects.get(kind=EmailOutboxConst.KIND_VERIFICATION, to_email=self.user.email)
+    
+    def test_token_available_until_sent(self):
+        raw_token = self.verification.payload['token']
+        self.assertTrue(EmailVerificationToken.objects.filter(token_hash=hash_token(raw_token)).exists())
+        
+        transport = StubTransport()
+        EmailOutboxWorker(transport=transport).run(until_empty=True)
+        
+        self.assertIn({'token': raw_token}, transport.payloads)
+        
+        self.verification.refresh_from_db()
+        self.assertEqual(self.verification.status, EmailOutboxConst.STATUS_SENT)
+        self.assertEqual(self.verification.payload, {})
+        
+        # 발송된 링크의 토큰으로는 그대로 인증 가능
+        self.assertTrue(email_outbox_query.verify_email(raw_token))
+    
+    def test_token_kept_for_retry_and_cleared_on_failure(self):
+        worker = EmailOutboxWorker(transport=StubTransport(error='down'))
+        worker.process_batch()
+        
+        self.verification.refresh_from_db()
+        self.assertEqual(self.verification.status, EmailOutboxConst.STATUS_PENDING)
+        self.assertIn('token', self.verification.payload)
+        
+        EmailOutbox.objects.filter(pk=self.verification.pk).update(attempts=EmailOutboxConst.MAX_ATTEMPTS - 1,
+                                                                   next_attempt_at=self.verification.created_at)
+        worker.process_batch()
+        
+        self.verification.refresh_from_db()
+        self.assertEqual(self.verification.status, EmailOutboxConst.STATUS_FAILED)
+        self.assertEqual(self.verification.payload, {})
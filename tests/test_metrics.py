@@ -0,0 +1,202 @@
+from unittest                  import mock
+
+from django.db                 import connection
+from django.http               import HttpResponse
+from django.test               import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls               import path
+from django.views.defaults     import page_not_found
+
+from account.const             import RequestMetricsConst
+from account.enums             import SocialSignUpTypeEnum
+from account.metrics           import Histogram, RequestMetrics, escape_label_value, resolve_action
+from account.social.fake_kakao import fake_kakao
+from account.social.registry   import provider_registry
+from account.tests.utils       import VIEW_TEST_SETTINGS, TEST_PASSWORD, create_reference_rows, create_user
+from account.views             import social_login_view
+from account.views.user_views  import UserViewSet
+
+MIDDLEWARE = [
+    'account.metrics.AccountMetricsMiddleware',
+    'account.tests.test_metrics.LaterMiddleware',
+]
+
+
+def atomic_view(request):
+    return HttpResponse(str(connection.in_atomic_block))
+
+
+def failing_view(request):
+    raise ValueError('failing view')
+
+
+class LaterMiddleware:
+    """ AccountMetricsMiddleware 뒤에 등록되는 미들웨어 (process_view / process_exception 이 실행되는지 확인용) """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        return self.get_response(request)
+    
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.path == '/short-circuit/':
+            return HttpResponse('short-circuit')
+        return None
+    
+    def process_exception(self, request, exception):
+        return HttpResponse(f'handled {exception}', status=503)
+
+
+urlpatterns = [
+    path('atomic/', atomic_view),
+    path('failing/', failing_view),
+    path('short-circuit/', atomic_view),
+]
+
+
+class ObservedMetricsMixin:
+    """ 테스트마다 새 RequestMetrics 로 바꾸고 집계된 trace 를 self.observed 에 모음 """
+    
+    def setUp(self):
+        super().setUp()
+        self.observed = list()
+        
+        metrics = RequestMetrics()
+        metrics.observe = lambda trace, elapsed: self.observed.append(trace)
+        
+        patcher = mock.patch('account.metrics.request_metrics', metrics)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def observed_trace(self, action: str):
+        traces = [trace for trace in self.observed if trace.action == action]
+        self.assertEqual(len(traces), 1, [trace.action for trace in self.observed])
+        return traces[0]
+
+
+class EscapeLabelValueTest(SimpleTestCase):
+    
+    def test_escape(self):
+        self.assertEqual(escape_label_value('a"b\\c\nd'), 'a\\"b\\\\c\\nd')
+    
+    def test_histogram_render_escapes_label(self):
+        histogram = Histogram('account_test_seconds', 'test', buckets=(0.1,))
+        histogram.observe('x"}\nfake_metric 1', 0.05)
+        
+        rendered = '\n'.join(histogram.render())
+        self.assertIn('action="x\\"}\\nfake_metric 1"', rendered)
+        self.assertNotIn('\nfake_metric 1', rendered)
+    
+    def test_slow_requests_escaped(self):
+        request_metrics = RequestMetrics()
+        request_metrics.slow_requests['a"b'] = 1
+        
+        self.assertIn('account_slow_requests_total{action="a\\"b"} 1', request_metrics.render())
+
+
+class ResolveActionTest(SimpleTestCase):
+    
+    def setUp(self):
+        self.request = RequestFactory().post('/social/kakao/login/')
+        
+        overrider = override_settings(SOCIAL_PROVIDERS={'kakao': {'CLIENT_ID': 'test'}})
+        overrider.enable()
+        self.addCleanup(provider_registry.load)
+        self.addCleanup(overrider.disable)
+        provider_registry.load()
+    
+    def test_registered_provider(self):
+        action = resolve_action(self.request, social_login_view.social_login, {'provider': 'KAKAO'})
+        self.assertEqual(action, 'social_login:kakao')
+    
+    def test_unknown_provider(self):
+        for provider in ('no-such-provider', 'naver', 'x' * 1000):
+            action = resolve_action(self.request, social_login_view.social_login, {'provider': provider})
+            self.assertEqual(action, 'social_login:unknown')
+    
+    def test_non_account_view(self):
+        # 이 테스트 모듈도 account 패키지이므로 Django 기본 뷰로 확인
+        self.assertIsNone(resolve_action(self.request, page_not_found, {}))
+
+
+@override_settings(**VIEW_TEST_SETTINGS, MIDDLEWARE=MIDDLEWARE, ACCOUNT_METRICS_ENABLED=True)
+class EndpointQueryBudgetTest(ObservedMetricsMixin, TestCase):
+    """ 미들웨어가 집계한 액션별 쿼리 수가 QUERY_BUDGETS 이내인지 (check_endpoint_query_counts 와 같은 기준) """
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        cls.user = create_user('query-budget@class101.net')
+    
+    def assertWithinBudget(self, action: str, response, status_code: int):
+        self.assertEqual(response.status_code, status_code, response.content)
+        
+        trace = self.observed_trace(action)
+        self.assertLessEqual(trace.db_count, RequestMetricsConst.QUERY_BUDGETS[action])
+    
+    def test_sign_in(self):
+        response = self.client.post('/sign-in/', {'email': self.user.email, 'password': TEST_PASSWORD,
+                                                  'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value},
+                                    content_type='application/json')
+        self.assertWithinBudget('sign_in', response, 200)
+    
+    def test_create(self):
+        response = self.client.post('/', {'email': 'new-query-budget@class101.net', 'password': TEST_PASSWORD,
+                                          'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value},
+                                    content_type='application/json')
+        self.assertWithinBudget('create', response, 201)
+    
+    def test_retrieve(self):
+        self.assertWithinBudget('retrieve', self.client.get(f'/{self.user.pk}/'), 200)
+    
+    def test_list(self):
+        # 관리자 확인 쿼리는 QUERY_BUDGETS 에 포함되지 않음 (check_endpoint_query_counts 와 같이 제외)
+        with mock.patch.object(UserViewSet, 'admin_permission_classes', []):
+            self.assertWithinBudget('list', self.client.get('/'), 200)
+    
+    def test_social_login_kakao(self):
+        with fake_kakao():
+            created = self.client.post('/social/kakao/login/', {'code': '1'}, content_type='application/json')
+            self.assertWithinBudget('social_login:kakao', created, 201)
+            
+            self.observed.clear()
+            signed_in = self.client.post('/social/kakao/login/', {'code': '1'}, content_type='application/json')
+            self.assertWithinBudget('social_login:kakao', signed_in, 200)
+    
+    def test_unknown_provider(self):
+        response = self.client.post('/social/no-such-provider/login/', {'code': '1'}, content_type='application/json')
+        
+        self.assertEqual(response.status_code, 404)
+        self.observed_trace('social_login:unknown')
+
+
+@override_settings(ROOT_URLCONF='account.tests.test_metrics', MIDDLEWARE=MIDDLEWARE, ACCOUNT_METRICS_ENABLED=True)
+class AccountMetricsMiddlewareTest(ObservedMetricsMixin, TransactionTestCase):
+    """ 미들웨어가 뷰를 직접 호출하지 않으므로 Django 의 뷰 처리 (뒤 미들웨어, ATOMIC_REQUESTS) 가 그대로 적용 """
+    
+    def test_later_process_view_runs(self):
+        response = self.client.get('/short-circuit/')
+        
+        self.assertEqual(response.content, b'short-circuit')
+        self.observed_trace('atomic_view')
+    
+    def test_later_process_exception_runs(self):
+        response = self.client.get('/failing/')
+        
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.content, b'handled failing view')
+        self.observed_trace('failing_view')
+    
+    def test_atomic_requests(self):
+        with mock.patch.dict(connection.settings_dict, {'ATOMIC_REQUESTS': True}):
+            response = self.client.get('/atomic/')
+        
+        self.assertEqual(response.content, b'True')
+        self.observed_trace('atomic_view')
+    
+    def test_unresolved_request_not_observed(self):
+        # URL 이 없으면 process_view 가 호출되지 않아 action 이 정해지지 않음
+        response = self.client.get('/no-such-path/')
+        
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.observed, [])
@@ -0,0 +1,58 @@
+import importlib
+import io
+
+from contextlib           import redirect_stdout
+from types                import SimpleNamespace
+from unittest             import mock
+
+from django.apps          import apps
+from django.db            import connection
+from django.test          import TestCase
+from django.utils         import timezone
+
+from account.models       import User
+from account.tests.utils  import create_reference_rows, create_user
+from account.utils        import normalize_email
+
+normalize_user_email = importlib.import_module('account.migrations.0005_normalize_user_email')
+
+
+class NormalizeUserEmailMigrationTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+    
+    def run_migration(self):
+        normalize_user_email.normalize_user_emails(apps, SimpleNamespace(connection=connection))
+    
+    def test_same_rule_as_normalize_email(self):
+        emails = ['Ｆｕｌｌｗｉｄｔｈ@class101.net', ' Spaced@Class101.net ', 'ﬁle@class101.net', 'done@class101.net']
+        users  = [create_user(email) for email in emails]
+        users.append(create_user('Ｄｅｌｅｔｅｄ@class101.net', is_deleted=True, deleted_at=timezone.now()))
+        
+        self.run_migration()
+        
+        for user, email in zip(users, emails + ['Ｄｅｌｅｔｅｄ@class101.net']):
+            self.assertEqual(User.all_objects.get(pk=user.pk).email, normalize_email(email))
+    
+    def test_duplicate_after_normalization_is_skipped(self):
+        existing  = create_user('dup@class101.net')
+        duplicate = create_user('ｄｕｐ@class101.net')
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.run_migration()
+        
+        self.assertIn(str(duplicate.pk), output.getvalue())
+        self.assertEqual(User.all_objects.get(pk=existing.pk).email, 'dup@class101.net')
+        self.assertEqual(User.all_objects.get(pk=duplicate.pk).email, 'ｄｕｐ@class101.net')
+    
+    def test_batches(self):
+        users = [create_user(f'Batch-{i}@class101.net') for i in range(3)]
+        
+        with mock.patch.object(normalize_user_email, 'BATCH_SIZE', 2):
+            self.run_migration()
+        
+        self.assertEqual([User.all_objects.get(pk=user.pk).email for user in users],
+                         [f'batch-{i}@class101.net' for i in range(3)])
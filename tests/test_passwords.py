@@ -0,0 +1,49 @@
+import io
+
+from django.core.management import call_command
+from django.test            import SimpleTestCase, TestCase, override_settings
+
+from account.models         import User
+from account.passwords      import password_manager
+from account.tests.utils    import TEST_PASSWORD, create_reference_rows, create_user
+
+
+class PlaintextPasswordTest(SimpleTestCase):
+    
+    @override_settings(ACCOUNT_PLAINTEXT_PASSWORD_UNTIL='2999-12-31')
+    def test_plaintext_allowed_until_end_date(self):
+        self.assertEqual(password_manager.verify('plain', 'plain'), (True, True))
+    
+    @override_settings(ACCOUNT_PLAINTEXT_PASSWORD_UNTIL='2000-01-01')
+    def test_plaintext_rejected_after_end_date(self):
+        self.assertEqual(password_manager.verify('plain', 'plain'), (False, False))
+        self.assertEqual(password_manager.verify(TEST_PASSWORD, password_manager.hash(TEST_PASSWORD)), (True, False))
+
+
+class HashPlaintextPasswordsTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        cls.hashed = create_user('hashed@class101.net')
+        cls.plain  = [create_user(f'plain-{i}@class101.net', password=None) for i in range(3)]
+        User.all_objects.filter(pk__in=[user.pk for user in cls.plain]).update(password='plain-password')
+    
+    def call(self, *args) -> str:
+        stdout = io.StringIO()
+        call_command('hash_plaintext_passwords', *args, stdout=stdout)
+        return stdout.getvalue()
+    
+    def test_dry_run(self):
+        self.assertIn('candidates: 3', self.call('--dry-run'))
+        self.assertEqual(User.all_objects.filter(password='plain-password').count(), 3)
+    
+    def test_hashes_plaintext_rows_only(self):
+        hashed_password = User.all_objects.get(pk=self.hashed.pk).password
+        
+        self.assertIn('hashed: 3', self.call('--batch-size', '2'))
+        self.assertIn('hashed: 0', self.call())
+        
+        self.assertEqual(User.all_objects.get(pk=self.hashed.pk).password, hashed_password)
+        for user in User.all_objects.filter(pk__in=[user.pk for user in self.plain]):
+            self.assertEqual(password_manager.verify('plain-password', user.password), (True, False))
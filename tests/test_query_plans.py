@@ -0,0 +1,32 @@
+from unittest                      import skipUnless
+
+from django.db                     import connection
+from django.test                   import TestCase, override_settings
+
+from account.management.query_plan import QueryPlanInspector, user_query_calls
+from account.tests.utils           import create_reference_rows, create_user
+
+
+@skipUnless(connection.vendor in QueryPlanInspector.SEQ_SCAN_PATTERNS, 'EXPLAIN 검사는 SQLite / PostgreSQL 만 지원')
+@override_settings(ACCOUNT_SIGN_IN_CACHE_ENABLED=False, ACCOUNT_EMAIL_BLOOM_ENABLED=False,
+                   ACCOUNT_LOGIN_STAT_BUFFER_ENABLED=False, ACCOUNT_DB_REPLICAS={})
+class UserQueryPlanTest(TestCase):
+    """ UserDatabaseQuery 메소드가 실제로 실행한 쿼리에 users full scan 이 없는지 확인 """
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        cls.user = create_user('plan-check@class101.net')
+        for i in range(20):
+            create_user(f'plan-check-{i}@class101.net')
+    
+    def test_no_sequential_scan(self):
+        inspector = QueryPlanInspector()
+        
+        for name, call in user_query_calls(self.user).items():
+            with self.subTest(name):
+                with inspector.capture() as queries:
+                    call()
+                
+                self.assertTrue(queries, f'{name} ran no users query')
+                self.assertEqual(inspector.seq_scans(queries), [])
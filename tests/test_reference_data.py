@@ -0,0 +1,106 @@
+import copy
+
+from unittest                             import mock
+
+from django.db                            import connection
+from django.db.backends.signals           import connection_created
+from django.test                          import TestCase
+
+from account.enums                        import AccountTypeEnum, SocialSignUpTypeEnum
+from account.query_orm.user_query         import UserDatabaseQuery
+from account.reference_data               import ReferenceDataRegistry, reference_data
+from account.serializers.projections      import UserInfoProjection
+from account.serializers.user_serializers import UserCreateSerializer
+from account.tests.utils                  import create_reference_rows
+
+
+class ReferenceDataTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+    
+    def setUp(self):
+        reference_data.reload()
+    
+    def test_lookups_without_queries(self):
+        with self.assertNumQueries(0):
+            account_type = reference_data.get_account_type(AccountTypeEnum.CONSUMER.value)
+            signup_type  = reference_data.get_social_signup_type(SocialSignUpTypeEnum.KAKAO.value)
+            
+            self.assertEqual(account_type.pk, AccountTypeEnum.CONSUMER.value)
+            self.assertEqual(signup_type.pk, SocialSignUpTypeEnum.KAKAO.value)
+            self.assertEqual(reference_data.get_account_type_name(AccountTypeEnum.CONSUMER.value), AccountTypeEnum.CONSUMER.name)
+            self.assertIsNone(reference_data.get_account_type(99))
+    
+    def test_build_user_and_projection_without_queries(self):
+        projection = {
+            'id'                   : 1,
+            'email'                : 'reference@class101.net',
+            'password'             : None,
+            'login_count'          : 0,
+            'last_login_date'      : None,
+            'is_deleted'           : False,
+            'account_type_id'      : AccountTypeEnum.CONSUMER.value,
+            'social_signup_type_id': SocialSignUpTypeEnum.NAVER.value,
+        }
+        
+        with self.assertNumQueries(0):
+            user = UserDatabaseQuery().build_user(projection)
+            data = UserInfoProjection.from_instance(user)
+            
+            self.assertEqual(user.account_type.pk, AccountTypeEnum.CONSUMER.value)
+            self.assertEqual(user.social_signup_type.pk, SocialSignUpTypeEnum.NAVER.value)
+            self.assertEqual(data['social_signup_type_name'], SocialSignUpTypeEnum.NAVER.name)
+    
+    def test_serializer_fk_validation_without_queries(self):
+        serializer = UserCreateSerializer(data={
+            'email'             : 'reference@class101.net',
+            'password'          : 'encoded',
+            'account_type'      : AccountTypeEnum.CONSUMER.value,
+            'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value,
+        })
+        
+        with self.assertNumQueries(0):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        
+        self.assertEqual(serializer.validated_data['account_type'].pk, AccountTypeEnum.CONSUMER.value)
+    
+    def test_unknown_fk_is_invalid(self):
+        serializer = UserCreateSerializer(data={'email': 'reference@class101.net', 'account_type': 99})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('account_type', serializer.errors)
+    
+    def test_lookups_never_query(self):
+        # 로드 전에는 UserConst 기준 인스턴스로 응답 (async 뷰에서 sync ORM 을 호출하지 않음)
+        registry = ReferenceDataRegistry()
+        
+        with self.assertNumQueries(0):
+            self.assertFalse(registry.loaded)
+            self.assertEqual(registry.get_account_type(AccountTypeEnum.CONSUMER.value).pk, AccountTypeEnum.CONSUMER.value)
+            self.assertEqual(registry.get_social_signup_type(SocialSignUpTypeEnum.KAKAO.value).name,
+                             SocialSignUpTypeEnum.KAKAO.name)
+    
+    def test_load_on_connection(self):
+        registry = ReferenceDataRegistry()
+        
+        with self.assertNumQueries(2):
+            registry.load_on_connection(connection)
+        self.assertTrue(registry.loaded)
+        
+        with self.assertNumQueries(0):
+            registry.load_on_connection(connection)
+    
+    def test_connection_created_loads(self):
+        with mock.patch.object(reference_data, '_loaded', False), \
+             mock.patch.object(reference_data, 'load') as load:
+            connection_created.send(sender=connection.__class__, connection=connection)
+        
+        load.assert_called_once_with(using=connection.alias)
+    
+    def test_serializer_is_copyable(self):
+        # DRF 는 serializer 의 fields 를 만들 때마다 선언 필드를 deepcopy
+        field = UserCreateSerializer._declared_fields['account_type']
+        
+        self.assertEqual(copy.deepcopy(field).reference_type, 'account_type')
+        self.assertIn('account_type', UserCreateSerializer().fields)
@@ -0,0 +1,91 @@
+import io
+import json
+import logging
+
+from django.test         import SimpleTestCase, override_settings
+
+from account.const       import RequestLogConst
+from account.request_log import RequestLogger, StructuredFormatter
+
+
+@override_settings(ACCOUNT_REQUEST_LOG_ENABLED=True, ACCOUNT_REQUEST_LOG_ASYNC=False)
+class RequestLoggerTest(SimpleTestCase):
+    """ 'account.request' logger 상태를 테스트마다 비우고 복원 """
+    
+    def setUp(self):
+        self.logger = logging.getLogger(RequestLogConst.LOGGER_NAME)
+        self.saved  = (list(self.logger.handlers), self.logger.level, self.logger.propagate)
+        for handler in self.saved[0]:
+            self.logger.removeHandler(handler)
+        self.logger.setLevel(logging.NOTSET)
+        self.logger.propagate = True
+    
+    def tearDown(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        for handler in self.saved[0]:
+            self.logger.addHandler(handler)
+        self.logger.setLevel(self.saved[1])
+        self.logger.propagate = self.saved[2]
+    
+    def make_logger(self, stream: io.StringIO) -> RequestLogger:
+        """ 기본 (stderr) 핸들러 대신 stream 에 기록하는 RequestLogger """
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(StructuredFormatter())
+        
+        request_logger = RequestLogger()
+        request_logger._default_handler = lambda: handler
+        return request_logger
+    
+    def test_logs_with_default_logging_config(self):
+        """ settings.LOGGING 미설정 (root WARNING) 이어도 기본 핸들러로 기록 """
+        stream         = io.StringIO()
+        request_logger = self.make_logger(stream)
+        
+        request_logger.print_log(app_name='account', method_name='test',
+                                 request_data={'email': 'log@class101.net', 'password': 'secret'})
+        
+        self.assertEqual(request_logger.emitted, 1)
+        record = json.loads(stream.getvalue())
+        self.assertEqual(record['data']['email'], 'log@class101.net')
+        self.assertEqual(record['data']['password'], RequestLogConst.REDACTED)
+    
+    def test_respects_configured_level(self):
+        """ settings.LOGGING 으로 핸들러 / 레벨을 설정했으면 그 레벨을 따름 """
+        stream = io.StringIO()
+        self.logger.addHandler(logging.StreamHandler(stream))
+        self.logger.setLevel(logging.WARNING)
+        request_logger = self.make_logger(io.StringIO())
+        
+        request_logger.print_log(app_name='account', method_name='test', request_data={})
+        
+        self.assertEqual(request_logger.emitted, 0)
+        self.assertEqual(stream.getvalue(), '')
+    
+    @override_settings(ACCOUNT_REQUEST_LOG_ASYNC=True)
+    def test_respects_configured_level_async(self):
+        """ 비동기 모드에서 설정된 핸들러를 writer 로 옮긴 뒤에도 설정된 레벨을 따름 """
+        stream = io.StringIO()
+        self.logger.addHandler(logging.StreamHandler(stream))
+        self.logger.setLevel(logging.WARNING)
+        request_logger = self.make_logger(io.StringIO())
+        self.addCleanup(request_logger.stop)
+        
+        request_logger.print_log(app_name='account', method_name='test', request_data={})
+        request_logger.stop()
+        
+        self.assertEqual(self.logger.level, logging.WARNING)
+        self.assertEqual(request_logger.emitted, 0)
+        self.assertEqual(stream.getvalue(), '')
+    
+    @override_settings(ACCOUNT_REQUEST_LOG_ASYNC=True)
+    def test_logs_with_default_logging_config_async(self):
+        stream         = io.StringIO()
+        request_logger = self.make_logger(stream)
+        self.addCleanup(request_logger.stop)
+        
+        request_logger.print_log(app_name='account', method_name='test', request_data={'email': 'log@class101.net'})
+        request_logger.stop()
+        
+        self.assertEqual(request_logger.emitted, 1)
+        self.assertEqual(json.loads(stream.getvalue())['data']['email'], 'log@class101.net')
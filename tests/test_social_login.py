@@ -0,0 +1,50 @@
+from asgiref.sync              import async_to_sync
+
+from django.test               import TestCase, override_settings
+
+from account.exceptions        import SocialTokenInvalidException
+from account.models            import User
+from account.social.fake_kakao import fake_kakao
+from account.social.registry   import provider_registry
+from account.tests.utils       import VIEW_TEST_SETTINGS, create_reference_rows
+
+
+@override_settings(**VIEW_TEST_SETTINGS, ACCOUNT_SOCIAL_PROFILE_CACHE_TIMEOUT=0)
+class SocialTokenAppCheckTest(TestCase):
+    """ 다른 앱이 발급받은 provider 토큰으로는 로그인 / 프로필 조회 불가 (fake 카카오: bench- 토큰만 우리 앱) """
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+    
+    def setUp(self):
+        fake = fake_kakao()
+        fake.__enter__()
+        self.addCleanup(fake.__exit__, None, None, None)
+    
+    def login(self, access_token: str):
+        return self.client.post('/social/kakao/login/', {'access_token': access_token}, content_type='application/json')
+    
+    def test_token_issued_to_our_app(self):
+        response = self.login('bench-1')
+        
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(User.objects.filter(email='k-1@bench.local').exists())
+    
+    def test_token_issued_to_other_app(self):
+        response = self.login('other-app-1')
+        
+        self.assertEqual(response.status_code, 401)
+        self.assertNotIn('access_token', response.content.decode())
+        self.assertFalse(User.all_objects.filter(email__startswith='k-').exists())
+    
+    def test_profile_rejects_other_app_token(self):
+        response = self.client.post('/social/kakao/profile/', {'access_token': 'other-app-1'}, content_type='application/json')
+        self.assertEqual(response.status_code, 401)
+    
+    def test_async_get_email(self):
+        provider = provider_registry.get('kakao')
+        
+        self.assertEqual(async_to_sync(provider.aget_email)('bench-2'), 'k-2@bench.local')
+        with self.assertRaises(SocialTokenInvalidException):
+            async_to_sync(provider.aget_email)('other-app-2')
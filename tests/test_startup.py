@@ -0,0 +1,22 @@
+import io
+
+from django.core.management import call_command
+from django.db              import connection
+from django.test            import TransactionTestCase
+
+from account.const          import StartupConst
+
+
+class StartupBudgetTest(TransactionTestCase):
+    """ check_startup_time 을 테스트 DB 로 실행 (새 프로세스에서 콜드 스타트 후 첫 sign-in 이 FIRST_SIGN_IN_BUDGET 이내) """
+    
+    def setUp(self):
+        # 자식 프로세스는 별도 커넥션을 쓰므로 프로세스 메모리 DB 는 공유할 수 없음
+        if connection.vendor == 'sqlite' and connection.is_in_memory_db():
+            self.skipTest('in-memory test database is not visible to the startup child process')
+    
+    def test_first_sign_in_within_budget(self):
+        stdout = io.StringIO()
+        call_command('check_startup_time', runs=1, database_name=connection.settings_dict['NAME'], stdout=stdout)
+        
+        self.assertIn(f'within budget {StartupConst.FIRST_SIGN_IN_BUDGET * 1000:.0f}ms', stdout.getvalue())
@@ -0,0 +1,25 @@
+from django.test        import RequestFactory, SimpleTestCase, override_settings
+
+from account.throttling import get_client_ip
+
+
+class GetClientIpTest(SimpleTestCase):
+    
+    def request(self, forwarded_for: str=None):
+        headers = {'HTTP_X_FORWARDED_FOR': forwarded_for} if forwarded_for else {}
+        return RequestFactory().get('/', REMOTE_ADDR='10.0.0.1', **headers)
+    
+    def test_ignores_header_by_default(self):
+        self.assertEqual(get_client_ip(self.request('1.1.1.1')), '10.0.0.1')
+    
+    @override_settings(ACCOUNT_RATE_LIMIT_TRUST_X_FORWARDED_FOR=True)
+    def test_uses_entry_added_by_proxy(self):
+        # 클라이언트가 보낸 앞쪽 값을 바꿔도 같은 IP
+        self.assertEqual(get_client_ip(self.request('1.1.1.1, 203.0.113.7')), '203.0.113.7')
+        self.assertEqual(get_client_ip(self.request('2.2.2.2, 203.0.113.7')), '203.0.113.7')
+        self.assertEqual(get_client_ip(self.request('203.0.113.7')), '203.0.113.7')
+    
+    @override_settings(ACCOUNT_RATE_LIMIT_TRUST_X_FORWARDED_FOR=True, ACCOUNT_RATE_LIMIT_TRUSTED_PROXY_COUNT=2)
+    def test_trusted_proxy_count(self):
+        self.assertEqual(get_client_ip(self.request('1.1.1.1, 203.0.113.7, 10.0.0.2')), '203.0.113.7')
+        self.assertEqual(get_client_ip(self.request('203.0.113.7')), '10.0.0.1')
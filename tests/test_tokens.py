@@ -0,0 +1,50 @@
+import io
+
+from datetime               import timedelta
+from unittest               import mock
+
+from django.core.management import call_command
+from django.db              import DatabaseError
+from django.test            import TestCase, override_settings
+from django.utils           import timezone
+
+from account.models         import RevokedToken
+from account.tokens         import RevocationList, TokenManager
+
+
+@override_settings(ACCOUNT_JWT_REVOCATION_SYNC_INTERVAL=0)
+class RevokedTokenPruneTest(TestCase):
+    
+    def create_revoked(self, jti: str, expires_in: timedelta) -> RevokedToken:
+        now = timezone.now()
+        return RevokedToken.objects.create(jti=jti, user_id=1, revoked_at=now, expires_at=now + expires_in)
+    
+    def test_prune_deletes_expired_rows_only(self):
+        for i in range(3):
+            self.create_revoked(f'expired-{i}', timedelta(seconds=-1))
+        live = self.create_revoked('live', timedelta(hours=1))
+        
+        self.assertEqual(TokenManager().prune_revoked(batch_size=2), 3)
+        self.assertEqual(list(RevokedToken.objects.values_list('id', flat=True)), [live.id])
+    
+    def test_command(self):
+        self.create_revoked('expired', timedelta(seconds=-1))
+        stdout = io.StringIO()
+        
+        call_command('prune_revoked_tokens', stdout=stdout)
+        
+        self.assertIn('deleted: 1', stdout.getvalue())
+        self.assertFalse(RevokedToken.objects.exists())
+    
+    def test_sync_evicts_expired_entries_even_if_query_fails(self):
+        now         = timezone.now()
+        revocations = RevocationList()
+        revocations.add(jti='expired', user_id=None, revoked_at=now, expires_at=now - timedelta(seconds=1))
+        revocations.add(jti=None, user_id=1, revoked_at=now, expires_at=now - timedelta(seconds=1))
+        revocations.add(jti='live', user_id=None, revoked_at=now, expires_at=now + timedelta(hours=1))
+        
+        with mock.patch.object(RevokedToken.objects, 'filter', side_effect=DatabaseError):
+            revocations.sync()
+        
+        self.assertEqual(list(revocations._jtis), ['live'])
+        self.assertEqual(revocations._users, {})
@@ -0,0 +1,81 @@
+from django.test          import TestCase, override_settings
+from django.utils         import timezone
+from rest_framework.test  import APIClient
+
+from account.enums        import SocialSignUpTypeEnum
+from account.tests.utils  import VIEW_TEST_SETTINGS, TEST_PASSWORD, create_reference_rows, create_user
+
+
+@override_settings(**VIEW_TEST_SETTINGS)
+class SignInTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        cls.user        = create_user('sign-in@class101.net')
+        cls.social_user = create_user('social@class101.net', password=None, social_signup_type=SocialSignUpTypeEnum.KAKAO)
+        cls.deleted     = create_user('deleted@class101.net', is_deleted=True, deleted_at=timezone.now())
+    
+    def setUp(self):
+        self.client = APIClient()
+    
+    def sign_in(self, **data):
+        return self.client.post('/sign-in/', data, format='json')
+    
+    def test_sign_in_issues_tokens(self):
+        response = self.sign_in(email='Sign-In@class101.net', password=TEST_PASSWORD,
+                                social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access_token', response.content.decode())
+    
+    def test_social_user_without_password_gets_no_token(self):
+        response = self.sign_in(email=self.social_user.email, social_signup_type=SocialSignUpTypeEnum.KAKAO.value)
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn('access_token', response.content.decode())
+    
+    def test_social_user_with_any_password_gets_no_token(self):
+        response = self.sign_in(email=self.social_user.email, password='guess',
+                                social_signup_type=SocialSignUpTypeEnum.KAKAO.value)
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn('access_token', response.content.decode())
+    
+    def test_failures_are_indistinguishable(self):
+        responses = [
+            self.sign_in(email='nobody@class101.net', password=TEST_PASSWORD, social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value),
+            self.sign_in(email=self.deleted.email, password=TEST_PASSWORD, social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value),
+            self.sign_in(email=self.user.email, password='wrong', social_signup_type=SocialSignUpTypeEnum.NO_SOCIAL.value),
+        ]
+        
+        self.assertEqual({response.status_code for response in responses}, {400})
+        self.assertEqual(len({response.content for response in responses}), 1)
+
+
+@override_settings(**VIEW_TEST_SETTINGS)
+class SignUpTest(TestCase):
+    
+    @classmethod
+    def setUpTestData(cls):
+        create_reference_rows()
+        create_user('exists@class101.net')
+        create_user('deleted@class101.net', is_deleted=True, deleted_at=timezone.now())
+    
+    def setUp(self):
+        self.client = APIClient()
+    
+    def sign_up(self, email: str):
+        return self.client.post('/', {'email': email, 'password': TEST_PASSWORD,
+                                      'social_signup_type': SocialSignUpTypeEnum.NO_SOCIAL.value}, format='json')
+    
+    def test_sign_up(self):
+        self.assertEqual(self.sign_up('new@class101.net').status_code, 201)
+    
+    def test_existing_and_deleted_emails_are_indistinguishable(self):
+        existing = self.sign_up('Exists@class101.net')
+        deleted  = self.sign_up('deleted@class101.net')
+        
+        self.assertEqual(existing.status_code, 400)
+        self.assertEqual(deleted.status_code, 400)
+        self.assertEqual(existing.content, deleted.content)
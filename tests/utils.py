@@ -0,0 +1,36 @@
+from account.const     import UserConst
+from account.enums     import AccountTypeEnum, SocialSignUpTypeEnum
+from account.models    import User, AccountTypes, SocialSignUpType
+from account.passwords import password_manager
+
+TEST_PASSWORD = 'test-password'
+
+
+def create_reference_rows() -> None:
+    """ 참조 테이블 row (마이그레이션에 데이터가 없어 테스트 DB 에 직접 생성) """
+    AccountTypes.objects.bulk_create([AccountTypes(id=pk, name=name) for pk, name in UserConst.ACCOUNT_TYPE],
+                                     ignore_conflicts=True)
+    SocialSignUpType.objects.bulk_create([SocialSignUpType(id=pk, name=name) for pk, name in UserConst.SOCIAL_SIGNUP_TYPE],
+                                         ignore_conflicts=True)
+
+
+def create_user(email: str, password: str=TEST_PASSWORD, account_type: AccountTypeEnum=AccountTypeEnum.CONSUMER,
+                social_signup_type: SocialSignUpTypeEnum=SocialSignUpTypeEnum.NO_SOCIAL, **kwargs) -> User:
+    return User.objects.create(
+        email                 = email,
+        password              = password_manager.hash(password) if password else None,
+        account_type_id       = account_type.value,
+        social_signup_type_id = social_signup_type.value,
+        **kwargs
+    )
+
+
+# 뷰 테스트 공통 설정 (프로세스 메모리 상태가 테스트 사이에 남지 않도록 제한 / 버퍼 / 로그 비활성)
+VIEW_TEST_SETTINGS = {
+    'ROOT_URLCONF'                     : 'account.urls',
+    'ACCOUNT_RATE_LIMIT_ENABLED'       : False,
+    'ACCOUNT_LOGIN_STAT_BUFFER_ENABLED': False,
+    'ACCOUNT_SIGN_IN_CACHE_ENABLED'    : False,
+    'ACCOUNT_REQUEST_LOG_ENABLED'      : False,
+    'ACCOUNT_ASYNC_VIEWS'              : False,
+}
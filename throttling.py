@@ -0,0 +1,253 @@
+import hashlib
+import math
+import threading
+import time
+
+from typing             import Optional
+
+from django.conf        import settings
+from django.core.cache  import caches
+
+from account.const      import RateLimitConst
+from account.exceptions import RateLimitExceededException
+
+
+class LocalMemoryBackend:
+    """ 프로세스 내 카운터 (개발 / 단일 프로세스용) """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = dict()  # key -> (value, expires_at)
+    
+    def get(self, key: str) -> int:
+        item = self._data.get(key)
+        if item is None or item[1] <= time.monotonic():
+            return 0
+        return item[0]
+    
+    def incr(self, key: str, ttl: int) -> int:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[1] <= now:
+                item = (0, now + ttl)
+            value = item[0] + 1
+            self._data[key] = (value, item[1])
+            
+            # 만료 키 정리 (단순 상한)
+            if len(self._data) > 100000:
+                self._data = {k: v for k, v in self._data.items() if v[1] > now}
+        return value
+    
+    def set(self, key: str, value: int, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+    
+    # async 뷰용. 메모리 연산이라 그대로 호출
+    async def aget(self, key: str) -> int:
+        return self.get(key)
+    
+    async def aincr(self, key: str, ttl: int) -> int:
+        return self.incr(key, ttl)
+    
+    async def aset(self, key: str, value: int, ttl: int) -> None:
+        self.set(key, value, ttl)
+    
+    async def adelete(self, key: str) -> None:
+        self.delete(key)
+
+
+class CacheBackend:
+    """ Django 캐시 (Redis / Memcached) 공유 카운터 (운영용) """
+    
+    def __init__(self, alias: str='default'):
+        self.alias = alias
+    
+    @property
+    def cache(self):
+        return caches[self.alias]
+    
+    def get(self, key: str) -> int:
+        return self.cache.get(key) or 0
+    
+    def incr(self, key: str, ttl: int) -> int:
+        # add 는 키가 없을 때만 성공하므로 윈도우 시작 시 TTL 이 한 번만 설정됨
+        if self.cache.add(key, 1, timeout=ttl):
+            return 1
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # add 와 incr 사이에 만료된 경우
+            self.cache.set(key, 1, timeout=ttl)
+            return 1
+    
+    def set(self, key: str, value: int, ttl: int) -> None:
+        self.cache.set(key, value, timeout=ttl)
+    
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+    
+    # async 뷰용. 캐시 I/O 가 이벤트 루프를 막지 않도록 Django 캐시 async API 사용
+    async def aget(self, key: str) -> int:
+        return await self.cache.aget(key) or 0
+    
+    async def aincr(self, key: str, ttl: int) -> int:
+        if await self.cache.aadd(key, 1, timeout=ttl):
+            return 1
+        try:
+            return await self.cache.aincr(key)
+        except ValueError:
+            await self.cache.aset(key, 1, timeout=ttl)
+            return 1
+    
+    async def aset(self, key: str, value: int, ttl: int) -> None:
+        await self.cache.aset(key, value, timeout=ttl)
+    
+    async def adelete(self, key: str) -> None:
+        await self.cache.adelete(key)
+
+
+class RateLimiter:
+    """ sliding window counter 방식 요청 제한 + 로그인 실패 누적 잠금
+        - 이전 윈도우 카운트를 경과 비율만큼 반영하여 윈도우 경계 burst 를 막음 (키당 카운터 2개)
+        - 백엔드: settings.ACCOUNT_RATE_LIMIT_BACKEND = 'local' (기본) | 'cache'
+                  settings.ACCOUNT_RATE_LIMIT_CACHE_ALIAS (cache 백엔드 alias)
+        - 제한 값: settings.ACCOUNT_RATE_LIMITS = {'sign_in_ip': (30, 60), ...}
+        - 뷰에서 DB 조회 전에 호출하여 초과 시 RateLimitExceededException
+    """
+    
+    def __init__(self):
+        self._backend = None
+    
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'ACCOUNT_RATE_LIMIT_ENABLED', True)
+    
+    @property
+    def backend(self):
+        if self._backend is None:
+            if getattr(settings, 'ACCOUNT_RATE_LIMIT_BACKEND', RateLimitConst.BACKEND_LOCAL) == RateLimitConst.BACKEND_CACHE:
+                self._backend = CacheBackend(getattr(settings, 'ACCOUNT_RATE_LIMIT_CACHE_ALIAS', 'default'))
+            else:
+                self._backend = LocalMemoryBackend()
+        return self._backend
+    
+    def get_rate(self, scope: str) -> tuple:
+        return getattr(settings, 'ACCOUNT_RATE_LIMITS', {}).get(scope, RateLimitConst.RATES[scope])
+    
+    def make_key(self, *parts) -> str:
+        # 이메일 / IP 원문을 캐시 키로 쓰지 않도록 해시
+        digest = hashlib.blake2b(':'.join(str(part) for part in parts).encode('utf-8'), digest_size=12).hexdigest()
+        return RateLimitConst.KEY_PREFIX + digest
+    
+    def window_keys(self, scope: str, identity: str) -> tuple:
+        """ (limit, window, 경과 비율, 현재 윈도우 키, 이전 윈도우 키) """
+        limit, window = self.get_rate(scope)
+        now           = time.time()
+        window_index  = int(now // window)
+        elapsed_ratio = (now % window) / window
+        
+        return (limit, window, elapsed_ratio,
+                self.make_key(scope, identity, window_index), self.make_key(scope, identity, window_index - 1))
+    
+    def check_window(self, limit: int, window: int, elapsed_ratio: float, current: int, previous: int) -> None:
+        if previous * (1 - elapsed_ratio) + current > limit:
+            raise RateLimitExceededException(retry_after=math.ceil(window * (1 - elapsed_ratio)))
+    
+    def check_locked_until(self, locked_until: int) -> None:
+        if locked_until and locked_until > time.time():
+            raise RateLimitExceededException(retry_after=math.ceil(locked_until - time.time()))
+    
+    def lockout_seconds(self, failures: int) -> Optional[int]:
+        """ 누적 실패 횟수 -> 잠금 시간 (초). FAILURE_THRESHOLD 미만이면 None """
+        if failures < RateLimitConst.FAILURE_THRESHOLD:
+            return None
+        return min(RateLimitConst.LOCKOUT_BASE * 2 ** (failures - RateLimitConst.FAILURE_THRESHOLD),
+                   RateLimitConst.LOCKOUT_MAX)
+    
+    def hit(self, scope: str, identity: str) -> None:
+        """ 요청 1회 기록. 제한 초과 시 RateLimitExceededException """
+        if not self.enabled or not identity:
+            return
+        
+        limit, window, elapsed_ratio, current_key, previous_key = self.window_keys(scope, identity)
+        
+        current  = self.backend.incr(current_key, ttl=window * 2)
+        previous = self.backend.get(previous_key)
+        self.check_window(limit, window, elapsed_ratio, current, previous)
+    
+    def check_lockout(self, identity: str) -> None:
+        """ 로그인 실패 누적으로 잠긴 계정이면 RateLimitExceededException """
+        if not self.enabled or not identity:
+            return
+        
+        self.check_locked_until(self.backend.get(self.make_key('lockout', identity)))
+    
+    def record_failure(self, identity: str) -> None:
+        """ 로그인 실패 기록. FAILURE_THRESHOLD 이후 실패마다 잠금 시간 2배 """
+        if not self.enabled or not identity:
+            return
+        
+        failures = self.backend.incr(self.make_key('failure', identity), ttl=RateLimitConst.FAILURE_TTL)
+        lockout  = self.lockout_seconds(failures)
+        if lockout is not None:
+            self.backend.set(self.make_key('lockout', identity), int(time.time() + lockout), ttl=lockout)
+    
+    def reset_failures(self, identity: str) -> None:
+        if not self.enabled or not identity:
+            return
+        self.backend.delete(self.make_key('failure', identity))
+    
+    # async 뷰용 (cache 백엔드의 캐시 I/O 를 이벤트 루프에서 블로킹 호출하지 않음)
+    async def ahit(self, scope: str, identity: str) -> None:
+        if not self.enabled or not identity:
+            return
+        
+        limit, window, elapsed_ratio, current_key, previous_key = self.window_keys(scope, identity)
+        
+        current  = await self.backend.aincr(current_key, ttl=window * 2)
+        previous = await self.backend.aget(previous_key)
+        self.check_window(limit, window, elapsed_ratio, current, previous)
+    
+    async def acheck_lockout(self, identity: str) -> None:
+        if not self.enabled or not identity:
+            return
+        
+        self.check_locked_until(await self.backend.aget(self.make_key('lockout', identity)))
+    
+    async def arecord_failure(self, identity: str) -> None:
+        if not self.enabled or not identity:
+            return
+        
+        failures = await self.backend.aincr(self.make_key('failure', identity), ttl=RateLimitConst.FAILURE_TTL)
+        lockout  = self.lockout_seconds(failures)
+        if lockout is not None:
+            await self.backend.aset(self.make_key('lockout', identity), int(time.time() + lockout), ttl=lockout)
+    
+    async def areset_failures(self, identity: str) -> None:
+        if not self.enabled or not identity:
+            return
+        await self.backend.adelete(self.make_key('failure', identity))
+
+
+def get_client_ip(request) -> Optional[str]:
+    """ settings.ACCOUNT_RATE_LIMIT_TRUST_X_FORWARDED_FOR 가 True 면 (프록시 뒤) X-Forwarded-For 에서 클라이언트 IP 사용
+        - 앞쪽 값은 클라이언트가 임의로 보낼 수 있으므로 신뢰 프록시가 추가한 오른쪽부터
+          ACCOUNT_RATE_LIMIT_TRUSTED_PROXY_COUNT 번째 값 사용 (프록시 1개면 마지막 값)
+        - 값 개수가 프록시 수보다 적으면 REMOTE_ADDR
+    """
+    if getattr(settings, 'ACCOUNT_RATE_LIMIT_TRUST_X_FORWARDED_FOR', False):
+        forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+        proxy_count   = getattr(settings, 'ACCOUNT_RATE_LIMIT_TRUSTED_PROXY_COUNT', RateLimitConst.TRUSTED_PROXY_COUNT)
+        if forwarded_for and proxy_count > 0:
+            addresses = [address.strip() for address in forwarded_for.split(',')]
+            if len(addresses) >= proxy_count and addresses[-proxy_count]:
+                return addresses[-proxy_count]
+    return request.META.get('REMOTE_ADDR')
+
+
+rate_limiter = RateLimiter()
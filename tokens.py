@@ -0,0 +1,247 @@
+import threading
+import time
+import uuid
+
+from datetime               import datetime, timedelta, timezone as dt_timezone
+from typing                 import Dict, Optional
+
+import jwt
+
+from jwt.algorithms         import get_default_algorithms
+
+from django.conf            import settings
+from django.db              import DatabaseError
+from django.utils           import timezone
+
+from account.const          import JWTConst
+from account.exceptions     import TokenInvalidException
+from account.models         import RevokedToken
+
+
+class SigningKeyRing:
+    """ JWT 서명 키 모음 (키 로테이션)
+        - settings.ACCOUNT_JWT_KEYS = {kid: {'private': ..., 'public': ...}} (HS* 는 'secret' 하나)
+        - settings.ACCOUNT_JWT_ACTIVE_KID : 발급에 쓰는 kid. 나머지 kid 는 검증에만 사용 (로테이션 기간)
+        - 미설정 시 SECRET_KEY 로 HS256
+        - PEM 파싱 결과는 프로세스에 캐시하여 요청마다 파싱하지 않음
+    """
+    
+    def __init__(self):
+        self._lock        = threading.Lock()
+        self._loaded      = False
+        self.algorithm    = None
+        self.active_kid   = None
+        self._signing_key = None
+        self._verify_keys = dict()  # kid -> 파싱된 key
+    
+    def load(self) -> None:
+        algorithm  = getattr(settings, 'ACCOUNT_JWT_ALGORITHM', JWTConst.ALGORITHM)
+        keys       = getattr(settings, 'ACCOUNT_JWT_KEYS', None) or {'default': {'secret': settings.SECRET_KEY}}
+        active_kid = getattr(settings, 'ACCOUNT_JWT_ACTIVE_KID', None) or next(iter(keys))
+        
+        algorithm_obj = get_default_algorithms()[algorithm]
+        
+        verify_keys = dict()
+        for kid, key in keys.items():
+            verify_keys[kid] = algorithm_obj.prepare_key(key.get('public') or key.get('secret'))
+        
+        active_key  = keys[active_kid]
+        signing_key = algorithm_obj.prepare_key(active_key.get('private') or active_key.get('secret'))
+        
+        with self._lock:
+            self.algorithm    = algorithm
+            self.active_kid   = active_kid
+            self._signing_key = signing_key
+            self._verify_keys = verify_keys
+            self._loaded      = True
+    
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+    
+    @property
+    def signing_key(self):
+        self._ensure_loaded()
+        return self._signing_key
+    
+    def get_verify_key(self, kid: str):
+        self._ensure_loaded()
+        key = self._verify_keys.get(kid)
+        if key is None:
+            raise TokenInvalidException('unknown kid')
+        return key
+
+
+class RevocationList:
+    """ 폐기 토큰 목록 프로세스 캐시
+        - 검증 경로는 메모리 set / dict 만 조회 (DB 접근 없음)
+        - REVOCATION_SYNC_INTERVAL 마다 RevokedToken 테이블에서 id 증분으로 동기화 (프로세스당 주기별 쿼리 1회)
+        - 만료된 항목은 동기화 시 (DB 조회가 실패해도) 메모리에서 정리
+        - 만료된 RevokedToken row 는 prune_revoked_tokens 커맨드로 삭제
+    """
+    
+    def __init__(self):
+        self._lock      = threading.Lock()
+        self._last_id   = 0
+        self._last_sync = 0.0
+        self._jtis      = dict()  # jti -> expires_at(timestamp)
+        self._users     = dict()  # user_id -> (revoked_at, expires_at) (timestamp)
+    
+    @property
+    def sync_interval(self) -> float:
+        return getattr(settings, 'ACCOUNT_JWT_REVOCATION_SYNC_INTERVAL', JWTConst.REVOCATION_SYNC_INTERVAL)
+    
+    def is_revoked(self, jti: str, user_id: int, issued_at: float) -> bool:
+        if time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+        
+        if jti in self._jtis:
+            return True
+        
+        revoked = self._users.get(user_id)
+        return revoked is not None and issued_at <= revoked[0]
+    
+    def sync(self) -> None:
+        with self._lock:
+            if time.monotonic() - self._last_sync < self.sync_interval:
+                return
+            self._last_sync = time.monotonic()
+            
+            try:
+                rows = list(
+                    RevokedToken.objects.filter(id__gt=self._last_id)
+                                        .order_by('id')
+                                        .values_list('id', 'jti', 'user_id', 'revoked_at', 'expires_at')
+                )
+            except DatabaseError:
+                # 동기화 실패 시 기존 목록으로 계속 검증, 다음 주기에 재시도
+                rows = list()
+            
+            for row_id, jti, user_id, revoked_at, expires_at in rows:
+                self.add(jti=jti, user_id=user_id, revoked_at=revoked_at, expires_at=expires_at)
+                self._last_id = row_id
+            
+            self.evict_expired()
+    
+    def evict_expired(self) -> None:
+        now = time.time()
+        self._jtis  = {jti: expires_at for jti, expires_at in self._jtis.items() if expires_at > now}
+        self._users = {user_id: revoked for user_id, revoked in self._users.items() if revoked[1] > now}
+    
+    def add(self, jti: Optional[str], user_id: Optional[int], revoked_at: datetime, expires_at: datetime) -> None:
+        if jti:
+            self._jtis[jti] = expires_at.timestamp()
+        elif user_id is not None:
+            revoked = self._users.get(user_id, (0, 0))
+            self._users[user_id] = (max(revoked[0], revoked_at.timestamp()), max(revoked[1], expires_at.timestamp()))
+
+
+class TokenManager:
+    """ JWT 발급 / 검증
+        - access / refresh 토큰 (claim: sub, type, jti, iat, exp, iss)
+        - verify 는 서명/만료 검증 + 메모리 폐기 목록 조회만 수행 (DB 접근 없음)
+    """
+    
+    def __init__(self):
+        self.key_ring    = SigningKeyRing()
+        self.revocations = RevocationList()
+    
+    @property
+    def access_ttl(self) -> int:
+        return getattr(settings, 'ACCOUNT_JWT_ACCESS_TTL', JWTConst.ACCESS_TTL)
+    
+    @property
+    def refresh_ttl(self) -> int:
+        return getattr(settings, 'ACCOUNT_JWT_REFRESH_TTL', JWTConst.REFRESH_TTL)
+    
+    @property
+    def issuer(self) -> str:
+        return getattr(settings, 'ACCOUNT_JWT_ISSUER', JWTConst.ISSUER)
+    
+    def encode(self, user_id: int, token_type: str, ttl: int) -> str:
+        now = int(time.time())
+        payload = {
+            'sub' : str(user_id),
+            'type': token_type,
+            'jti' : uuid.uuid4().hex,
+            'iat' : now,
+            'exp' : now + ttl,
+            'iss' : self.issuer,
+        }
+        return jwt.encode(payload, self.key_ring.signing_key, algorithm=self.key_ring.algorithm,
+                          headers={'kid': self.key_ring.active_kid})
+    
+    def issue(self, user_id: int) -> dict:
+        """ 로그인 성공 시 access / refresh 토큰 발급 """
+        return {
+            'access_token' : self.encode(user_id, JWTConst.TOKEN_TYPE_ACCESS, self.access_ttl),
+            'refresh_token': self.encode(user_id, JWTConst.TOKEN_TYPE_REFRESH, self.refresh_ttl),
+            'expires_in'   : self.access_ttl,
+        }
+    
+    def verify(self, token: str, token_type: str=JWTConst.TOKEN_TYPE_ACCESS) -> Dict:
+        """ 토큰 검증 후 claim 리턴. 실패 시 TokenInvalidException """
+        try:
+            header = jwt.get_unverified_header(token)
+            claims = jwt.decode(
+                token,
+                self.key_ring.get_verify_key(header.get('kid')),
+                algorithms = [self.key_ring.algorithm],
+                issuer     = self.issuer,
+                options    = {'require': ['sub', 'type', 'jti', 'iat', 'exp']},
+            )
+        except jwt.ExpiredSignatureError:
+            raise TokenInvalidException('expired')
+        except jwt.PyJWTError:
+            raise TokenInvalidException('invalid')
+        
+        if claims['type'] != token_type:
+            raise TokenInvalidException('wrong token type')
+        
+        if self.revocations.is_revoked(claims['jti'], int(claims['sub']), claims['iat']):
+            raise TokenInvalidException('revoked')
+        
+        return claims
+    
+    def refresh(self, refresh_token: str) -> dict:
+        """ refresh 토큰으로 새 토큰 발급. 사용한 refresh 토큰은 폐기 (rotation) """
+        claims = self.verify(refresh_token, token_type=JWTConst.TOKEN_TYPE_REFRESH)
+        self.revoke(claims)
+        return self.issue(int(claims['sub']))
+    
+    def revoke(self, claims: dict) -> None:
+        """ 토큰 1개 폐기 (로그아웃) """
+        now        = timezone.now()
+        expires_at = datetime.fromtimestamp(claims['exp'], tz=dt_timezone.utc)
+        
+        RevokedToken.objects.create(jti=claims['jti'], user_id=int(claims['sub']), revoked_at=now, expires_at=expires_at)
+        self.revocations.add(jti=claims['jti'], user_id=None, revoked_at=now, expires_at=expires_at)
+    
+    def revoke_user(self, user_id: int) -> None:
+        """ 유저의 기존 발급 토큰 전체 폐기 (탈퇴 / 전체 로그아웃) """
+        now        = timezone.now()
+        expires_at = now + timedelta(seconds=self.refresh_ttl)
+        
+        RevokedToken.objects.create(jti=None, user_id=user_id, revoked_at=now, expires_at=expires_at)
+        self.revocations.add(jti=None, user_id=user_id, revoked_at=now, expires_at=expires_at)
+    
+    def prune_revoked(self, batch_size: int=None) -> int:
+        """ 만료된 폐기 토큰 row 삭제 (만료된 토큰은 서명 검증에서 거절되므로 목록에 둘 필요 없음)
+            - id 기준 batch_size 단위로 DELETE 하여 긴 잠금을 피함
+            return
+            - 삭제한 row 수
+        """
+        batch_size = batch_size or JWTConst.REVOCATION_PRUNE_BATCH_SIZE
+        now        = timezone.now()
+        deleted    = 0
+        
+        while True:
+            ids = list(RevokedToken.objects.filter(expires_at__lte=now).order_by('id').values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            deleted += RevokedToken.objects.filter(id__in=ids).delete()[0]
+        
+        return deleted
+
+
+token_manager = TokenManager()
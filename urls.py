@@ -1,8 +1,9 @@
+from django.conf               import settings
 from django.urls               import path, include
 from rest_framework            import routers
 
 from account.views.user_views  import UserViewSet
-from account.views             import social_login_view
+from account.views             import social_login_view, metrics_view
 
 router = routers.SimpleRouter(trailing_slash=True)
 router.register('', UserViewSet, basename='user-viewset')
@@ -10,9 +11,32 @@ router.register('', UserViewSet, basename='user-viewset')
 
 urlpatterns = [
     path('', include(router.urls)),
-    path('kakao/auth/', social_login_view.kakao_authorization_code, name='kakao_auth_code'),
-    path('kakao/auth-callback/', social_login_view.kakao_authorization_code_callback, name='kakao_auth_code_callback'),
-    path('kakao/profile/', social_login_view.kakao_profile, name='kakao_profile'),
+    path('social/<str:provider>/auth/', social_login_view.social_authorization_code, name='social_auth_code'),
+    path('social/<str:provider>/auth-callback/', social_login_view.social_authorization_code_callback, name='social_auth_code_callback'),
+    path('social/<str:provider>/profile/', social_login_view.social_profile, name='social_profile'),
+    path('social/<str:provider>/login/', social_login_view.social_login, name='social_login'),
+    
+    # 기존 카카오 URL 호환
+    path('kakao/auth/', social_login_view.social_authorization_code, {'provider': 'kakao'}, name='kakao_auth_code'),
+    path('kakao/auth-callback/', social_login_view.social_authorization_code_callback, {'provider': 'kakao'}, name='kakao_auth_code_callback'),
+    path('kakao/profile/', social_login_view.social_profile, {'provider': 'kakao'}, name='kakao_profile'),
+    
+    path('metrics/', metrics_view.account_metrics, name='account_metrics'),
 ]
 
 urlpatterns += router.urls
+
+# ASGI 배포: settings.ACCOUNT_ASYNC_VIEWS = True 면 async 뷰가 router 보다 먼저 매칭
+if getattr(settings, 'ACCOUNT_ASYNC_VIEWS', False):
+    from account.views import async_views
+    
+    urlpatterns = [
+        path('sign-in/', async_views.sign_in, name='async_sign_in'),
+        path('', async_views.user_collection, name='async_user_collection'),
+        path('<int:pk>/', async_views.user_detail, name='async_user_detail'),
+        path('social/<str:provider>/auth-callback/', async_views.social_authorization_code_callback, name='async_social_auth_code_callback'),
+        path('social/<str:provider>/profile/', async_views.social_profile, name='async_social_profile'),
+        path('social/<str:provider>/login/', async_views.social_login, name='async_social_login'),
+        path('kakao/auth-callback/', async_views.social_authorization_code_callback, {'provider': 'kakao'}, name='async_kakao_auth_code_callback'),
+        path('kakao/profile/', async_views.social_profile, {'provider': 'kakao'}, name='async_kakao_profile'),
+    ] + urlpatterns
@@ -0,0 +1,27 @@
+import unicodedata
+
+from typing              import Optional
+
+from account.request_log import request_logger
+from common.util_common  import CommonUtil as BaseCommonUtil
+
+
+class CommonUtil(BaseCommonUtil):
+    """ common.util_common.CommonUtil 에서 print_log 만 구조화 / 샘플링 요청 로그로 교체
+        - 뷰의 CommonUtil.print_log(...) 호출부는 그대로 사용
+    """
+    
+    @staticmethod
+    def print_log(app_name, method_name, request_data=None, class_=None, **fields):
+        request_logger.print_log(app_name=app_name, method_name=method_name, request_data=request_data, class_=class_, **fields)
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """ 이메일 정규화 (회원가입 / 로그인 / 소셜 로그인 / 일괄 등록 / 캐시 키 공통)
+        - 유니코드 NFKC 정규화 후 앞뒤 공백 제거, 전체 소문자 (users_email_lower_uniq 제약과 같은 기준)
+        - 로컬 파트의 점 / + 태그 등 provider 별 규칙은 적용하지 않음 (서로 다른 주소로 취급)
+        - None 은 그대로 리턴
+    """
+    if email is None:
+        return None
+    return unicodedata.normalize('NFKC', email).strip().lower()
@@ -0,0 +1,395 @@
+import json
+import traceback
+
+from asgiref.sync                         import sync_to_async
+
+from django.core.serializers.json         import DjangoJSONEncoder
+from django.db                            import transaction, IntegrityError, DatabaseError
+from django.http                          import JsonResponse
+from rest_framework                       import status
+from rest_framework.serializers           import ValidationError
+
+from account.email_outbox                 import email_outbox_query
+from account.enums                        import SocialSignUpTypeEnum, AccountTypeEnum
+from account.exceptions                   import (
+    SocialProviderNotFoundException,
+    SocialEmailNotVerifiedException,
+    SocialTokenInvalidException,
+    RateLimitExceededException,
+    SignInFailedException
+)
+from account.models                       import User
+from account.passwords                    import password_manager
+from account.query_orm.user_query         import UserDatabaseQuery
+from account.reference_data               import reference_data
+from account.serializers.projections      import UserInfoProjection
+from account.social.registry              import provider_registry
+from account.throttling                   import rate_limiter, get_client_ip
+from account.tokens                       import token_manager
+from account.utils                        import CommonUtil, normalize_email
+from account.views.user_views             import UserViewSet
+from common.const                         import AppNameConst, MethodNameConst, ResponseMsgConst, ResponseErrMsgConst
+from common.util_date                     import TimeUtils
+from common.exceptions                    import (
+    RequestsError,
+    NotNullException,
+    UserExistsException,
+    UserDeletedException
+)
+
+# ASGI 용 async 뷰 (settings.ACCOUNT_ASYNC_VIEWS = True 일 때 urls 에서 sync 뷰 대신 연결)
+# - DB 는 async ORM (afirst / aupdate ...), 소셜 provider 는 AsyncSocialHttpClient, 비밀번호 해시는 스레드 풀
+# - transaction.atomic 이 필요한 INSERT (회원가입) 와 DRF serializer 검증만 sync_to_async 로 스레드에서 실행
+# - rate_limiter 는 async 메서드 (ahit ...) 로 호출 (cache 백엔드의 캐시 I/O 가 루프를 막지 않음)
+# - request_logger 는 메모리 연산이라 그대로 호출
+# - 응답 형식은 sync 뷰와 같음
+user_query = UserDatabaseQuery()
+
+# retrieve 응답 (UserCreateSerializer 의 읽기 필드) 을 만드는 컬럼
+RETRIEVE_FIELDS = ('id', 'email', 'social_signup_type_id', 'account_type_id')
+
+# async 버전이 없는 액션은 sync 뷰로 위임 (관리자 권한 체크 (UserViewSet.ADMIN_ACTIONS) 도 sync 뷰에서 그대로 적용)
+user_list_view   = UserViewSet.as_view({'get': 'list'})
+user_detail_view = UserViewSet.as_view({'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'})
+
+
+def csrf_exempt(view):
+    """ async 뷰용 csrf_exempt (DRF 뷰와 같이 토큰 인증 API 이므로 CSRF 체크 제외) """
+    view.csrf_exempt = True
+    return view
+
+
+def json_response(data, status_code: int, headers: dict=None) -> JsonResponse:
+    return JsonResponse(data, status=status_code, headers=headers, safe=False, encoder=DjangoJSONEncoder,
+                        json_dumps_params={'ensure_ascii': False})
+
+
+def not_allowed_response() -> JsonResponse:
+    return json_response(CommonUtil.return_data(err_msg=ResponseMsgConst.NOT_ALLOWED_REQUEST_TYPE),
+                         status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def rate_limited_response(e: RateLimitExceededException) -> JsonResponse:
+    return json_response(CommonUtil.return_data(msg=str(e)), status.HTTP_429_TOO_MANY_REQUESTS,
+                         headers={'Retry-After': str(e.retry_after)})
+
+
+def parse_body(request) -> dict:
+    """ JSON 또는 form body -> dict (DRF request.data 대응) """
+    if request.content_type == 'application/json':
+        return json.loads(request.body or b'{}')
+    return request.POST.dict()
+
+
+@csrf_exempt
+async def sign_in(request):
+    """ UserViewSet.sign_in 의 async 버전 """
+    if request.method != 'POST':
+        return not_allowed_response()
+    
+    try:
+        request_data = parse_body(request)
+        CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.SIGN_IN, request_data=request_data)
+        
+        # 요청 제한 (DB 조회 전)
+        await rate_limiter.ahit('sign_in_ip', get_client_ip(request))
+        
+        # 입력 값 편집
+        data = {
+            'email'              : normalize_email(request_data['email']),
+            'password'           : request_data.get('password').strip() if request_data.get('password') else None,
+            'social_signup_type' : int(request_data['social_signup_type']),
+        }
+        
+        # 비밀번호 없는 로그인은 허용하지 않음 (소셜 가입 유저 포함)
+        if not data['password']:
+            raise NotNullException('password')
+        
+        await rate_limiter.ahit('sign_in_email', data['email'])
+        await rate_limiter.acheck_lockout(data['email'])
+        
+        # 가입되지 않은 / 탈퇴한 / 비밀번호 불일치 모두 같은 응답 (계정 존재 여부 노출 방지)
+        user_obj: User = await user_query.aget_sign_in_user(email=data['email'])
+        if user_obj is None or user_obj.is_deleted:
+            await rate_limiter.arecord_failure(data['email'])
+            raise SignInFailedException
+        
+        # 소셜 가입 유저는 비밀번호가 없으므로 항상 실패 (토큰은 social_login 에서만 발급)
+        if user_obj.password is None:
+            is_correct, needs_rehash = False, False
+        else:
+            is_correct, needs_rehash = await password_manager.averify(data['password'], user_obj.password)
+        
+        if not is_correct:
+            await rate_limiter.arecord_failure(data['email'])
+            raise SignInFailedException
+        
+        await rate_limiter.areset_failures(data['email'])
+        
+        if needs_rehash:
+            await user_query.aupdate_password(user=user_obj, encoded_password=await password_manager.ahash(data['password']))
+        
+        await user_query.aincrease_login_count(user=user_obj, present_time=TimeUtils.get_today())
+        
+        return_data          = UserInfoProjection.from_instance(user_obj)
+        return_data['token'] = token_manager.issue(user_obj.id)
+        
+        return json_response(CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data), status.HTTP_200_OK)
+        
+    except (KeyError, ValueError):
+        return json_response(ResponseErrMsgConst.KEY_ERROR, status.HTTP_400_BAD_REQUEST)
+        
+    except NotNullException as e:
+        return json_response(CommonUtil.return_data(msg=str(e)), status.HTTP_400_BAD_REQUEST)
+        
+    except SignInFailedException as e:
+        return json_response(CommonUtil.return_data(msg=str(e)), status.HTTP_400_BAD_REQUEST)
+        
+    except RateLimitExceededException as e:
+        return rate_limited_response(e)
+
+
+def save_user(data: dict) -> User:
+    """ serializer 검증 + 유저 INSERT + 가입 메일 outbox INSERT (한 트랜잭션, 스레드에서 실행) """
+    from account.serializers.user_serializers import UserCreateSerializer
+    
+    serializer = UserCreateSerializer(data=data)
+    serializer.is_valid(raise_exception=True)
+    
+    with transaction.atomic():
+        user = serializer.save()
+        email_outbox_query.enqueue_sign_up(user)
+    return user
+
+
+async def create(request):
+    """ UserViewSet.create 의 async 버전 """
+    try:
+        request_data = parse_body(request)
+        CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.CREATE, request_data=request_data)
+        
+        # 요청 제한 (DB 조회 전)
+        await rate_limiter.ahit('create_ip', get_client_ip(request))
+        
+        # 입력 값 편집
+        data = {
+            'email'             : normalize_email(request_data['email']),
+            'password'          : request_data.get('password').strip() if request_data.get('password') else None,
+            'social_signup_type': int(request_data['social_signup_type']),
+            'account_type'      : AccountTypeEnum.CONSUMER.value, # 고정 값
+            'login_count'       : 1 # 고정
+        }
+        
+        # 상관관계 유효성 체크
+        if SocialSignUpTypeEnum.NO_SOCIAL.value == data['social_signup_type']:
+            if not data['password']:
+                raise NotNullException('password')
+        
+        # 중복 체크 1회 (bloom filter 음성이면 0회)
+        is_deleted = await user_query.aget_email_is_deleted(email=data['email'])
+        if is_deleted is not None:
+            if is_deleted:
+                raise UserDeletedException
+            raise UserExistsException
+        
+        if data['password']:
+            data['password'] = await password_manager.ahash(data['password'])
+        
+        try:
+            await sync_to_async(save_user)(data)
+            
+        except IntegrityError:
+            # 중복 체크 이후 (또는 bloom filter 동기화 전) 같은 이메일로 가입된 경우. DB 유니크 제약이 최종 판단
+            if await user_query.aget_email_is_deleted(email=data['email'], use_bloom_filter=False):
+                raise UserDeletedException
+            raise UserExistsException
+        
+        return json_response(CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS), status.HTTP_201_CREATED)
+        
+    except (KeyError, ValueError):
+        traceback.print_exc()
+        return json_response(CommonUtil.return_data(msg=ResponseErrMsgConst.KEY_ERROR), status.HTTP_400_BAD_REQUEST)
+        
+    except NotNullException as e:
+        return json_response(CommonUtil.return_data(msg=str(e)), status.HTTP_400_BAD_REQUEST)
+        
+    except ValidationError as e:
+        return json_response(e.detail, status.HTTP_400_BAD_REQUEST)
+        
+    except (UserExistsException, UserDeletedException):
+        # 탈퇴 유저 이메일도 가입된 이메일과 같은 응답 (탈퇴 여부 노출 방지)
+        return json_response(CommonUtil.return_data(msg=str(UserExistsException())), status.HTTP_400_BAD_REQUEST)
+        
+    except RateLimitExceededException as e:
+        return rate_limited_response(e)
+        
+    except DatabaseError:
+        traceback.print_exc()
+        return json_response(CommonUtil.return_data(msg=ResponseErrMsgConst.DATABASE_OPERATION_ERROR),
+                             status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+async def retrieve(request, pk: int):
+    """ UserViewSet.retrieve 의 async 버전 (SELECT 1회). 응답은 UserCreateSerializer 출력과 같은 필드 """
+    CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.RETRIEVE, request_data={'pk': pk})
+    
+    row = await user_query.on_replica(User.objects.filter(pk=pk)).values(*RETRIEVE_FIELDS).afirst()
+    if row is None:
+        return json_response({'detail': 'Not found.'}, status.HTTP_404_NOT_FOUND)
+    
+    return json_response({
+        'id'                     : row['id'],
+        'email'                  : row['email'],
+        'social_signup_type'     : row['social_signup_type_id'],
+        'account_type'           : row['account_type_id'],
+        'user_account_type_name' : reference_data.get_account_type_name(row['account_type_id']),
+        'social_signup_type_name': reference_data.get_social_signup_type_name(row['social_signup_type_id']),
+    }, status.HTTP_200_OK)
+
+
+@csrf_exempt
+async def user_collection(request):
+    """ '' : POST -> async create, GET -> sync list """
+    if request.method == 'POST':
+        return await create(request)
+    return await sync_to_async(user_list_view)(request)
+
+
+@csrf_exempt
+async def user_detail(request, pk: int):
+    """ '<pk>/' : GET -> async retrieve, PUT / PATCH / DELETE -> sync 뷰 """
+    if request.method == 'GET':
+        return await retrieve(request, pk)
+    return await sync_to_async(user_detail_view)(request, pk=pk)
+
+
+async def social_authorization_code_callback(request, provider: str):
+    """ social_login_view.social_authorization_code_callback 의 async 버전 """
+    if request.method != 'GET':
+        return not_allowed_response()
+    
+    return_data = dict()
+    
+    try:
+        return_data['access_token'] = await provider_registry.get(provider).aexchange_code(request.GET['code'])
+        
+        return json_response(CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data), status.HTTP_200_OK)
+        
+    except KeyError:
+        return json_response(CommonUtil.return_data(err_msg=ResponseErrMsgConst.KEY_ERROR), status.HTTP_400_BAD_REQUEST)
+        
+    except SocialProviderNotFoundException as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_404_NOT_FOUND)
+        
+    except RequestsError as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@csrf_exempt
+async def social_profile(request, provider: str):
+    """ social_login_view.social_profile 의 async 버전 """
+    if request.method != 'POST':
+        return not_allowed_response()
+    
+    return_data = dict()
+    
+    try:
+        return_data['email'] = await provider_registry.get(provider).aget_email(parse_body(request)['access_token'])
+        
+        return json_response(CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data), status.HTTP_200_OK)
+        
+    except (KeyError, ValueError):
+        return json_response(CommonUtil.return_data(msg=ResponseErrMsgConst.KEY_ERROR), status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+    except SocialProviderNotFoundException as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_404_NOT_FOUND)
+        
+    except SocialEmailNotVerifiedException as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_403_FORBIDDEN)
+        
+    except SocialTokenInvalidException as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_401_UNAUTHORIZED)
+        
+    except RequestsError as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@csrf_exempt
+async def social_login(request, provider: str):
+    """ social_login_view.social_login 의 async 버전
+        - provider 호출 2회 (코드 교환, 프로필) 동안 스레드를 점유하지 않음
+    """
+    if request.method != 'POST':
+        return not_allowed_response()
+    
+    return_data = dict()
+    
+    try:
+        request_data    = parse_body(request)
+        social_provider = provider_registry.get(provider)
+        signup_type     = social_provider.signup_type.value
+        present_time    = TimeUtils.get_today()
+        
+        access_token = request_data.get('access_token')
+        if not access_token:
+            access_token = await social_provider.aexchange_code(request_data['code'])
+        
+        email = await social_provider.aget_email(access_token)
+        
+        created        = False
+        user_obj: User = await user_query.aget_sign_in_user(email=email)
+        
+        if user_obj is None:
+            try:
+                user_obj = await user_query.acreate_social_user(email=email, social_signup_type=signup_type, present_time=present_time)
+                created  = True
+                
+            except IntegrityError:
+                # 동시 요청으로 이미 가입된 경우 로그인으로 처리. 유저가 없으면 (다른 제약 위반 / 동시 탈퇴 아카이브) 409
+                user_obj = await user_query.aget_sign_in_user(email=email)
+                if user_obj is None:
+                    raise
+        
+        if not created:
+            if user_obj.is_deleted:
+                raise UserDeletedException
+            
+            # 다른 방식(일반/다른 소셜)으로 가입된 이메일
+            if user_obj.social_signup_type_id != signup_type:
+                raise UserExistsException
+            
+            await user_query.aincrease_login_count(user=user_obj, present_time=present_time)
+        
+        return_data['created'] = created
+        return_data['user']    = UserInfoProjection.from_instance(user_obj)
+        return_data['token']   = token_manager.issue(user_obj.id)
+        
+        return json_response(CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data),
+                             status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+                             
+    except (KeyError, ValueError):
+        traceback.print_exc()
+        return json_response(CommonUtil.return_data(err_msg=ResponseErrMsgConst.KEY_ERROR), status.HTTP_400_BAD_REQUEST)
+        
+    except SocialProviderNotFoundException as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_404_NOT_FOUND)
+        
+    except RequestsError as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_503_SERVICE_UNAVAILABLE)
+        
+    except UserExistsException as e:
+        return json_response(CommonUtil.return_data(msg=str(e)), status.HTTP_400_BAD_REQUEST)
+        
+    except UserDeletedException as e:
+        return json_response(CommonUtil.return_data(msg=str(e)), status.HTTP_204_NO_CONTENT)
+        
+    except SocialEmailNotVerifiedException as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_403_FORBIDDEN)
+        
+    except SocialTokenInvalidException as e:
+        return json_response(CommonUtil.return_data(err_msg=str(e)), status.HTTP_401_UNAUTHORIZED)
+        
+    except IntegrityError:
+        traceback.print_exc()
+        return json_response(CommonUtil.return_data(err_msg=ResponseErrMsgConst.DATABASE_OPERATION_ERROR),
+                             status.HTTP_409_CONFLICT)
@@ -0,0 +1,29 @@
+from django.conf                           import settings
+from django.http                           import HttpResponse, Http404
+from django.views.decorators.http          import require_GET
+
+from account.cache.email_bloom_filter      import email_bloom_filter
+from account.cache.social_profile_cache    import social_profile_cache
+from account.db_router                     import replica_selector
+from account.metrics                       import request_metrics
+from account.query_orm.login_stat_recorder import login_stat_recorder
+from account.request_log                   import request_logger
+
+
+@require_GET
+def account_metrics(request):
+    """ Prometheus scrape 용 계측 값 (text exposition format)
+        - settings.ACCOUNT_METRICS_ENDPOINT_ENABLED 가 True 일 때만 노출 (기본 404)
+        - 값은 프로세스 단위이므로 워커별로 scrape 하거나 multiprocess 집계 필요
+    """
+    if not getattr(settings, 'ACCOUNT_METRICS_ENDPOINT_ENABLED', False):
+        raise Http404
+    
+    body = request_metrics.render(extra={
+        'login_stat'    : login_stat_recorder.metrics(),
+        'social_profile': social_profile_cache.metrics(),
+        'request_log'   : request_logger.metrics(),
+        'db_replica'    : replica_selector.metrics(),
+        'email_bloom'   : email_bloom_filter.metrics(),
+    })
+    return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,37 +1,53 @@
 import traceback
-import requests
 
-from django.conf                import settings
-from django.shortcuts           import redirect
-from rest_framework             import status
-from rest_framework.response    import Response
-from rest_framework.permissions import AllowAny
-from rest_framework.decorators  import api_view, permission_classes
+from django.db                            import IntegrityError
+from django.shortcuts                     import redirect
+from rest_framework                       import status
+from rest_framework.response              import Response
+from rest_framework.permissions           import AllowAny
+from rest_framework.decorators            import api_view, permission_classes
 
-from common.const               import ResponseMsgConst, ResponseErrMsgConst, CommonConst
-from common.util_common         import CommonUtil
-from common.exceptions          import (
-    RequestsError
+from account.exceptions                   import (
+    SocialProviderNotFoundException,
+    SocialEmailNotVerifiedException,
+    SocialTokenInvalidException
 )
+from account.models                       import User
+from account.query_orm.user_query         import UserDatabaseQuery
+from account.serializers.projections      import UserInfoProjection
+from account.social.registry              import provider_registry
+from account.tokens                       import token_manager
+from account.utils                        import CommonUtil
+from common.const                         import ResponseMsgConst, ResponseErrMsgConst
+from common.util_date                     import TimeUtils
+from common.exceptions                    import (
+    RequestsError,
+    UserExistsException,
+    UserDeletedException
+)
+
+user_query = UserDatabaseQuery()
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
-def kakao_authorization_code(request):
-    """ 카카오 인가 코드 취득
+def social_authorization_code(request, provider: str):
+    """ 소셜 인가 코드 취득 (provider: kakao, naver, facebook, google, apple)
         # Todo Redirect Error Page
     """
-    HOST         = settings.KAKAO_HOST
-    CLIENT_ID    = settings.KAKAO_REST_API_KEY
-    REDIRECT_URI = settings.KAKAO_SIGNUP_REDIRECT_URI
-    
     if request.method != 'GET':
         return redirect('')
     
     try:
-        redirect_url = f'{HOST}/oauth/authorize?client_id={CLIENT_ID}&redirect_uri={REDIRECT_URI}&response_type=code'
+        redirect_url = provider_registry.get(provider).authorize_url(state=request.query_params.get('state'))
         return redirect(redirect_url)
         
+    except SocialProviderNotFoundException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_404_NOT_FOUND
+        )
+        
     except RequestsError:
         traceback.print_exc()
         return redirect('')
@@ -39,10 +55,10 @@ def kakao_authorization_code(request):
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
-def kakao_authorization_code_callback(request):
-    """ 카카오 인가 코드 취득 콜백 API. 엑세스 토큰 및 리프레쉬 토큰 받아 리턴
+def social_authorization_code_callback(request, provider: str):
+    """ 소셜 인가 코드 취득 콜백 API. 엑세스 토큰 받아 리턴
         request.query_params
-        - code : 카카오 인가 코드
+        - code : provider 인가 코드
         
         return
         - success
@@ -69,23 +85,12 @@ def kakao_authorization_code_callback(request):
         )
     
     return_data = dict()
-    HOST         = settings.KAKAO_HOST
-    CLIENT_ID    = settings.KAKAO_REST_API_KEY
-    REDIRECT_URI = settings.KAKAO_SIGNUP_REDIRECT_URI
     
     try:
         code = request.query_params['code']
         
-        request_url = f'{HOST}/oauth/token?grant_type=authorization_code&client_id={CLIENT_ID}&' \
-                      f'redirect_uri={REDIRECT_URI}&code={code}'
-        
-        result = requests.get(request_url).json()
-        error  = result.get('error')
-        
-        if error:
-            raise RequestsError(result.get('error_code'))
-        
-        return_data['access_token'] = result['access_token']
+        # 커넥션 풀 / 타임아웃 / 재시도 / 서킷 브레이커 적용된 공용 클라이언트 사용
+        return_data['access_token'] = provider_registry.get(provider).exchange_code(code)
         
         return Response(
             CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data),
@@ -99,6 +104,12 @@ def kakao_authorization_code_callback(request):
             status=status.HTTP_400_BAD_REQUEST
         )
         
+    except SocialProviderNotFoundException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_404_NOT_FOUND
+        )
+        
     except RequestsError as e:
         return Response(
             CommonUtil.return_data(err_msg=str(e)),
@@ -107,8 +118,8 @@ def kakao_authorization_code_callback(request):
 
 
 @api_view(['POST'])
-def kakao_profile(request):
-    """ 카카오 프로필 정보 취득. 이메일 정보 취득 후 리턴하여 회원가입 또는 로그인 진행
+def social_profile(request, provider: str):
+    """ 소셜 프로필 정보 취득. 이메일 정보 취득 후 리턴하여 회원가입 또는 로그인 진행
         request.data
         - access_token
         
@@ -124,16 +135,10 @@ def kakao_profile(request):
     return_data = dict()
     
     try:
-        url          = 'https://kapi.kakao.com/v2/user/me'
         access_token = request.data['access_token']
         
-        headers = {
-            'Authorization': f"Bearer {access_token}",
-            'Content-Type' : CommonConst.CONTENT_TYPE_X_WWW
-        }
-        
-        profile_info = requests.get(url, headers=headers).json()
-        return_data['email'] = profile_info['kakao_account']['email']
+        # 같은 토큰으로 반복 조회 시 캐시 사용 (provider API 호출 생략)
+        return_data['email'] = provider_registry.get(provider).get_email(access_token)
         
         return Response(
             CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data),
@@ -147,9 +152,150 @@ def kakao_profile(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
     
+    except SocialProviderNotFoundException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    except SocialEmailNotVerifiedException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    except SocialTokenInvalidException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    
     except RequestsError as e:
         traceback.print_exc()
         return Response(
             CommonUtil.return_data(err_msg=str(e)),
             status=status.HTTP_503_SERVICE_UNAVAILABLE
         )
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def social_login(request, provider: str):
+    """ 소셜 로그인 원스텝 API. 인가 코드 또는 엑세스 토큰으로 프로필 조회 후 로그인, 유저가 없으면 회원가입
+        (콜백 -> 프로필 -> sign-in / create 3번의 요청을 1번으로 처리)
+        request.data
+        - code         : provider 인가 코드 (access_token 이 없을 때 필수)
+        - access_token : provider 엑세스 토큰
+        
+        return
+        - 200 : 로그인, 201 : 회원가입 후 로그인
+            {
+                'created': bool,
+                'user'   : UserInfoProjection,
+                'token'  : {'access_token', 'refresh_token', 'expires_in'}
+            }
+        - 401 : 우리 앱에 발급되지 않은 (다른 앱의) 또는 유효하지 않은 provider 토큰
+        - 403 : provider 가 인증하지 않은 이메일 (계정을 만들거나 연결하지 않음)
+        - 409 : 동시 가입 충돌 후에도 유저를 찾지 못함 (재시도)
+    """
+    if request.method != 'POST':
+        return Response(
+            CommonUtil.return_data(err_msg=ResponseMsgConst.NOT_ALLOWED_REQUEST_TYPE),
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+    
+    return_data = dict()
+    
+    try:
+        social_provider = provider_registry.get(provider)
+        signup_type     = social_provider.signup_type.value
+        present_time    = TimeUtils.get_today()
+        
+        access_token = request.data.get('access_token')
+        if not access_token:
+            access_token = social_provider.exchange_code(request.data['code'])
+        
+        email = social_provider.get_email(access_token)
+        
+        created        = False
+        user_obj: User = user_query.get_sign_in_user(email=email)
+        
+        if user_obj is None:
+            try:
+                user_obj = user_query.create_social_user(email=email, social_signup_type=signup_type, present_time=present_time)
+                created  = True
+                
+            except IntegrityError:
+                # 동시 요청으로 이미 가입된 경우 로그인으로 처리. 유저가 없으면 (다른 제약 위반 / 동시 탈퇴 아카이브) 409
+                user_obj = user_query.get_sign_in_user(email=email)
+                if user_obj is None:
+                    raise
+        
+        if not created:
+            if user_obj.is_deleted:
+                raise UserDeletedException
+            
+            # 다른 방식(일반/다른 소셜)으로 가입된 이메일
+            if user_obj.social_signup_type_id != signup_type:
+                raise UserExistsException
+            
+            user_query.increase_login_count(user=user_obj, present_time=present_time)
+        
+        return_data['created'] = created
+        return_data['user']    = UserInfoProjection.from_instance(user_obj)
+        return_data['token']   = token_manager.issue(user_obj.id)
+        
+        return Response(
+            CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data),
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
+        
+    except KeyError:
+        traceback.print_exc()
+        return Response(
+            CommonUtil.return_data(err_msg=ResponseErrMsgConst.KEY_ERROR),
+            status=status.HTTP_400_BAD_REQUEST
+        )
+        
+    except SocialProviderNotFoundException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_404_NOT_FOUND
+        )
+        
+    except UserExistsException as e:
+        return Response(
+            CommonUtil.return_data(msg=str(e)),
+            status=status.HTTP_400_BAD_REQUEST
+        )
+        
+    except UserDeletedException as e:
+        return Response(
+            CommonUtil.return_data(msg=str(e)),
+            status=status.HTTP_204_NO_CONTENT
+        )
+        
+    except SocialEmailNotVerifiedException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_403_FORBIDDEN
+        )
+        
+    except SocialTokenInvalidException as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+        
+    except IntegrityError:
+        traceback.print_exc()
+        return Response(
+            CommonUtil.return_data(err_msg=ResponseErrMsgConst.DATABASE_OPERATION_ERROR),
+            status=status.HTTP_409_CONFLICT
+        )
+        
+    except RequestsError as e:
+        return Response(
+            CommonUtil.return_data(err_msg=str(e)),
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
@@ -1,97 +1,214 @@
+import json
 import traceback
 
-from django.db                                  import transaction, DatabaseError
+from django.conf                                import settings
+from django.core.serializers.json               import DjangoJSONEncoder
+from django.db                                  import transaction, DatabaseError, IntegrityError
+from django.http                                import StreamingHttpResponse
 
 from rest_framework                             import viewsets, status
 from rest_framework.response                    import Response
 from rest_framework.decorators                  import action
-from rest_framework.serializers                 import ValidationError
+from rest_framework.exceptions                  import AuthenticationFailed
 
-from account.serializers.user_serializers       import *
+from account.serializers.projections            import UserInfoProjection, UserListProjection
+from account.authentication                     import JWTAuthentication
+from account.bulk_import                        import UserBulkImporter
+from account.const                              import UserListConst, UserImportConst, JWTConst
+from account.email_outbox                       import email_outbox_query
+from account.models                             import User
 from account.enums                              import SocialSignUpTypeEnum, AccountTypeEnum
+from account.pagination                         import UserCursorPagination
+from account.exceptions                         import (
+    TokenInvalidException,
+    RateLimitExceededException,
+    SignInFailedException,
+    UserImportTooLargeException
+)
+from account.passwords                          import password_manager
+from account.permissions                        import IsAccountAdmin
+from account.throttling                         import rate_limiter, get_client_ip
+from account.tokens                             import token_manager
 from account.query_orm.user_query               import UserDatabaseQuery
+from account.utils                              import CommonUtil, normalize_email
 from common.const                               import AppNameConst, MethodNameConst, ResponseMsgConst, ResponseErrMsgConst
-from common.util_common                         import CommonUtil
 from common.util_date                           import TimeUtils
 from common.exceptions                          import (
     NotNullException,
     UserExistsException,
     UserNotExistsException,
-    UserDeletedException,
-    PasswordNotCorrectException
+    UserDeletedException
 )
 
 
 class UserViewSet(viewsets.ModelViewSet):
-    serializer_class = UserCreateSerializer
+    pagination_class = UserCursorPagination
     user_query       = UserDatabaseQuery()
     
+    # 조회 전용 액션은 replica 에서 조회 (UserDatabaseQuery.on_replica)
+    REPLICA_ACTIONS = ('retrieve', 'list', 'export')
+    
+    # 전체 유저 조회 등 관리 도구용 액션은 관리자 토큰 필요 (수정은 본인 인증 구현 전까지 관리자만)
+    ADMIN_ACTIONS            = ('list', 'export', 'bulk_create', 'update', 'partial_update')
+    admin_permission_classes = [IsAccountAdmin]
+    
     def get_queryset(self):
-        queryset = User.objects.filter(is_deleted=False)
+        queryset = User.objects.all()
+        if self.action in self.REPLICA_ACTIONS:
+            queryset = self.user_query.on_replica(queryset)
         return queryset
     
+    def get_permissions(self):
+        if self.action in self.ADMIN_ACTIONS:
+            return [permission() for permission in self.admin_permission_classes]
+        return super().get_permissions()
+    
+    def get_serializer_class(self):
+        # serializer 는 회원가입 / 상세 조회 등 처음 쓰는 요청에서 import (기동 및 sign-in 경로에서 제외)
+        from account.serializers.user_serializers import UserCreateSerializer
+        return UserCreateSerializer
+    
     @action(detail=False, methods=['post'], url_path='sign-in')
     def sign_in(self, request):
         """ 유저 로그인 (컨슈머 only)
             일반 로그인
              - email, password, social_signup_type 필수
             
-            소셜 로그인
-             - email, social_signup_type 필수
+            소셜 가입 유저 (비밀번호 없음)
+             - 이메일만으로는 토큰을 발급하지 않음. provider 인증을 거치는 social/<provider>/login/ 사용
         """
         CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.SIGN_IN, request_data=request.data, class_=self)
         
         # Todo list
-        # 1. Sendgrid email 인증 비동기
-        # 2. 보인인증 모듈
-        # 3. JWT or DRF AuthToken
-        # 4. insert consumer model with transaction atomic
+        # 1. 보인인증 모듈
+        # 2. insert consumer model with transaction atomic
         
         try:
+            # 요청 제한 (DB 조회 전)
+            rate_limiter.hit('sign_in_ip', get_client_ip(request))
+            
             # 입력 값 편집
             data = {
-                'email'              : request.data['email'].strip(),
+                'email'              : normalize_email(request.data['email']),
                 'password'           : request.data.get('password').strip() if request.data.get('password') else None,
                 'social_signup_type' : int(request.data['social_signup_type']),
                 'account_type'       : AccountTypeEnum.CONSUMER.value # 고정 값
             }
             
-            # 상관관계 유효성 체크
-            if SocialSignUpTypeEnum.NO_SOCIAL.value == data['social_signup_type']:
-                if not data['password']:
-                    raise NotNullException('password')
+            # 비밀번호 없는 로그인은 허용하지 않음 (소셜 가입 유저 포함)
+            if not data['password']:
+                raise NotNullException('password')
+            
+            rate_limiter.hit('sign_in_email', data['email'])
+            rate_limiter.check_lockout(data['email'])
             
-            user = self.user_query.get_user_by_email(email=data['email'])
-            if not user.exists():
-                raise UserNotExistsException
+            # 조회 1회 (캐시 hit 시 0회) + F-expression UPDATE 1회
+            # 가입되지 않은 / 탈퇴한 / 비밀번호 불일치 모두 같은 응답 (계정 존재 여부 노출 방지)
+            user_obj: User = self.user_query.get_sign_in_user(email=data['email'])
+            if user_obj is None or user_obj.is_deleted:
+                rate_limiter.record_failure(data['email'])
+                raise SignInFailedException
             
-            user_obj: User = user.first()
-            is_deleted     = user_obj.is_deleted
+            # 소셜 가입 유저는 비밀번호가 없으므로 항상 실패 (토큰은 social_login 에서만 발급)
+            if user_obj.password is None:
+                is_correct, needs_rehash = False, False
+            else:
+                is_correct, needs_rehash = password_manager.verify(data['password'], user_obj.password)
             
-            if is_deleted:
-                raise UserDeletedException
+            if not is_correct:
+                rate_limiter.record_failure(data['email'])
+                raise SignInFailedException
             
-            if data['password'] != user_obj.password:
-                raise PasswordNotCorrectException
+            rate_limiter.reset_failures(data['email'])
+            
+            # 해시 알고리즘 / cost 변경 또는 기존 평문 비밀번호인 경우 재해시
+            if needs_rehash:
+                self.user_query.update_password(user=user_obj, encoded_password=password_manager.hash(data['password']))
             
             self.user_query.increase_login_count(user=user_obj, present_time=TimeUtils.get_today())
             
-            serializer = UserInfoSerializer(user_obj)
-            result     = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS,
-                                                data=serializer.data)
+            # access / refresh 토큰 발급 (DB 접근 없음)
+            return_data          = UserInfoProjection.from_instance(user_obj)
+            return_data['token'] = token_manager.issue(user_obj.id)
             
+            result = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=return_data)
             return Response(result, status=status.HTTP_200_OK)
         
         except KeyError as e:
             return Response(ResponseErrMsgConst.KEY_ERROR, status=status.HTTP_400_BAD_REQUEST)
         
-        except UserNotExistsException as e:
+        except NotNullException as e:
             result = CommonUtil.return_data(msg=str(e))
-            return Response(result, status=status.HTTP_409_CONFLICT)
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
         
-        except PasswordNotCorrectException as e:
+        except SignInFailedException as e:
             result = CommonUtil.return_data(msg=str(e))
             return Response(result, status=status.HTTP_400_BAD_REQUEST)
+        
+        except RateLimitExceededException as e:
+            return self.rate_limited_response(e)
+    
+    def rate_limited_response(self, e: RateLimitExceededException) -> Response:
+        result = CommonUtil.return_data(msg=str(e))
+        return Response(result, status=status.HTTP_429_TOO_MANY_REQUESTS, headers={'Retry-After': str(e.retry_after)})
+    
+    @action(detail=False, methods=['post'], url_path='token/refresh')
+    def token_refresh(self, request):
+        """ 토큰 재발급. 사용한 refresh 토큰은 폐기 (rotation)
+            request body
+            - refresh_token : str
+        """
+        try:
+            result = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS,
+                                            data=token_manager.refresh(request.data['refresh_token']))
+            return Response(result, status=status.HTTP_200_OK)
+            
+        except KeyError:
+            result = CommonUtil.return_data(msg=ResponseErrMsgConst.KEY_ERROR)
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            
+        except TokenInvalidException as e:
+            result = CommonUtil.return_data(msg=str(e))
+            return Response(result, status=status.HTTP_401_UNAUTHORIZED)
+    
+    @action(detail=False, methods=['post'], url_path='sign-out')
+    def sign_out(self, request):
+        """ 로그아웃. refresh 토큰 폐기
+            request body
+            - refresh_token : str
+        """
+        try:
+            claims = token_manager.verify(request.data['refresh_token'], token_type=JWTConst.TOKEN_TYPE_REFRESH)
+            token_manager.revoke(claims)
+            
+            result = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS)
+            return Response(result, status=status.HTTP_200_OK)
+            
+        except KeyError:
+            result = CommonUtil.return_data(msg=ResponseErrMsgConst.KEY_ERROR)
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            
+        except TokenInvalidException as e:
+            result = CommonUtil.return_data(msg=str(e))
+            return Response(result, status=status.HTTP_401_UNAUTHORIZED)
+    
+    @action(detail=False, methods=['post'], url_path='email/verify')
+    def verify_email(self, request):
+        """ 가입 인증 메일의 토큰으로 이메일 인증
+            request body
+            - token : str
+        """
+        try:
+            if not email_outbox_query.verify_email(request.data['token']):
+                result = CommonUtil.return_data(msg=ResponseErrMsgConst.ATTRIBUTE_VALUE_ERROR)
+                return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            
+            result = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS)
+            return Response(result, status=status.HTTP_200_OK)
+            
+        except KeyError:
+            result = CommonUtil.return_data(msg=ResponseErrMsgConst.KEY_ERROR)
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
     
     def create(self, request, *args, **kwargs):
         """ 유저 회원가입 (컨슈머 생성)
@@ -103,9 +220,12 @@ class UserViewSet(viewsets.ModelViewSet):
         CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.CREATE, request_data=request.data, class_=self)
         
         try:
+            # 요청 제한 (DB 조회 전)
+            rate_limiter.hit('create_ip', get_client_ip(request))
+            
             # 입력 값 편집
             data = {
-                'email'             : request.data['email'].strip(),
+                'email'             : normalize_email(request.data['email']),
                 'password'          : request.data.get('password').strip() if request.data.get('password') else None,
                 'social_signup_type': int(request.data['social_signup_type']),
                 'account_type'      : AccountTypeEnum.CONSUMER.value, # 고정 값
@@ -117,11 +237,9 @@ class UserViewSet(viewsets.ModelViewSet):
                 if not data['password']:
                     raise NotNullException('password')
             
-            user = self.user_query.get_user_by_email(email=data['email'])
-            if user.exists():
-                
-                user_obj: User = user.first()
-                is_deleted = user_obj.is_deleted
+            # 중복 체크 1회 (bloom filter 음성이면 0회). serializer 의 email UniqueValidator 는 사용하지 않음
+            is_deleted = self.user_query.get_email_is_deleted(email=data['email'])
+            if is_deleted is not None:
                 
                 if is_deleted:
                     raise UserDeletedException
@@ -129,11 +247,25 @@ class UserViewSet(viewsets.ModelViewSet):
                 if not is_deleted:
                     raise UserExistsException
             
+            if data['password']:
+                data['password'] = password_manager.hash(data['password'])
+            
             # Field Level validation 및 DB 처리 (is_valid 에서 자동으로 해당 모델 필드의 유니크, 필수, 존재 여부를 체크하나
             # 리턴 포멧이 일정하지 않게 되어 커스터마이징 필요
             serializer = self.get_serializer(data=data)
             serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
+            
+            # 가입 메일은 outbox 에 같은 트랜잭션으로 기록하고 발송은 워커(run_email_worker)가 처리
+            try:
+                with transaction.atomic():
+                    self.perform_create(serializer)
+                    email_outbox_query.enqueue_sign_up(serializer.instance)
+                    
+            except IntegrityError:
+                # 중복 체크 이후 (또는 bloom filter 동기화 전) 같은 이메일로 가입된 경우. DB 유니크 제약이 최종 판단
+                if self.user_query.get_email_is_deleted(email=data['email'], use_bloom_filter=False):
+                    raise UserDeletedException
+                raise UserExistsException
             
             result = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS)
             return Response(result, status=status.HTTP_201_CREATED)
@@ -143,13 +275,13 @@ class UserViewSet(viewsets.ModelViewSet):
             result = CommonUtil.return_data(msg=ResponseErrMsgConst.KEY_ERROR)
             return Response(result, status=status.HTTP_400_BAD_REQUEST)
             
-        except UserExistsException as e:
-            result = CommonUtil.return_data(msg=str(e))
+        except (UserExistsException, UserDeletedException):
+            # 탈퇴 유저 이메일도 가입된 이메일과 같은 응답 (탈퇴 여부 노출 방지)
+            result = CommonUtil.return_data(msg=str(UserExistsException()))
             return Response(result, status=status.HTTP_400_BAD_REQUEST)
             
-        except UserDeletedException as e:
-            result = CommonUtil.return_data(msg=str(e))
-            return Response(result, status=status.HTTP_204_NO_CONTENT)
+        except RateLimitExceededException as e:
+            return self.rate_limited_response(e)
             
         except DatabaseError:
             traceback.print_exc()
@@ -172,19 +304,118 @@ class UserViewSet(viewsets.ModelViewSet):
     
     def list(self, request, *args, **kwargs):
         CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.LIST, request_data=kwargs, class_=self)
-        queryset = self.queryset
-        
-        if not queryset:
-            result = CommonUtil.return_data(msg=ResponseMsgConst.NO_CONTENT)
-            return Response(result, status=status.HTTP_200_OK)
+        # DRF 필드 처리 없이 필요한 컬럼만 values() 로 조회
+        queryset = self.get_queryset().values(*UserListProjection.VALUES_FIELDS)
         
+        # keyset 페이지네이션 (id > cursor LIMIT n). 테이블 전체를 평가하지 않도록 빈 결과는 페이지로 판단
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            if not page and not request.query_params.get(self.paginator.cursor_query_param):
+                result = CommonUtil.return_data(msg=ResponseMsgConst.NO_CONTENT)
+                return Response(result, status=status.HTTP_200_OK)
+            
+            return self.get_paginated_response([UserListProjection.from_values(row) for row in page])
+        
+        return Response([UserListProjection.from_values(row) for row in queryset], status=status.HTTP_200_OK)
+    
+    @action(detail=False, methods=['get'], url_path='export')
+    def export(self, request):
+        """ 유저 목록 NDJSON 스트리밍 export (관리 도구용, 관리자 토큰 필요)
+            - iterator(chunk_size) 로 chunk 단위 조회 (PostgreSQL 은 server-side cursor) 하여 메모리 사용량 일정
+            - 한 줄에 유저 1명의 JSON
+        """
+        CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.LIST, request_data=request.query_params, class_=self)
+        
+        queryset = self.get_queryset().order_by('id').values(*UserInfoProjection.VALUES_FIELDS)
+        
+        response = StreamingHttpResponse(self.iter_ndjson(queryset), content_type='application/x-ndjson')
+        response['Content-Disposition'] = 'attachment; filename="users.ndjson"'
+        return response
+    
+    def iter_ndjson(self, queryset):
+        for row in queryset.iterator(chunk_size=UserListConst.EXPORT_CHUNK_SIZE):
+            yield json.dumps(UserInfoProjection.from_values(row), cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+    
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        """ 유저 대량 회원가입 (컨슈머, 파트너 플랫폼 이관용, 관리자 토큰 필요)
+            request body (스트림으로 한 줄씩 처리)
+            - Content-Type: text/csv            -> header: email, password, social_signup_type
+            - Content-Type: application/x-ndjson -> 한 줄에 {"email", "password", "social_signup_type"}
+            - 1회 최대 ACCOUNT_USER_IMPORT_MAX_HTTP_ROWS 건. 넘으면 저장하지 않고 413 (대량 이관은 import_users 커맨드)
+            
+            return
+            - total, created, error_count, errors(line, email, error), elapsed, rows_per_sec
+        """
+        CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.CREATE, request_data=request.query_params, class_=self)
+        
+        data_format = UserImportConst.FORMAT_CSV if 'csv' in (request.content_type or '') else UserImportConst.FORMAT_NDJSON
+        
+        try:
+            # request.data 를 쓰지 않고 body 스트림을 한 줄씩 읽어 메모리 사용량 일정하게 유지
+            max_rows      = getattr(settings, 'ACCOUNT_USER_IMPORT_MAX_HTTP_ROWS', UserImportConst.MAX_HTTP_ROWS)
+            import_result = UserBulkImporter(max_rows=max_rows).run(request.stream or [], data_format)
+            
+            result = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS, data=import_result.to_dict())
+            return Response(result, status=status.HTTP_200_OK)
+            
+        except UserImportTooLargeException as e:
+            result = CommonUtil.return_data(msg=str(e))
+            return Response(result, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            
+        except DatabaseError:
+            traceback.print_exc()
+            result = CommonUtil.return_data(msg=ResponseErrMsgConst.DATABASE_OPERATION_ERROR)
+            return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    
+    def destroy(self, request, *args, **kwargs):
+        """ 회원 탈퇴 (본인만)
+            - Authorization: Bearer <access_token>
+            - is_deleted / deleted_at 기록, 발급된 토큰 전체 폐기, 로그인 캐시 삭제
+            - 보관 기간(ACCOUNT_ARCHIVE_RETENTION_DAYS) 이후 archive_deleted_users 가 users_archive 로 이동
+        """
+        CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.UPDATE, request_data=kwargs, class_=self)
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        try:
+            auth = JWTAuthentication().authenticate(request)
+            if auth is None:
+                raise TokenInvalidException('missing token')
+            
+            user_id = int(kwargs['pk'])
+            if auth[0].id != user_id:
+                result = CommonUtil.return_data(msg=ResponseErrMsgConst.ATTRIBUTE_VALUE_ERROR)
+                return Response(result, status=status.HTTP_403_FORBIDDEN)
+            
+            with transaction.atomic():
+                email = self.user_query.soft_delete_user(user_id=user_id, present_time=TimeUtils.get_today())
+                if email is None:
+                    raise UserNotExistsException
+                
+                token_manager.revoke_user(user_id)
+            
+            result = CommonUtil.return_data(msg=ResponseMsgConst.SUCCESS)
+            return Response(result, status=status.HTTP_200_OK)
+            
+        except TokenInvalidException as e:
+            result = CommonUtil.return_data(msg=str(e))
+            return Response(result, status=status.HTTP_401_UNAUTHORIZED)
+            
+        except AuthenticationFailed as e:
+            result = CommonUtil.return_data(msg=str(e.detail))
+            return Response(result, status=status.HTTP_401_UNAUTHORIZED)
+            
+        except (KeyError, ValueError):
+            result = CommonUtil.return_data(msg=ResponseErrMsgConst.ATTRIBUTE_VALUE_ERROR)
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+            
+        except UserNotExistsException as e:
+            result = CommonUtil.return_data(msg=str(e))
+            return Response(result, status=status.HTTP_404_NOT_FOUND)
+            
+        except DatabaseError:
+            traceback.print_exc()
+            result = CommonUtil.return_data(msg=ResponseErrMsgConst.DATABASE_OPERATION_ERROR)
+            return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
     def update(self, request, *args, **kwargs):
         CommonUtil.print_log(app_name=AppNameConst.ACCOUNT, method_name=MethodNameConst.UPDATE, request_data=request.data, class_=self)